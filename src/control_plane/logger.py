@@ -5,10 +5,10 @@ Constitutional compliance:
 - Section 8 (Auditability & Logging): Append-only, structured logging with required fields
 """
 
-import json
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from .models import StateTransition
 
@@ -55,6 +55,16 @@ class AuditLogger:
         self.log_dir = log_dir
         # Ensure log directory exists
         self.log_dir.mkdir(parents=True, exist_ok=True)
+        # Per-date file descriptors, opened with O_APPEND and reused across
+        # calls: each entry is one os.write syscall (no Python file-object
+        # layer), and the kernel guarantees appends of up to PIPE_BUF bytes
+        # land atomically even with concurrent writers
+        self._fds: Dict[str, int] = {}
+        # Timestamp -> date-string cache: strftime walks its format codes
+        # on every call, and bursts of transitions share a timestamp, so
+        # remember the last conversion
+        self._last_ts: Optional[datetime] = None
+        self._last_date = ""
 
     def log_transition(self, transition: StateTransition) -> None:
         """
@@ -68,31 +78,35 @@ class AuditLogger:
         Raises:
             IOError: If log file cannot be written
         """
-        # Determine log file based on transition timestamp
-        log_date = transition.timestamp.strftime("%Y-%m-%d")
-        log_file = self.log_dir / f"{log_date}.log"
-
-        # Build log entry with all required fields
-        # Constitutional requirement (Section 8): timestamp, action, task_id, result, approval_status
-        log_entry = {
-            "timestamp": transition.timestamp.isoformat(),
-            "action": "state_transition",
-            "transition_id": transition.transition_id,
-            "task_id": transition.task_id,
-            "from_state": transition.from_state.value,
-            "to_state": transition.to_state.value,
-            "result": "success" if transition.error is None else "failure",
-            "reason": transition.reason,
-            "actor": transition.actor,
-            "approval_status": transition.actor,  # 'system' or 'human'
-        }
-
-        # Include error if present
-        if transition.error is not None:
-            log_entry["error"] = transition.error
-
-        # Write JSON entry to log file (append mode)
-        # Constitutional requirement (Section 8): Append-only logging
-        with open(log_file, "a", encoding="utf-8") as f:
-            json.dump(log_entry, f)
-            f.write("\n")  # Newline for readability
+        # Determine log file based on transition timestamp (cached for
+        # same-timestamp bursts)
+        ts = transition.timestamp
+        if ts != self._last_ts:
+            self._last_date = ts.strftime("%Y-%m-%d")
+            self._last_ts = ts
+        log_date = self._last_date
+
+        # Write the transition's own single-pass JSON line to the
+        # persistent per-date descriptor.
+        # Constitutional requirement (Section 8): Append-only logging.
+        # O_APPEND raw write: every entry hits the file in one syscall when
+        # this call returns, with kernel-atomic append positioning.
+        fd = self._fds.get(log_date)
+        if fd is None:
+            log_file = self.log_dir / f"{log_date}.log"
+            fd = self._fds[log_date] = os.open(
+                log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+            )
+        os.write(fd, transition.to_json_bytes())
+
+    def close(self) -> None:
+        """Close all open log file descriptors."""
+        for fd in self._fds.values():
+            os.close(fd)
+        self._fds.clear()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
@@ -6,6 +6,7 @@ Constitutional compliance:
 - Section 4 (File-Driven Control Plane): WorkflowState enum defines fixed folder states
 """
 
+import json
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -13,6 +14,13 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 import yaml
 
+# libyaml's C scanner/parser is ~20x faster than the pure-Python SafeLoader;
+# fall back silently when PyYAML was built without it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class WorkflowState(Enum):
     """
@@ -31,7 +39,12 @@ class WorkflowState(Enum):
     DONE = "Done"
 
 
-@dataclass
+# Folder name -> state member, precomputed once: O(1) lookup instead of a
+# linear scan over the enum on every location check
+_FOLDER_TO_STATE = {state.value: state for state in WorkflowState}
+
+
+@dataclass(slots=True)
 class TaskFile:
     """
     Entity representing a task file on disk.
@@ -69,23 +82,26 @@ class TaskFile:
         if not file_path.exists():
             raise FileNotFoundError(f"Task file not found: {file_path}")
 
-        # Read file content
-        raw_content = file_path.read_text(encoding="utf-8")
+        # Read raw bytes and split on the frontmatter delimiters before
+        # decoding: libyaml takes the frontmatter as UTF-8 bytes directly,
+        # so only the markdown body needs a str decode, and the whole-file
+        # three-way str split goes away
+        raw_content = file_path.read_bytes()
 
         # Parse YAML frontmatter
-        if not raw_content.startswith("---"):
+        if not raw_content.startswith(b"---"):
             raise ValueError(f"Task file missing YAML frontmatter: {file_path}")
 
-        # Split frontmatter and content
-        parts = raw_content.split("---", 2)
-        if len(parts) < 3:
+        # Split frontmatter and content at the closing delimiter
+        end = raw_content.find(b"---", 3)
+        if end == -1:
             raise ValueError(f"Invalid YAML frontmatter format: {file_path}")
 
-        frontmatter_text = parts[1]
-        markdown_content = parts[2].strip()
+        frontmatter_text = raw_content[3:end]
+        markdown_content = raw_content[end + 3 :].decode("utf-8").strip()
 
-        # Parse YAML
-        frontmatter = yaml.safe_load(frontmatter_text)
+        # Parse YAML (C-backed loader when available)
+        frontmatter = yaml.load(frontmatter_text, Loader=_YamlLoader)
         if not frontmatter:
             raise ValueError(f"Empty YAML frontmatter: {file_path}")
 
@@ -98,10 +114,10 @@ class TaskFile:
         if not state_str:
             raise ValueError(f"Missing 'state' field in frontmatter: {file_path}")
 
-        # Convert state string to WorkflowState enum
-        try:
-            state = WorkflowState(state_str)
-        except ValueError:
+        # Convert state string to WorkflowState enum via the precomputed
+        # lookup table - skips the enum's _missing_/ValueError machinery
+        state = _FOLDER_TO_STATE.get(state_str)
+        if state is None:
             raise ValueError(f"Invalid state '{state_str}' in frontmatter: {file_path}")
 
         priority = frontmatter.get("priority", "P3")  # Default priority
@@ -155,18 +171,18 @@ class TaskFile:
         # Ensure parent directory exists
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Build YAML frontmatter
-        frontmatter = {
-            "id": self.id,
-            "state": self.state.value,  # Use enum value (e.g., "Inbox")
-            "priority": self.priority,
-            "created_at": self.created_at.isoformat(),
-            "modified_at": self.modified_at.isoformat(),
-            "metadata": self.metadata,
-        }
-
-        # Serialize frontmatter to YAML
-        yaml_content = yaml.dump(frontmatter, default_flow_style=False, sort_keys=False)
+        # Build YAML frontmatter by string formatting: the schema is fixed
+        # and every field is a simple scalar, so the full YAML emitter is
+        # overkill. Metadata goes through json.dumps - JSON is a YAML
+        # subset, so nested dicts/lists parse back without the emitter.
+        yaml_content = (
+            f"id: {self.id}\n"
+            f"state: {self.state.value}\n"
+            f"priority: {self.priority}\n"
+            f"created_at: {self.created_at.isoformat()}\n"
+            f"modified_at: {self.modified_at.isoformat()}\n"
+            f"metadata: {json.dumps(self.metadata)}\n"
+        )
 
         # Build complete file content
         file_content = f"---\n{yaml_content}---\n\n{self.content}\n"
@@ -190,10 +206,10 @@ class TaskFile:
         # Get parent folder name
         folder_name = self.file_path.parent.name
 
-        # Find matching WorkflowState by folder value
-        for state in WorkflowState:
-            if state.value == folder_name:
-                return state
+        # Precomputed folder -> state lookup
+        state = _FOLDER_TO_STATE.get(folder_name)
+        if state is not None:
+            return state
 
         # If no match found, raise error
         raise ValueError(
@@ -226,7 +242,7 @@ class TaskFile:
         return self
 
 
-@dataclass
+@dataclass(slots=True)
 class StateTransition:
     """
     Entity representing a state transition event.
@@ -243,3 +259,35 @@ class StateTransition:
     actor: str  # 'system' or 'human'
     logged: bool
     error: Optional[str] = None
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize this transition straight to its JSON log line.
+
+        Constitutional requirement (Section 8): Structured logging with
+        timestamp, action type, triggering file, result, approval status.
+
+        Writes a pre-templated byte string in one pass instead of building
+        an intermediate dict and handing it to a JSON encoder. Only the
+        free-text fields (reason, error) go through json.dumps for
+        escaping; ids, enum values and ISO timestamps never contain
+        characters that need it.
+
+        Returns:
+            Newline-terminated JSON line as UTF-8 bytes
+        """
+        line = (
+            f'{{"timestamp": "{self.timestamp.isoformat()}", '
+            f'"action": "state_transition", '
+            f'"transition_id": "{self.transition_id}", '
+            f'"task_id": "{self.task_id}", '
+            f'"from_state": "{self.from_state.value}", '
+            f'"to_state": "{self.to_state.value}", '
+            f'"result": "{"success" if self.error is None else "failure"}", '
+            f'"reason": {json.dumps(self.reason)}, '
+            f'"actor": "{self.actor}", '
+            f'"approval_status": "{self.actor}"'
+        )
+        if self.error is not None:
+            line += f', "error": {json.dumps(self.error)}'
+        return (line + "}\n").encode("utf-8")
@@ -9,7 +9,7 @@ Constitutional compliance:
 
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import ClassVar, Optional
 import time
 import uuid
 
@@ -28,16 +28,44 @@ class StateMachine:
     Constitutional requirement (Section 13): Done is a terminal state.
     """
 
+    # Valid transitions as a class-level frozenset of (from, to) pairs.
+    # The workflow is fixed, so the table is built once at class-definition
+    # time; instances share it and validate_transition is a single hash
+    # lookup. Done is terminal (Section 13), so it has no outbound pairs.
+    _VALID: ClassVar[frozenset] = frozenset(
+        {
+            # Inbox: Can only move to Needs_Action (initial processing)
+            (WorkflowState.INBOX, WorkflowState.NEEDS_ACTION),
+            # Needs_Action: Can move to Plans (start planning)
+            (WorkflowState.NEEDS_ACTION, WorkflowState.PLANS),
+            # Plans: Can move to Pending_Approval (ready for review)
+            #        or back to Needs_Action (clarifications needed)
+            (WorkflowState.PLANS, WorkflowState.PENDING_APPROVAL),
+            (WorkflowState.PLANS, WorkflowState.NEEDS_ACTION),
+            # Pending_Approval: Can be Approved or Rejected (human decision)
+            # Constitutional requirement (Section 7): Human approval required
+            (WorkflowState.PENDING_APPROVAL, WorkflowState.APPROVED),
+            (WorkflowState.PENDING_APPROVAL, WorkflowState.REJECTED),
+            # Approved: Can move to Done (execution succeeded)
+            #           or to Rejected (execution failed)
+            (WorkflowState.APPROVED, WorkflowState.DONE),
+            (WorkflowState.APPROVED, WorkflowState.REJECTED),
+            # Rejected: Can move back to Inbox (retry with revised approach)
+            (WorkflowState.REJECTED, WorkflowState.INBOX),
+        }
+    )
+
     def __init__(self, root_dir: Optional[Path] = None, log_dir: Optional[Path] = None):
         """
-        Initialize state machine with transition matrix.
+        Initialize state machine.
 
         Args:
             root_dir: Root directory containing workflow folders (Inbox, Needs_Action, etc.).
                      If None, defaults to current working directory.
             log_dir: Directory for audit logs. If None, defaults to root_dir/Logs.
 
-        The transition matrix defines all valid state transitions.
+        The transition table itself lives on the class (``_VALID``), so
+        construction only wires up paths and the audit logger.
         """
         # Store root directory for file operations
         self.root_dir = root_dir if root_dir is not None else Path.cwd()
@@ -47,42 +75,6 @@ class StateMachine:
         if log_dir is None:
             log_dir = self.root_dir / "Logs"
         self.audit_logger = AuditLogger(log_dir=log_dir)
-        # Define valid transitions as a dictionary: from_state -> set of valid to_states
-        self._transition_matrix: Dict[WorkflowState, Set[WorkflowState]] = {
-            # Inbox: Can only move to Needs_Action (initial processing)
-            WorkflowState.INBOX: {
-                WorkflowState.NEEDS_ACTION,
-            },
-            # Needs_Action: Can move to Plans (start planning)
-            WorkflowState.NEEDS_ACTION: {
-                WorkflowState.PLANS,
-            },
-            # Plans: Can move to Pending_Approval (ready for review)
-            #        or back to Needs_Action (clarifications needed)
-            WorkflowState.PLANS: {
-                WorkflowState.PENDING_APPROVAL,
-                WorkflowState.NEEDS_ACTION,
-            },
-            # Pending_Approval: Can be Approved or Rejected (human decision)
-            # Constitutional requirement (Section 7): Human approval required
-            WorkflowState.PENDING_APPROVAL: {
-                WorkflowState.APPROVED,
-                WorkflowState.REJECTED,
-            },
-            # Approved: Can move to Done (execution succeeded)
-            #           or to Rejected (execution failed)
-            WorkflowState.APPROVED: {
-                WorkflowState.DONE,
-                WorkflowState.REJECTED,
-            },
-            # Rejected: Can move back to Inbox (retry with revised approach)
-            WorkflowState.REJECTED: {
-                WorkflowState.INBOX,
-            },
-            # Done: Terminal state - no transitions allowed
-            # Constitutional requirement (Section 13): Done is complete
-            WorkflowState.DONE: set(),
-        }
 
     def validate_transition(
         self, from_state: WorkflowState, to_state: WorkflowState
@@ -100,11 +92,8 @@ class StateMachine:
         Returns:
             True if transition is valid, False otherwise
         """
-        # Get valid target states for the current state
-        valid_targets = self._transition_matrix.get(from_state, set())
-
-        # Check if target state is in the set of valid targets
-        return to_state in valid_targets
+        # Single hash lookup against the shared class-level table
+        return (from_state, to_state) in self._VALID
 
     def transition(
         self, task: TaskFile, to_state: WorkflowState, reason: str, actor: str
@@ -27,7 +27,7 @@ from typing import Optional
 from .config import from_env, from_file
 from .logger_service import LoggerService
 from .models import LoggerConfig, LogLevel
-from .trace import bind_trace_id, get_trace_id, new_trace_id
+from .trace import bind_trace_id, get_trace_id, new_trace_id, new_trace_ids
 
 # Global logger instance (singleton pattern)
 _global_logger: Optional[LoggerService] = None
@@ -140,6 +140,7 @@ __all__ = [
     "get_logger",
     # Trace ID functions
     "new_trace_id",
+    "new_trace_ids",
     "get_trace_id",
     "bind_trace_id",
     # Models
@@ -7,13 +7,156 @@ Constitutional compliance: Section 2 (logs written to disk as source of truth).
 """
 
 import asyncio
+import collections
+import json
+import mmap
+import os
 import sys
-from datetime import datetime, timezone
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from .models import LogEntry
 
+# Optional orjson serializer: 3-10x faster than stdlib json and emits
+# UTF-8 bytes directly, skipping the str -> bytes encode per batch.
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional io_uring support (Linux only). Batching a flush through a single
+# io_uring_enter() amortizes syscall cost across the whole buffer.
+try:
+    import liburing
+
+    LIBURING_AVAILABLE = sys.platform == "linux"
+except ImportError:
+    LIBURING_AVAILABLE = False
+
+
+# Max iovec entries per writev() call (IOV_MAX); batches beyond this are
+# split across calls
+try:
+    _IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+
+
+if ORJSON_AVAILABLE:
+
+    def dumps_bytes(data: dict) -> bytes:
+        """Serialize a plain dict to UTF-8 JSON bytes (orjson)."""
+        return orjson.dumps(data)
+
+else:
+
+    def dumps_bytes(data: dict) -> bytes:
+        """Serialize a plain dict to UTF-8 JSON bytes (stdlib fallback)."""
+        return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+class BufferedFileAppender:
+    """
+    Synchronous log appender with a page-sized userspace buffer.
+
+    For sync mode, a buffered appender often beats async handoff: the
+    write is a memcpy into BufferedWriter's 64KiB buffer under one lock,
+    with no queue or event loop involved. A daemon timer caps flush
+    latency at flush_interval_s and parks itself while the appender is
+    idle; files rotate daily like the async writer's.
+    """
+
+    def __init__(
+        self,
+        log_dir: Path,
+        buffer_bytes: int = 65536,
+        flush_interval_s: float = 0.5,
+    ):
+        """
+        Initialize BufferedFileAppender.
+
+        Args:
+            log_dir: Directory for log files
+            buffer_bytes: Userspace buffer size (default one 64KiB page run)
+            flush_interval_s: Max seconds a record sits in the buffer
+        """
+        self.log_dir = log_dir
+        self.buffer_bytes = buffer_bytes
+        self.flush_interval_s = flush_interval_s
+        self._fh = None
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._dirty = False
+        self._current_date: Optional[str] = None
+
+    def write(self, line: bytes) -> None:
+        """
+        Append one NDJSON line (buffered; no syscall on most calls).
+
+        Args:
+            line: Serialized record, newline-terminated
+        """
+        with self._lock:
+            self._ensure_file()
+            self._fh.write(line)
+            self._dirty = True
+            if self._timer is None:
+                self._arm_timer()
+
+    def close(self) -> None:
+        """Flush, fsync, and close the appender (fsync only here, not per line)."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._fh is not None:
+                try:
+                    self._fh.flush()
+                    os.fsync(self._fh.fileno())
+                except OSError:
+                    pass
+                self._fh.close()
+                self._fh = None
+                self._current_date = None
+
+    def _ensure_file(self) -> None:
+        """Open (or rotate to) today's log file. Caller holds the lock."""
+        current_date = time.strftime("%Y-%m-%d", time.gmtime())
+        if self._fh is None or current_date != self._current_date:
+            if self._fh is not None:
+                self._fh.close()
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            self._current_date = current_date
+            self._fh = open(
+                self.log_dir / f"{current_date}.log", "ab", buffering=self.buffer_bytes
+            )
+
+    def _arm_timer(self) -> None:
+        """Schedule the latency-cap flush. Caller holds the lock."""
+        timer = threading.Timer(self.flush_interval_s, self._on_timer)
+        timer.daemon = True
+        self._timer = timer
+        timer.start()
+
+    def _on_timer(self) -> None:
+        """Flush if anything landed since the last tick; park when idle."""
+        with self._lock:
+            if self._dirty and self._fh is not None:
+                try:
+                    self._fh.flush()
+                except OSError:
+                    pass
+                self._dirty = False
+                self._arm_timer()
+            else:
+                # Idle - stop rescheduling; the next write() re-arms
+                self._timer = None
+
 
 class AsyncWriter:
     """
@@ -27,6 +170,11 @@ class AsyncWriter:
     - Graceful shutdown (flush pending logs)
     - Error handling (fallback to stderr)
 
+    No pathlib work happens per record or per flush: the raw fd is
+    opened once per rotation, size checks go through os.fstat on that
+    cached fd, and the Path for a log file is only built at the daily
+    rotation boundary.
+
     Constitutional compliance:
     - Section 2: Logs written to disk as source of truth
     - Section 9: Errors never hidden (stderr fallback)
@@ -35,7 +183,7 @@ class AsyncWriter:
         >>> async def main():
         ...     writer = AsyncWriter(log_dir=Path("./Logs"))
         ...     await writer.start()
-        ...     await writer.write(log_entry)
+        ...     writer.write(log_entry)
         ...     await writer.stop()
     """
 
@@ -45,6 +193,12 @@ class AsyncWriter:
         buffer_size: int = 1000,
         flush_interval_s: float = 1.0,
         max_file_size_mb: int = 100,
+        use_uring: bool = False,
+        use_mmap: bool = False,
+        overflow_policy: str = "drop_newest",
+        serialize_in_executor: bool = False,
+        encoder: Optional[Callable[[object], bytes]] = None,
+        sharded: bool = False,
     ):
         """
         Initialize AsyncWriter.
@@ -54,11 +208,53 @@ class AsyncWriter:
             buffer_size: Max entries in buffer before forced flush
             flush_interval_s: Auto-flush interval in seconds
             max_file_size_mb: Max file size before rotation (MB)
+            use_uring: Batch flush writes through io_uring (Linux only,
+                requires the optional liburing package; silently falls
+                back to regular writes when unavailable)
+            use_mmap: Persist flushes through a memory-mapped region of
+                max_file_size_mb instead of write() syscalls; the kernel
+                handles page writeback. The file is truncated to its real
+                size on rotation and stop.
+            overflow_policy: What to do when the queue is full:
+                "drop_newest" (default) drops the incoming entry to stderr,
+                "drop_oldest" evicts the oldest queued entry to make room
+            serialize_in_executor: Offload per-batch JSON encoding to a
+                small thread pool so serialization of one batch overlaps
+                I/O for the previous one (off by default for
+                single-thread determinism)
+            encoder: Callable turning a queued record into UTF-8 JSON
+                bytes (no trailing newline). Defaults to LogEntry.to_dict()
+                serialization; LoggerService passes a callback that
+                formats its deferred binary records here, off the
+                logging hot path
+            sharded: Replace the single asyncio.Queue with one deque per
+                CPU, sharded by producer thread id. deque.append is
+                atomic under CPython, so multi-threaded producers never
+                contend on a lock (and scale on free-threaded builds);
+                the writer drains shards round-robin. Off by default -
+                the single queue is simpler for one-thread async apps
         """
         self.log_dir = log_dir
         self.buffer_size = buffer_size
         self.flush_interval_s = flush_interval_s
         self.max_file_size_bytes = max_file_size_mb * 1024 * 1024
+        self.use_uring = use_uring and LIBURING_AVAILABLE
+        self.use_mmap = use_mmap
+        self.overflow_policy = overflow_policy
+        self.serialize_in_executor = serialize_in_executor
+        self._encoder = encoder or self._entry_to_json
+        self.sharded = sharded
+        self._shards: Optional[list[collections.deque]] = None
+        self._shard_limit = 0
+        self._exec: Optional[ThreadPoolExecutor] = None
+        self._ring = None
+        self._mm: Optional[mmap.mmap] = None
+        self._mm_fd: Optional[int] = None
+        self._mm_pos = 0
+
+        # Set each time a non-empty buffer reaches disk; tests and callers
+        # can await this instead of sleeping past the flush interval
+        self.flushed = asyncio.Event()
 
         # Async queue for log entries (bounded)
         self._queue: Optional[asyncio.Queue] = None
@@ -66,7 +262,7 @@ class AsyncWriter:
         self._writer_task: Optional[asyncio.Task] = None
         self._running = False
         self._current_file: Optional[Path] = None
-        self._current_file_handle = None
+        self._fd: Optional[int] = None
         self._current_date: Optional[str] = None
 
     async def start(self) -> None:
@@ -83,8 +279,29 @@ class AsyncWriter:
         # Create log directory
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
-        # Create queue
-        self._queue = asyncio.Queue(maxsize=self.buffer_size * 2)
+        # Create queue (or per-thread shards)
+        if self.sharded:
+            shard_count = os.cpu_count() or 4
+            self._shards = [collections.deque() for _ in range(shard_count)]
+            self._shard_limit = max(1, (self.buffer_size * 2) // shard_count)
+        else:
+            self._queue = asyncio.Queue(maxsize=self.buffer_size * 2)
+
+        # Thread pool for offloaded batch serialization
+        if self.serialize_in_executor and self._exec is None:
+            self._exec = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="log-serialize"
+            )
+
+        # Allocate io_uring submission/completion queues if requested
+        if self.use_uring and self._ring is None:
+            try:
+                self._ring = liburing.io_uring()
+                liburing.io_uring_queue_init(256, self._ring, 0)
+            except Exception as e:
+                self._write_error_to_stderr(f"io_uring init failed: {e}")
+                self._ring = None
+                self.use_uring = False
 
         # Start background writer
         self._running = True
@@ -108,12 +325,10 @@ class AsyncWriter:
         if not self._running:
             return
 
-        # Stop accepting new entries
+        # Stop accepting new entries (write() is synchronous, so anything
+        # already written is either in the queue or the buffer by now)
         self._running = False
 
-        # Give pending write() tasks a chance to execute and put entries in queue
-        await asyncio.sleep(0.05)
-
         # Cancel background task (so it stops taking items from queue)
         if self._writer_task is not None:
             self._writer_task.cancel()
@@ -122,29 +337,59 @@ class AsyncWriter:
             except asyncio.CancelledError:
                 pass
 
-        # Drain remaining items from queue to buffer
-        if self._queue is not None:
-            while not self._queue.empty():
-                try:
-                    entry = self._queue.get_nowait()
-                    self._buffer.append(entry)
-                    self._queue.task_done()
-                except Exception:
-                    break
+        # Drain remaining items from queue/shards to buffer
+        self._drain_to_buffer()
 
         # Flush buffer
         await self._flush()
 
-        # Close file handle
-        if self._current_file_handle is not None:
-            self._current_file_handle.close()
-            self._current_file_handle = None
+        # Close file descriptor
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+        # Close memory map (truncates the file to its real size)
+        self._close_mmap()
+
+        # Shut down the serialization pool
+        if self._exec is not None:
+            self._exec.shutdown(wait=True)
+            self._exec = None
 
-    async def write(self, entry: LogEntry) -> None:
+        # Tear down io_uring queues
+        if self._ring is not None:
+            try:
+                liburing.io_uring_queue_exit(self._ring)
+            except Exception:
+                pass
+            self._ring = None
+
+    def set_log_dir(self, log_dir: Path) -> None:
+        """
+        Redirect output to a new directory (takes effect on next flush).
+
+        Closes the current file so the next flush reopens under the new
+        directory. Lets a long-lived writer be reused across consumers
+        (e.g. test cases) without a stop/start cycle.
+
+        Args:
+            log_dir: New directory for log files (created if missing)
         """
-        Write a log entry (async, non-blocking).
+        self.log_dir = log_dir
+        log_dir.mkdir(parents=True, exist_ok=True)
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        self._close_mmap()
+        self._current_date = None
+        self._current_file = None
+
+    def write(self, entry: LogEntry) -> None:
+        """
+        Write a log entry (synchronous, non-blocking).
 
-        Performance: < 5μs overhead (queue put operation).
+        Performance: < 5μs overhead (a plain put_nowait - no coroutine
+        frame, no event-loop scheduling point).
 
         Args:
             entry: LogEntry to write
@@ -153,18 +398,52 @@ class AsyncWriter:
             RuntimeError: If writer not started
 
         Example:
-            >>> await writer.write(log_entry)
+            >>> writer.write(log_entry)
         """
+        # Sharded mode: lock-free append to this thread's deque
+        if self._shards is not None:
+            shard = self._shards[threading.get_ident() % len(self._shards)]
+            if len(shard) >= self._shard_limit:
+                if self.overflow_policy == "drop_oldest":
+                    try:
+                        dropped = shard.popleft()
+                        self._write_to_stderr(dropped, "Shard full - dropped oldest")
+                    except IndexError:
+                        pass
+                else:
+                    self._write_to_stderr(entry, "Shard full")
+                    return
+            shard.append(entry)
+            return
+
         # Only check if queue exists - allow writes during graceful shutdown
         if self._queue is None:
             raise RuntimeError("AsyncWriter not started. Call start() first.")
 
         try:
-            # Non-blocking put with timeout
-            await asyncio.wait_for(self._queue.put(entry), timeout=0.01)  # 10ms timeout
-        except asyncio.TimeoutError:
-            # Queue full - fallback to stderr
-            self._write_to_stderr(entry, "Queue full")
+            self._queue.put_nowait(entry)
+        except asyncio.QueueFull:
+            self._on_overflow(entry)
+
+    def _on_overflow(self, entry: LogEntry) -> None:
+        """
+        Apply the configured overflow policy when the queue is full.
+
+        drop_oldest evicts the oldest queued entry to make room for the
+        new one; drop_newest (default) sends the incoming entry to stderr.
+        Either way the dropped entry is surfaced on stderr (Section 9:
+        errors never hidden).
+        """
+        if self.overflow_policy == "drop_oldest":
+            try:
+                dropped = self._queue.get_nowait()
+                self._queue.task_done()
+                self._queue.put_nowait(entry)
+                self._write_to_stderr(dropped, "Queue full - dropped oldest")
+                return
+            except (asyncio.QueueEmpty, asyncio.QueueFull):
+                pass
+        self._write_to_stderr(entry, "Queue full")
 
     async def flush(self) -> None:
         """
@@ -173,11 +452,23 @@ class AsyncWriter:
         Example:
             >>> await writer.flush()
         """
-        # Give pending write() tasks a chance to execute
-        await asyncio.sleep(0.01)
+        # Drain queue/shards to buffer first
+        self._drain_to_buffer()
+
+        await self._flush()
 
-        # Drain queue to buffer first
-        if self._queue is not None:
+    def _drain_to_buffer(self) -> None:
+        """Move everything queued (single queue or shards) into the buffer."""
+        if self._shards is not None:
+            # Round-robin over producer shards; popleft is atomic, so no
+            # lock is needed against concurrent appends
+            for shard in self._shards:
+                while True:
+                    try:
+                        self._buffer.append(shard.popleft())
+                    except IndexError:
+                        break
+        elif self._queue is not None:
             while not self._queue.empty():
                 try:
                     entry = self._queue.get_nowait()
@@ -186,8 +477,6 @@ class AsyncWriter:
                 except Exception:
                     break
 
-        await self._flush()
-
     async def _writer_loop(self) -> None:
         """
         Background writer loop.
@@ -201,16 +490,22 @@ class AsyncWriter:
 
         while self._running:
             try:
-                # Wait for entry with timeout (for periodic flush)
-                try:
-                    entry = await asyncio.wait_for(
-                        self._queue.get(), timeout=self.flush_interval_s
-                    )
-                    self._buffer.append(entry)
-                    self._queue.task_done()
-                except asyncio.TimeoutError:
-                    # Timeout - check if flush needed
-                    pass
+                if self._shards is not None:
+                    # Shards have no awaitable get; poll on a short tick
+                    # (bounded drain latency) and sweep them round-robin
+                    await asyncio.sleep(min(self.flush_interval_s, 0.05))
+                    self._drain_to_buffer()
+                else:
+                    # Wait for entry with timeout (for periodic flush)
+                    try:
+                        entry = await asyncio.wait_for(
+                            self._queue.get(), timeout=self.flush_interval_s
+                        )
+                        self._buffer.append(entry)
+                        self._queue.task_done()
+                    except asyncio.TimeoutError:
+                        # Timeout - check if flush needed
+                        pass
 
                 current_time = asyncio.get_event_loop().time()
 
@@ -246,21 +541,34 @@ class AsyncWriter:
             # Check if rotation needed
             await self._rotate_if_needed()
 
-            # Write entries as NDJSON
-            for entry in self._buffer:
-                try:
-                    json_line = self._entry_to_json(entry)
-                    self._current_file_handle.write(json_line + "\n")
-                except Exception as e:
-                    # Per-entry error - log to stderr but continue
-                    self._write_to_stderr(entry, f"Serialization error: {e}")
-
-            # Flush file handle
-            self._current_file_handle.flush()
+            # Serialize entries as NDJSON lines, optionally in the pool so
+            # encoding overlaps I/O still in flight for the previous batch
+            if self._exec is not None:
+                loop = asyncio.get_running_loop()
+                lines = await loop.run_in_executor(
+                    self._exec, self._encode_batch, self._buffer[:]
+                )
+            else:
+                lines = self._encode_batch(self._buffer)
+
+            if self.use_mmap and self._mm is not None:
+                # Copy the batch straight into the mapped page cache
+                self._flush_mmap(lines)
+            elif self.use_uring and self._ring is not None:
+                # Submit the whole batch with a single io_uring_enter()
+                self._flush_uring(lines)
+            else:
+                # Scatter-gather write of the pre-encoded batch: one
+                # syscall per IOV_MAX lines, no b"".join copy of the blob
+                for start in range(0, len(lines), _IOV_MAX):
+                    os.writev(self._fd, lines[start : start + _IOV_MAX])
 
             # Clear buffer
             self._buffer.clear()
 
+            # Signal completion for anyone awaiting a flush
+            self.flushed.set()
+
         except Exception as e:
             # Critical error - write all buffered entries to stderr
             self._write_error_to_stderr(f"Flush error: {e}")
@@ -276,99 +584,163 @@ class AsyncWriter:
         1. Date changed (new day)
         2. File size exceeds max_file_size_bytes
         """
-        current_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        # time.strftime on a struct_time is cheaper than datetime.now().strftime
+        current_date = time.strftime("%Y-%m-%d", time.gmtime())
 
         # Check if rotation needed
         needs_rotation = False
 
-        # Daily rotation
+        # Daily rotation (cached date string; recomputed only per flush,
+        # file reopened only at the UTC midnight boundary)
         if self._current_date != current_date:
             needs_rotation = True
 
-        # Size rotation
-        if self._current_file is not None and self._current_file.exists():
-            if self._current_file.stat().st_size >= self.max_file_size_bytes:
+        # Size rotation - fstat on the cached fd avoids the per-flush
+        # Path.exists() + Path.stat() pair
+        if self._mm is not None:
+            if self._mm_pos >= self.max_file_size_bytes:
+                needs_rotation = True
+        elif self._fd is not None:
+            try:
+                if os.fstat(self._fd).st_size >= self.max_file_size_bytes:
+                    needs_rotation = True
+            except OSError:
                 needs_rotation = True
 
         # Perform rotation
         if needs_rotation:
             # Close current file
-            if self._current_file_handle is not None:
-                self._current_file_handle.close()
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+            self._close_mmap()
 
             # Open new file
             self._current_date = current_date
             self._current_file = self.log_dir / f"{current_date}.log"
 
             try:
-                self._current_file_handle = open(
-                    self._current_file,
-                    mode="a",  # Append mode
-                    encoding="utf-8",
-                    buffering=8192,  # 8KB buffer
-                )
+                if self.use_mmap:
+                    self._open_mmap(self._current_file)
+                else:
+                    # O_APPEND keeps concurrent appenders atomic per write;
+                    # O_CLOEXEC keeps the fd out of spawned subprocesses
+                    self._fd = os.open(
+                        str(self._current_file),
+                        os.O_WRONLY | os.O_CREAT | os.O_APPEND | os.O_CLOEXEC,
+                        0o644,
+                    )
             except Exception as e:
                 self._write_error_to_stderr(f"Failed to open log file: {e}")
                 # Fallback to stderr for all writes
-                self._current_file_handle = None
+                self._fd = None
+                self._mm = None
 
-    def _entry_to_json(self, entry: LogEntry) -> str:
+    def _open_mmap(self, path: Path) -> None:
         """
-        Convert LogEntry to JSON string (NDJSON format).
+        Map a fixed-size writable region over the log file.
+
+        The file is grown to max_file_size_bytes for the mapping; the
+        append position resumes at the file's prior real size.
+        """
+        fd = os.open(str(path), os.O_RDWR | os.O_CREAT, 0o644)
+        existing_size = os.fstat(fd).st_size
+        os.ftruncate(fd, self.max_file_size_bytes)
+        self._mm = mmap.mmap(fd, self.max_file_size_bytes)
+        self._mm_fd = fd
+        self._mm_pos = existing_size
+
+    def _close_mmap(self) -> None:
+        """Sync and unmap the log file, truncating it to its real size."""
+        if self._mm is None:
+            return
+        try:
+            self._mm.flush()
+            self._mm.close()
+            os.ftruncate(self._mm_fd, self._mm_pos)
+            os.close(self._mm_fd)
+        except Exception as e:
+            self._write_error_to_stderr(f"mmap close error: {e}")
+        finally:
+            self._mm = None
+            self._mm_fd = None
+            self._mm_pos = 0
+
+    def _flush_mmap(self, lines: list[str]) -> None:
+        """
+        Write a batch of NDJSON lines through the memory map.
+
+        Bytes land directly in the page cache (no write() syscall); the
+        kernel writes pages back asynchronously.
+        """
+        if not lines:
+            return
+
+        blob = b"".join(lines)
+        end = self._mm_pos + len(blob)
+        if end > len(self._mm):
+            # Batch overruns the mapped region - grow the file and remap
+            os.ftruncate(self._mm_fd, end)
+            self._mm.resize(end)
+        self._mm[self._mm_pos : end] = blob
+        self._mm_pos = end
+
+    def _flush_uring(self, lines: list[bytes]) -> None:
+        """
+        Write a batch of NDJSON lines via io_uring.
+
+        Preps one write SQE per line at monotonically increasing offsets,
+        submits them all with a single io_uring_enter(), then reaps the
+        completions. Amortizes syscall entry cost across the flush batch.
+
+        Args:
+            lines: Serialized NDJSON lines (newline-terminated)
+        """
+        if not lines:
+            return
+
+        fd = self._fd
+        offset = os.fstat(fd).st_size
+
+        for payload in lines:
+            sqe = liburing.io_uring_get_sqe(self._ring)
+            liburing.io_uring_prep_write(sqe, fd, payload, len(payload), offset)
+            offset += len(payload)
+
+        liburing.io_uring_submit(self._ring)
+
+        cqe = liburing.io_uring_cqe()
+        for _ in lines:
+            liburing.io_uring_wait_cqe(self._ring, cqe)
+            liburing.io_uring_cqe_seen(self._ring, cqe)
+
+    def _encode_batch(self, entries: list[LogEntry]) -> list[bytes]:
+        """
+        Serialize a batch of entries to NDJSON lines.
+
+        Per-entry serialization errors go to stderr without aborting the
+        rest of the batch.
+        """
+        lines = []
+        for entry in entries:
+            try:
+                lines.append(self._encoder(entry) + b"\n")
+            except Exception as e:
+                # Per-entry error - log to stderr but continue
+                self._write_to_stderr(entry, f"Serialization error: {e}")
+        return lines
+
+    def _entry_to_json(self, entry: LogEntry) -> bytes:
+        """
+        Convert LogEntry to UTF-8 JSON bytes (NDJSON format).
 
         Args:
             entry: LogEntry to serialize
 
         Returns:
-            JSON string (single line, no newline)
-        """
-        import json
-
-        # Convert LogEntry to dict
-        data = {
-            "trace_id": entry.trace_id,
-            "timestamp": entry.timestamp.isoformat(),
-            "level": entry.level.name,
-            "module": entry.module,
-            "message": entry.message,
-        }
-
-        # Add optional fields
-        if entry.function is not None:
-            data["function"] = entry.function
-        if entry.line_number is not None:
-            data["line_number"] = entry.line_number
-        if entry.context is not None:
-            data["context"] = entry.context
-        if entry.exception is not None:
-            data["exception"] = self._exception_to_dict(entry.exception)
-        if entry.duration_ms is not None:
-            data["duration_ms"] = entry.duration_ms
-        if entry.tags:
-            data["tags"] = entry.tags
-
-        return json.dumps(data, ensure_ascii=False)
-
-    def _exception_to_dict(self, exc: "ExceptionInfo") -> dict:
-        """Convert ExceptionInfo to dict for JSON serialization."""
-        data = {
-            "type": exc.type,
-            "message": exc.message,
-            "stack_trace": [
-                {
-                    "file": frame.file,
-                    "line": frame.line,
-                    "function": frame.function,
-                    **({"code": frame.code} if frame.code else {}),
-                }
-                for frame in exc.stack_trace
-            ],
-        }
-
-        if exc.cause is not None:
-            data["cause"] = self._exception_to_dict(exc.cause)
-
-        return data
+            JSON bytes (single line, no newline)
+        """
+        return dumps_bytes(entry.to_dict())
 
     def _write_to_stderr(self, entry: LogEntry, reason: str) -> None:
         """
@@ -381,12 +753,13 @@ class AsyncWriter:
             reason: Reason for fallback
         """
         try:
-            json_line = self._entry_to_json(entry)
+            json_line = self._encoder(entry).decode("utf-8")
             sys.stderr.write(f"[AsyncWriter Fallback: {reason}] {json_line}\n")
             sys.stderr.flush()
         except Exception:
             # Last resort - write minimal info
-            sys.stderr.write(f"[AsyncWriter Error: {reason}] {entry.message}\n")
+            message = getattr(entry, "message", entry)
+            sys.stderr.write(f"[AsyncWriter Error: {reason}] {message}\n")
             sys.stderr.flush()
 
     def _write_error_to_stderr(self, message: str) -> None:
@@ -11,8 +11,67 @@ from typing import Optional
 
 import yaml
 
+# libyaml's C scanner/parser is ~20x faster than the pure-Python SafeLoader;
+# fall back silently when PyYAML was built without it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from .models import LoggerConfig, LogLevel
 
+# Case-insensitive level-name lookup: one hash probe, no exception path
+_LEVEL_MAP = {name.casefold(): level for name, level in LogLevel.__members__.items()}
+
+_MISSING = object()
+
+# Nested-key flattening map for from_file: (path in the YAML tree, config
+# field). One pass over this table replaces the per-section dict.get chains;
+# nested sections win over their flat equivalents.
+_FLATTENERS = (
+    (("async_writer", "buffer_size"), "buffer_size"),
+    (("async_writer", "flush_interval_seconds"), "flush_interval_s"),
+    (("secret_redaction", "patterns"), "secret_patterns"),
+    (("secret_redaction", "redaction_text"), "redaction_text"),
+    (("retention", "max_log_age_days"), "retention_days"),
+    (("retention", "max_archive_size_mb"), "max_file_size_mb"),
+    (("retention", "compression"), "_compression"),
+)
+
+# Truthy values accepted for boolean environment variables
+_TRUE_VALUES = frozenset({"true", "1", "yes"})
+
+
+def _safe_bool(value: str) -> bool:
+    """Parse a boolean env value; unknown values are False."""
+    return value.lower() in _TRUE_VALUES
+
+
+def _parse_with_default(parser, default):
+    """Build a parser that falls back to a default on invalid input."""
+
+    def parse(value: str):
+        try:
+            return parser(value)
+        except ValueError:
+            return default
+
+    return parse
+
+
+# Dispatch table for scalar from_env fields: env suffix -> (parser, default).
+# One dict lookup per field replaces the per-key if/elif + try/except chains.
+_ENV_SCALARS = {
+    "ASYNC_ENABLED": (_safe_bool, True),
+    "COMPRESSION_ENABLED": (_safe_bool, True),
+    "BUFFER_SIZE": (_parse_with_default(int, 1000), 1000),
+    "FLUSH_INTERVAL_S": (_parse_with_default(float, 1.0), 1.0),
+    "RETENTION_DAYS": (_parse_with_default(int, 30), 30),
+    "MAX_FILE_SIZE_MB": (_parse_with_default(int, 100), 100),
+    "RING_BUFFER_SIZE": (_parse_with_default(int, 0), 0),
+    "CAPTURE_CALLER": (_safe_bool, True),
+}
+
 
 def from_file(config_path: str | Path) -> LoggerConfig:
     """
@@ -40,69 +99,58 @@ def from_file(config_path: str | Path) -> LoggerConfig:
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
     with open(config_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YamlLoader)
 
     if data is None:
         data = {}
 
     # Convert string log level to enum
-    level_str = data.get("level", "INFO").upper()
-    level = LogLevel[level_str] if hasattr(LogLevel, level_str) else LogLevel.INFO
+    level = _LEVEL_MAP.get(data.get("level", "INFO").casefold(), LogLevel.INFO)
 
     # Convert module_levels dict (str -> str) to (str -> LogLevel)
     module_levels = {}
     if "module_levels" in data:
         for module, level_str in data["module_levels"].items():
-            level_str = level_str.upper()
-            if hasattr(LogLevel, level_str):
-                module_levels[module] = LogLevel[level_str]
-
-    # Extract secret patterns from nested structure (if present)
-    secret_patterns = []
-    if "secret_redaction" in data:
-        secret_patterns = data["secret_redaction"].get("patterns", [])
-        redaction_text = data["secret_redaction"].get(
-            "redaction_text", "***REDACTED***"
-        )
-    else:
-        secret_patterns = data.get("secret_patterns", [])
-        redaction_text = data.get("redaction_text", "***REDACTED***")
-
-    # Extract async writer settings (if present)
-    async_enabled = data.get("async_enabled", True)
-    buffer_size = data.get("buffer_size", 1000)
-    flush_interval_s = data.get("flush_interval_s", 1.0)
-
-    if "async_writer" in data:
-        async_writer = data["async_writer"]
-        buffer_size = async_writer.get("buffer_size", buffer_size)
-        flush_interval_s = async_writer.get("flush_interval_seconds", flush_interval_s)
-
-    # Extract retention settings (if present)
-    retention_days = data.get("retention_days", 30)
-    compression_enabled = data.get("compression_enabled", True)
-    max_file_size_mb = data.get("max_file_size_mb", 100)
-
-    if "retention" in data:
-        retention = data["retention"]
-        retention_days = retention.get("max_log_age_days", retention_days)
-        max_file_size_mb = retention.get("max_archive_size_mb", max_file_size_mb)
-        compression = retention.get("compression", "gzip")
-        compression_enabled = compression in ["gzip", "bzip2", "xz"]
+            module_level = _LEVEL_MAP.get(level_str.casefold())
+            if module_level is not None:
+                module_levels[module] = module_level
+
+    # Flat settings with defaults
+    settings = {
+        "secret_patterns": data.get("secret_patterns", []),
+        "redaction_text": data.get("redaction_text", "***REDACTED***"),
+        "async_enabled": data.get("async_enabled", True),
+        "buffer_size": data.get("buffer_size", 1000),
+        "flush_interval_s": data.get("flush_interval_s", 1.0),
+        "retention_days": data.get("retention_days", 30),
+        "compression_enabled": data.get("compression_enabled", True),
+        "max_file_size_mb": data.get("max_file_size_mb", 100),
+        "ring_buffer_size": data.get("ring_buffer_size", 0),
+        "capture_caller": data.get("capture_caller", True),
+    }
+
+    # Single pass over the nested-key map (T008 format sections)
+    for path, dst in _FLATTENERS:
+        value = data
+        for key in path:
+            if not isinstance(value, dict) or key not in value:
+                value = _MISSING
+                break
+            value = value[key]
+        if value is not _MISSING:
+            settings[dst] = value
+
+    # retention.compression carries a codec name; enabled iff it's known
+    compression = settings.pop("_compression", _MISSING)
+    if compression is not _MISSING:
+        settings["compression_enabled"] = compression in ("gzip", "bzip2", "xz")
 
     return LoggerConfig(
         log_dir=Path(data.get("log_dir", "./Logs")),
         level=level,
         module_levels=module_levels,
         format=data.get("format", "json"),
-        async_enabled=async_enabled,
-        buffer_size=buffer_size,
-        flush_interval_s=flush_interval_s,
-        retention_days=retention_days,
-        compression_enabled=compression_enabled,
-        max_file_size_mb=max_file_size_mb,
-        secret_patterns=secret_patterns,
-        redaction_text=redaction_text,
+        **settings,
     )
 
 
@@ -131,8 +179,7 @@ def from_env(prefix: str = "LOGGING_") -> LoggerConfig:
         return os.environ.get(f"{prefix}{key}", default)
 
     # Parse log level
-    level_str = get_env("LEVEL", "INFO").upper()
-    level = LogLevel[level_str] if hasattr(LogLevel, level_str) else LogLevel.INFO
+    level = _LEVEL_MAP.get(get_env("LEVEL", "INFO").casefold(), LogLevel.INFO)
 
     # Parse module levels (format: "module1=DEBUG,module2=INFO")
     module_levels = {}
@@ -141,54 +188,26 @@ def from_env(prefix: str = "LOGGING_") -> LoggerConfig:
         for pair in module_levels_str.split(","):
             if "=" in pair:
                 module, level_str = pair.split("=", 1)
-                level_str = level_str.strip().upper()
-                if hasattr(LogLevel, level_str):
-                    module_levels[module.strip()] = LogLevel[level_str]
+                module_level = _LEVEL_MAP.get(level_str.strip().casefold())
+                if module_level is not None:
+                    module_levels[module.strip()] = module_level
 
     # Parse secret patterns (format: "pattern1|pattern2|pattern3")
     secret_patterns_str = get_env("SECRET_PATTERNS", "")
     secret_patterns = [p.strip() for p in secret_patterns_str.split("|") if p.strip()]
 
-    # Parse boolean flags
-    async_enabled = get_env("ASYNC_ENABLED", "true").lower() in ["true", "1", "yes"]
-    compression_enabled = get_env("COMPRESSION_ENABLED", "true").lower() in [
-        "true",
-        "1",
-        "yes",
-    ]
-
-    # Parse numeric values with defaults
-    try:
-        buffer_size = int(get_env("BUFFER_SIZE", "1000"))
-    except ValueError:
-        buffer_size = 1000
-
-    try:
-        flush_interval_s = float(get_env("FLUSH_INTERVAL_S", "1.0"))
-    except ValueError:
-        flush_interval_s = 1.0
-
-    try:
-        retention_days = int(get_env("RETENTION_DAYS", "30"))
-    except ValueError:
-        retention_days = 30
-
-    try:
-        max_file_size_mb = int(get_env("MAX_FILE_SIZE_MB", "100"))
-    except ValueError:
-        max_file_size_mb = 100
+    # Parse boolean and numeric values via the dispatch table
+    scalars = {}
+    for suffix, (parser, default) in _ENV_SCALARS.items():
+        value = os.environ.get(f"{prefix}{suffix}")
+        scalars[suffix.lower()] = parser(value) if value is not None else default
 
     return LoggerConfig(
         log_dir=Path(get_env("LOG_DIR", "./Logs")),
         level=level,
         module_levels=module_levels,
         format=get_env("FORMAT", "json"),
-        async_enabled=async_enabled,
-        buffer_size=buffer_size,
-        flush_interval_s=flush_interval_s,
-        retention_days=retention_days,
-        compression_enabled=compression_enabled,
-        max_file_size_mb=max_file_size_mb,
         secret_patterns=secret_patterns,
         redaction_text=get_env("REDACTION_TEXT", "***REDACTED***"),
+        **scalars,
     )
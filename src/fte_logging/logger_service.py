@@ -8,22 +8,90 @@ Constitutional compliance: Sections 2, 3, 8, 9 (disk-based, private, structured,
 """
 
 import asyncio
+import atexit
+import faulthandler
 import inspect
+import itertools
+import json
+import linecache
+import signal
 import sys
 import time
+import traceback
 from contextlib import contextmanager
 from contextvars import ContextVar
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
 
-from .async_writer import AsyncWriter
+from .async_writer import AsyncWriter, BufferedFileAppender, dumps_bytes
 from .models import ExceptionInfo, LogEntry, LogLevel, StackFrame
 from .redaction import SecretRedactor
 from .trace import bind_trace_id as _bind_trace_id, get_trace_id, new_trace_id
 
-# Context variable for bound context
-_context_var: ContextVar[Dict[str, Any]] = ContextVar("log_context", default={})
+# Bound context as a tuple of per-bind layers (read left-to-right at
+# merge time). Entering a bind appends one small dict instead of copying
+# the accumulated context, so nested binds stay O(new keys); the merge
+# cost is only paid when a record is actually emitted.
+_context_var: ContextVar[tuple] = ContextVar("log_context", default=())
+
+# Redactor instances shared across services with identical settings;
+# compiling the pattern set is the expensive part of construction, and
+# most services run with the same (default) configuration
+_redactor_cache: Dict[tuple, SecretRedactor] = {}
+
+
+def _shared_redactor(patterns: List[str], redaction_text: str) -> SecretRedactor:
+    """Get (or build) the redactor for a pattern set + redaction text."""
+    key = (tuple(patterns), redaction_text)
+    redactor = _redactor_cache.get(key)
+    if redactor is None:
+        redactor = SecretRedactor(patterns=patterns, redaction_text=redaction_text)
+        _redactor_cache[key] = redactor
+    return redactor
+
+# Runtime analogue of NanoLog-style compile-time format extraction: static
+# message strings are interned to small ints at first use, so queued records
+# carry an int instead of a string. The table is capped so dynamic messages
+# (f-strings) cannot grow it without bound; those carry the string itself.
+_FORMAT_TABLE_MAX = 4096
+_format_ids: Dict[str, int] = {}
+_formats: List[str] = []
+
+
+def _intern_format(message: str) -> "int | str":
+    """Return the interned format id for a message, or the message itself."""
+    fmt_id = _format_ids.get(message)
+    if fmt_id is not None:
+        return fmt_id
+    if len(_formats) < _FORMAT_TABLE_MAX:
+        fmt_id = len(_formats)
+        _formats.append(message)
+        _format_ids[message] = fmt_id
+        return fmt_id
+    return message
+
+
+class _BinaryRecord(NamedTuple):
+    """
+    Compact deferred-format log record queued on the hot path.
+
+    Redaction and JSON formatting happen later, in the writer's flush
+    (see LoggerService._format_record), keeping the per-call cost down
+    to field capture and a queue put.
+    """
+
+    fmt: "int | str"  # Interned format id, or the raw message
+    ts_ns: int  # Epoch nanoseconds (time.time_ns())
+    level: LogLevel
+    trace_id: str
+    module: str
+    function: Optional[str]
+    line_number: Optional[int]
+    context: Optional[Dict[str, Any]]
+    exception: Optional[ExceptionInfo]
+    duration_ms: Optional[float]
+    tags: List[str]
 
 
 class LoggerService:
@@ -65,22 +133,70 @@ class LoggerService:
             Otherwise, call start_async_writer() manually later.
         """
         self.config = config
-        self._redactor = SecretRedactor(
-            patterns=config.secret_patterns, redaction_text=config.redaction_text
+        self._redactor = _shared_redactor(
+            config.secret_patterns, config.redaction_text
         )
 
         # Runtime level overrides (mutable, separate from frozen config)
         self._runtime_level: Optional[LogLevel] = None
         self._runtime_module_levels: Dict[str, LogLevel] = {}
 
-        # Initialize async writer (but don't start yet)
+        # Cached int thresholds for the disabled-log-site fast path;
+        # recomputed by set_level()
+        self._threshold_int = config.level.value
+        self._min_level_int = config.level.value
+        # Memoized module-name -> threshold-int table (interned keys);
+        # filled on first sight of each module, cleared by set_level()
+        self._resolved_thresholds: Dict[str, int] = {}
+        self._recompute_thresholds()
+
+        # Per-call-site JSON skeletons: the level/module/message/
+        # function/line fields are constant for a given call site, so
+        # their serialized (and redacted) form is compiled once and
+        # reused; only trace_id and timestamp are spliced in per record
+        self._skeletons: Dict[tuple, bytes] = {}
+
+        # In-memory ring buffer mode: zero steady-state I/O, one slot
+        # write per log call. The ring only reaches disk via dump_ring()
+        # (registered with atexit); a crash-traceback file is wired into
+        # faulthandler so hard crashes still leave a trail.
+        self._ring: Optional[List[Optional[_BinaryRecord]]] = None
+        self._ring_mask = 0
+        self._ring_idx = itertools.count()
+        self._crash_file = None
+        if config.ring_buffer_size > 0:
+            # Round up to a power of two so the slot index is a mask, not
+            # a modulo
+            size = 1 << (config.ring_buffer_size - 1).bit_length()
+            self._ring = [None] * size
+            self._ring_mask = size - 1
+            atexit.register(self.dump_ring)
+            try:
+                config.log_dir.mkdir(parents=True, exist_ok=True)
+                self._crash_file = open(
+                    config.log_dir / "crash-traceback.log", "a", encoding="utf-8"
+                )
+                # enable() covers SIGSEGV/SIGFPE/SIGABRT/SIGBUS; these are
+                # faulthandler-reserved and cannot go through register()
+                faulthandler.enable(file=self._crash_file)
+            except (OSError, RuntimeError, ValueError):
+                # No crash file (or no faulthandler.register on this
+                # platform) - ring mode still works, minus the trail
+                self._crash_file = None
+
+        # Initialize async writer (but don't start yet); sync mode gets a
+        # buffered file appender instead of falling through to stderr
         self._writer: Optional[AsyncWriter] = None
-        if config.async_enabled:
+        self._appender: Optional[BufferedFileAppender] = None
+        if not config.async_enabled and self._ring is None:
+            self._appender = BufferedFileAppender(log_dir=config.log_dir)
+        if config.async_enabled and self._ring is None:
             self._writer = AsyncWriter(
                 log_dir=config.log_dir,
                 buffer_size=config.buffer_size,
                 flush_interval_s=config.flush_interval_s,
                 max_file_size_mb=config.max_file_size_mb,
+                encoder=self._encode_record,
             )
 
             if start_async:
@@ -117,6 +233,9 @@ class LoggerService:
             TimeoutError: If flush doesn't complete within timeout
         """
         if self._writer is None:
+            # Sync mode: flush + fsync the buffered appender instead
+            if self._appender is not None:
+                self._appender.close()
             return
 
         try:
@@ -129,6 +248,41 @@ class LoggerService:
         if self._writer is not None:
             await self._writer.flush()
 
+    def dump_ring(self) -> Optional[Path]:
+        """
+        Dump the in-memory ring buffer to disk (ring mode only).
+
+        Registered with atexit so the retained records survive normal
+        interpreter shutdown; safe to call manually at any point.
+        Records are written oldest-first as NDJSON.
+
+        Returns:
+            Path of the dump file, or None if ring mode is off or empty
+        """
+        if self._ring is None:
+            return None
+
+        records = sorted(
+            (r for r in self._ring if r is not None), key=lambda r: r.ts_ns
+        )
+        if not records:
+            return None
+
+        try:
+            self.config.log_dir.mkdir(parents=True, exist_ok=True)
+            dump_path = self.config.log_dir / time.strftime(
+                "ring-dump-%Y%m%d-%H%M%S.log", time.gmtime()
+            )
+            with open(dump_path, "ab") as f:
+                for record in records:
+                    f.write(self._encode_record(record) + b"\n")
+            return dump_path
+        except Exception as e:
+            # Never crash on dump failure (atexit path)
+            sys.stderr.write(f"[LoggerService Error] Ring dump failed: {e}\n")
+            sys.stderr.flush()
+            return None
+
     def log(
         self,
         level: LogLevel,
@@ -161,6 +315,11 @@ class LoggerService:
             ...     context={"task_id": "task-001"}
             ... )
         """
+        # Fast path: one int compare drops below-threshold calls before
+        # any timestamping, context merging, or frame inspection
+        if level < self._min_level_int:
+            return
+
         try:
             # Check if level should be logged
             if not self._should_log(level):
@@ -173,26 +332,27 @@ class LoggerService:
             # Merge bound context with provided context
             merged_context = self._merge_context(context)
 
-            # Redact secrets from message and context
-            redacted_message = self._redactor.redact(message)
-            redacted_context = None
-            if merged_context:
-                redacted_context = self._redactor.redact_dict(merged_context)
-
             # Capture caller information (module, function, line)
             # Go 2 frames up to skip the convenience method (info, error, etc.)
-            frame = inspect.currentframe()
-            if frame and frame.f_back and frame.f_back.f_back:
-                caller_frame = frame.f_back.f_back
-                module = caller_frame.f_globals.get("__name__", "unknown")
-                function = caller_frame.f_code.co_name
-                line_number = caller_frame.f_lineno
-            elif frame and frame.f_back:
-                # Fallback if called directly (not via convenience method)
-                caller_frame = frame.f_back
-                module = caller_frame.f_globals.get("__name__", "unknown")
-                function = caller_frame.f_code.co_name
-                line_number = caller_frame.f_lineno
+            # The frame walk costs ~1-2us per record; capture_caller=False
+            # skips it entirely for hot services
+            if self.config.capture_caller:
+                frame = inspect.currentframe()
+                if frame and frame.f_back and frame.f_back.f_back:
+                    caller_frame = frame.f_back.f_back
+                    module = caller_frame.f_globals.get("__name__", "unknown")
+                    function = caller_frame.f_code.co_name
+                    line_number = caller_frame.f_lineno
+                elif frame and frame.f_back:
+                    # Fallback if called directly (not via convenience method)
+                    caller_frame = frame.f_back
+                    module = caller_frame.f_globals.get("__name__", "unknown")
+                    function = caller_frame.f_code.co_name
+                    line_number = caller_frame.f_lineno
+                else:
+                    module = "unknown"
+                    function = None
+                    line_number = None
             else:
                 module = "unknown"
                 function = None
@@ -203,33 +363,49 @@ class LoggerService:
             if exception is not None:
                 exception_info = self._capture_exception(exception)
 
-            # Create log entry
-            entry = LogEntry(
-                trace_id=trace_id,
-                timestamp=datetime.now(timezone.utc),
+            # Build a compact deferred-format record; redaction and JSON
+            # serialization run later, in the writer's flush
+            if not isinstance(message, str):
+                message = str(message)
+            record = _BinaryRecord(
+                fmt=_intern_format(message),
+                ts_ns=time.time_ns(),
                 level=level,
+                trace_id=trace_id,
                 module=module,
-                message=redacted_message,
                 function=function,
                 line_number=line_number,
-                context=redacted_context,
+                context=merged_context or None,
                 exception=exception_info,
                 duration_ms=duration_ms,
                 tags=tags or [],
             )
 
+            # Ring mode: one slot write, no queue and no syscalls
+            if self._ring is not None:
+                self._ring[next(self._ring_idx) & self._ring_mask] = record
+                return
+
             # Write to async writer or fallback to stderr
             if self._writer is not None:
-                # Schedule write in event loop
+                # Enqueue directly - write() is a plain put_nowait, but the
+                # background flush task still needs a running event loop
                 try:
-                    loop = asyncio.get_running_loop()
-                    loop.create_task(self._writer.write(entry))
+                    asyncio.get_running_loop()
+                    self._writer.write(record)
                 except RuntimeError:
                     # No event loop - fallback to stderr
-                    self._write_to_stderr(entry)
+                    self._write_to_stderr(self._format_record(record))
+            elif self._appender is not None:
+                # Sync mode - buffered append (serialization on the
+                # caller, but no queue handoff and no per-line syscall)
+                try:
+                    self._appender.write(self._encode_record(record) + b"\n")
+                except Exception:
+                    self._write_to_stderr(self._format_record(record))
             else:
-                # Sync mode - write to stderr
-                self._write_to_stderr(entry)
+                # No sink configured - write to stderr
+                self._write_to_stderr(self._format_record(record))
 
         except Exception as e:
             # Never crash on logging error
@@ -238,23 +414,62 @@ class LoggerService:
 
     def debug(self, message: str, **kwargs) -> None:
         """Log DEBUG level message."""
-        self.log(LogLevel.DEBUG, message, **kwargs)
+        if 10 >= self._min_level_int:
+            self.log(LogLevel.DEBUG, message, **kwargs)
 
     def info(self, message: str, **kwargs) -> None:
         """Log INFO level message."""
-        self.log(LogLevel.INFO, message, **kwargs)
+        if 20 >= self._min_level_int:
+            self.log(LogLevel.INFO, message, **kwargs)
 
     def warning(self, message: str, **kwargs) -> None:
         """Log WARNING level message."""
-        self.log(LogLevel.WARNING, message, **kwargs)
+        if 30 >= self._min_level_int:
+            self.log(LogLevel.WARNING, message, **kwargs)
 
     def error(self, message: str, **kwargs) -> None:
         """Log ERROR level message."""
-        self.log(LogLevel.ERROR, message, **kwargs)
+        if 40 >= self._min_level_int:
+            self.log(LogLevel.ERROR, message, **kwargs)
 
     def critical(self, message: str, **kwargs) -> None:
         """Log CRITICAL level message."""
-        self.log(LogLevel.CRITICAL, message, **kwargs)
+        if 50 >= self._min_level_int:
+            self.log(LogLevel.CRITICAL, message, **kwargs)
+
+    def is_enabled(self, level: LogLevel) -> bool:
+        """
+        Cheap call-site guard for expensive log-argument construction.
+
+        Returns False only when no configured threshold (global or
+        per-module) could accept the level - a single int compare.
+
+        Example:
+            >>> if logger.is_enabled(LogLevel.DEBUG):
+            ...     logger.debug(f"state: {expensive_repr(state)}")
+        """
+        return level >= self._min_level_int
+
+    def bind_for_module(self, module: str) -> "_BoundLogger":
+        """
+        Get a lightweight per-module view with a frozen threshold.
+
+        The bound view resolves the module's effective level once, at
+        bind time, so its convenience methods drop disabled calls with a
+        single int compare - no dict probe, no enum. Rebind after
+        set_level() to pick up runtime changes.
+
+        Args:
+            module: Module name (typically __name__)
+
+        Returns:
+            Bound logger view delegating to this service
+
+        Example:
+            >>> log = logger.bind_for_module(__name__)
+            >>> log.debug("cheap when disabled")
+        """
+        return _BoundLogger(self, module, self._resolve_threshold(module))
 
     @contextmanager
     def bind_context(self, **context: Any) -> Iterator[None]:
@@ -269,14 +484,8 @@ class LoggerService:
             ...     logger.info("Operation started")
             ...     logger.info("Operation complete")
         """
-        # Get current context
-        current_context = _context_var.get().copy()
-
-        # Merge new context
-        current_context.update(context)
-
-        # Set new context
-        token = _context_var.set(current_context)
+        # Push one layer; no copy of the accumulated context
+        token = _context_var.set(_context_var.get() + (context,))
 
         try:
             yield
@@ -310,31 +519,38 @@ class LoggerService:
         *,
         log_level: LogLevel = LogLevel.INFO,
         log_message: Optional[str] = None,
+        log_start: bool = False,
         **context: Any,
     ) -> Iterator[None]:
         """
         Measure and log operation duration.
 
+        Emits a single record with duration_ms on exit; pass
+        log_start=True for the old two-record (started/complete) form.
+        Timing uses perf_counter_ns - no float round-trip until the
+        final millisecond conversion.
+
         Args:
             operation_name: Name of operation
             log_level: Log level for messages
             log_message: Optional custom log message
+            log_start: Also log a "started" record on entry
             **context: Additional context to bind
 
         Example:
             >>> with logger.measure_duration("file_operation", path="/tmp/file"):
             ...     atomic_move(src, dst)
         """
-        start_time = time.perf_counter()
+        if log_start:
+            self.log(log_level, f"{operation_name} started", context=context)
 
-        # Log start
-        self.log(log_level, f"{operation_name} started", context=context)
+        start_ns = time.perf_counter_ns()
 
         try:
             yield
         finally:
             # Calculate duration
-            duration_ms = (time.perf_counter() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
             # Log end with duration
             message = log_message or f"{operation_name} complete"
@@ -352,6 +568,7 @@ class LoggerService:
             self._runtime_level = level
         else:
             self._runtime_module_levels[module] = level
+        self._recompute_thresholds()
 
     def get_level(self, module: Optional[str] = None) -> LogLevel:
         """
@@ -376,8 +593,33 @@ class LoggerService:
             return self._runtime_module_levels[module]
         return self.config.module_levels.get(module, self.get_level())
 
+    def _recompute_thresholds(self) -> None:
+        """
+        Refresh the cached int thresholds used by the fast path.
+
+        _threshold_int is the effective global level; _min_level_int is
+        the lowest level any threshold (global or per-module) accepts,
+        so `level < _min_level_int` proves a record is dropped without
+        inspecting the caller's module.
+        """
+        global_level = (
+            self._runtime_level
+            if self._runtime_level is not None
+            else self.config.level
+        )
+        self._threshold_int = global_level.value
+        candidates = [global_level.value]
+        candidates.extend(lvl.value for lvl in self._runtime_module_levels.values())
+        candidates.extend(lvl.value for lvl in self.config.module_levels.values())
+        self._min_level_int = min(candidates)
+        self._resolved_thresholds.clear()
+
     def _should_log(self, level: LogLevel) -> bool:
         """Check if log level should be logged."""
+        # No module overrides: pure int compare, no caller-frame walk
+        if not self._runtime_module_levels and not self.config.module_levels:
+            return level >= self._threshold_int
+
         # Get caller module for level check
         frame = inspect.currentframe()
         if frame and frame.f_back and frame.f_back.f_back:
@@ -386,65 +628,82 @@ class LoggerService:
         else:
             module = ""
 
-        # Check runtime module-specific level first
-        for mod_prefix, mod_level in self._runtime_module_levels.items():
-            if module.startswith(mod_prefix):
-                return level >= mod_level
+        return level >= self._resolve_threshold(module)
 
-        # Check config module-specific level
-        for mod_prefix, mod_level in self.config.module_levels.items():
-            if module.startswith(mod_prefix):
-                return level >= mod_level
+    def _resolve_threshold(self, module: str) -> int:
+        """
+        Effective threshold int for a module, memoized per module name.
 
-        # Check runtime global level, then config global level
-        global_level = (
-            self._runtime_level
-            if self._runtime_level is not None
-            else self.config.level
-        )
-        return level >= global_level
+        The same handful of module names recur across log calls, so the
+        prefix walks below run once per module; afterwards the check is
+        one dict probe on an interned key.
+        """
+        threshold = self._resolved_thresholds.get(module)
+        if threshold is not None:
+            return threshold
 
-    def _merge_context(self, context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
-        """Merge bound context with provided context."""
-        bound_context = _context_var.get()
+        threshold = self._threshold_int
+
+        # Check runtime module-specific level first, then config
+        for mod_prefix, mod_level in self._runtime_module_levels.items():
+            if module.startswith(mod_prefix):
+                threshold = mod_level.value
+                break
+        else:
+            for mod_prefix, mod_level in self.config.module_levels.items():
+                if module.startswith(mod_prefix):
+                    threshold = mod_level.value
+                    break
 
-        if context is None:
-            return bound_context.copy()
+        self._resolved_thresholds[sys.intern(module)] = threshold
+        return threshold
 
-        merged = bound_context.copy()
-        merged.update(context)
+    def _merge_context(self, context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Flatten the bound context layers and merge the provided context."""
+        layers = _context_var.get()
+
+        merged: Dict[str, Any] = {}
+        for layer in layers:
+            merged.update(layer)
+        if context:
+            merged.update(context)
         return merged
 
     def _capture_exception(self, exception: BaseException) -> ExceptionInfo:
         """
-        Capture exception with full stack trace.
+        Capture exception with a cheap, source-free stack trace.
+
+        lookup_lines=False skips the linecache source reads (the
+        expensive part of traceback extraction); _hydrate_exception
+        fills in the source lines later, on the writer side.
 
         Args:
             exception: Exception to capture
 
         Returns:
-            ExceptionInfo with stack trace
+            ExceptionInfo with stack trace (frames without .code)
         """
-        import traceback
-
         # Get exception type and message
         exc_type = type(exception).__name__
         exc_message = str(exception)
 
-        # Extract stack trace
+        # Extract stack trace without reading source files
         tb = exception.__traceback__
         stack_frames = []
 
         if tb is not None:
-            for frame_summary in traceback.extract_tb(tb):
-                stack_frames.append(
-                    StackFrame(
-                        file=frame_summary.filename,
-                        line=frame_summary.lineno,
-                        function=frame_summary.name,
-                        code=frame_summary.line,
-                    )
+            summary = traceback.StackSummary.extract(
+                traceback.walk_tb(tb), lookup_lines=False
+            )
+            stack_frames = [
+                StackFrame(
+                    file=frame.filename,
+                    line=frame.lineno,
+                    function=frame.name,
+                    code=None,
                 )
+                for frame in summary
+            ]
 
         # Capture chained exception (__cause__)
         cause = None
@@ -455,6 +714,114 @@ class LoggerService:
             type=exc_type, message=exc_message, stack_trace=stack_frames, cause=cause
         )
 
+    def _hydrate_exception(self, info: ExceptionInfo) -> ExceptionInfo:
+        """
+        Fill in source code lines deferred by _capture_exception.
+
+        Runs on the writer's flush path, so the linecache reads never
+        block the logging caller.
+        """
+        frames = [
+            StackFrame(
+                file=frame.file,
+                line=frame.line,
+                function=frame.function,
+                code=frame.code
+                or (linecache.getline(frame.file, frame.line).strip() or None),
+            )
+            for frame in info.stack_trace
+        ]
+        cause = self._hydrate_exception(info.cause) if info.cause else None
+        return ExceptionInfo(
+            type=info.type, message=info.message, stack_trace=frames, cause=cause
+        )
+
+    def _format_record(self, record: _BinaryRecord) -> LogEntry:
+        """
+        Hydrate a queued binary record into a redacted LogEntry.
+
+        This is the deferred half of log(): message lookup, secret
+        redaction, and LogEntry construction run here, on the writer's
+        flush path rather than the caller's.
+
+        Args:
+            record: Binary record captured on the hot path
+
+        Returns:
+            LogEntry ready for serialization
+        """
+        fmt = record.fmt
+        message = _formats[fmt] if isinstance(fmt, int) else fmt
+        context = record.context
+        exception = record.exception
+        if exception is not None:
+            exception = self._hydrate_exception(exception)
+        return LogEntry(
+            trace_id=record.trace_id,
+            timestamp=record.ts_ns,
+            level=record.level,
+            module=record.module,
+            message=self._redactor.redact(message),
+            function=record.function,
+            line_number=record.line_number,
+            context=self._redactor.redact_dict(context) if context else None,
+            exception=exception,
+            duration_ms=record.duration_ms,
+            tags=record.tags,
+        )
+
+    def _encode_record(self, record: _BinaryRecord) -> bytes:
+        """
+        Format and serialize a binary record to a JSON line (writer side).
+
+        Call sites with a static message and no dynamic fields (the
+        common case) hit a compiled skeleton: the static fields are
+        serialized once per (message, level, call site) and only
+        trace_id and timestamp are spliced in per record. Everything
+        else takes the general to_dict() path.
+        """
+        if (
+            isinstance(record.fmt, int)
+            and record.context is None
+            and record.exception is None
+            and record.duration_ms is None
+            and not record.tags
+        ):
+            key = (
+                record.fmt,
+                record.level,
+                record.module,
+                record.function,
+                record.line_number,
+            )
+            static = self._skeletons.get(key)
+            if static is None:
+                fields = {
+                    "level": record.level.name,
+                    "module": record.module,
+                    "message": self._redactor.redact(_formats[record.fmt]),
+                }
+                if record.function is not None:
+                    fields["function"] = record.function
+                if record.line_number is not None:
+                    fields["line_number"] = record.line_number
+                # Strip the outer braces; the JSON encoder has already
+                # escape-validated the static parts
+                static = dumps_bytes(fields)[1:-1]
+                self._skeletons[key] = static
+            ts = datetime.fromtimestamp(record.ts_ns / 1e9, timezone.utc)
+            return (
+                b'{"trace_id":"'
+                + record.trace_id.encode("ascii")
+                + b'","timestamp":"'
+                + ts.isoformat().encode("ascii")
+                + b'",'
+                + static
+                + b"}"
+            )
+
+        return dumps_bytes(self._format_record(record).to_dict())
+
     def _write_to_stderr(self, entry: LogEntry) -> None:
         """
         Fallback: write log entry to stderr.
@@ -462,23 +829,57 @@ class LoggerService:
         Args:
             entry: LogEntry to write
         """
-        import json
-
         try:
-            data = {
-                "trace_id": entry.trace_id,
-                "timestamp": entry.timestamp.isoformat(),
-                "level": entry.level.name,
-                "module": entry.module,
-                "message": entry.message,
-            }
-
-            if entry.context:
-                data["context"] = entry.context
-
-            sys.stderr.write(json.dumps(data) + "\n")
+            sys.stderr.write(json.dumps(entry.to_dict()) + "\n")
             sys.stderr.flush()
         except Exception:
             # Last resort
             sys.stderr.write(f"[{entry.level.name}] {entry.message}\n")
             sys.stderr.flush()
+
+
+class _BoundLogger:
+    """
+    Per-module logger view with the threshold frozen at bind time.
+
+    Disabled-level calls cost one int compare; enabled calls delegate to
+    the parent LoggerService (same caller-frame depth as the service's
+    own convenience methods, so module/function/line capture still
+    points at the call site).
+    """
+
+    __slots__ = ("_service", "_module", "_threshold")
+
+    def __init__(self, service: LoggerService, module: str, threshold: int):
+        self._service = service
+        self._module = module
+        self._threshold = threshold
+
+    def debug(self, message: str, **kwargs) -> None:
+        """Log DEBUG level message."""
+        if 10 >= self._threshold:
+            self._service.log(LogLevel.DEBUG, message, **kwargs)
+
+    def info(self, message: str, **kwargs) -> None:
+        """Log INFO level message."""
+        if 20 >= self._threshold:
+            self._service.log(LogLevel.INFO, message, **kwargs)
+
+    def warning(self, message: str, **kwargs) -> None:
+        """Log WARNING level message."""
+        if 30 >= self._threshold:
+            self._service.log(LogLevel.WARNING, message, **kwargs)
+
+    def error(self, message: str, **kwargs) -> None:
+        """Log ERROR level message."""
+        if 40 >= self._threshold:
+            self._service.log(LogLevel.ERROR, message, **kwargs)
+
+    def critical(self, message: str, **kwargs) -> None:
+        """Log CRITICAL level message."""
+        if 50 >= self._threshold:
+            self._service.log(LogLevel.CRITICAL, message, **kwargs)
+
+    def is_enabled(self, level: LogLevel) -> bool:
+        """Single int compare against the frozen threshold."""
+        return level >= self._threshold
@@ -8,6 +8,16 @@ Constitutional compliance: Section 3 (privacy, secrets never written to disk).
 import re
 from typing import Any
 
+# Optional Aho-Corasick automaton for the trigger-keyword pre-screen. A
+# single multi-pattern scan over literal keywords is cheaper than even one
+# regex pass; without it we fall back to the combined alternation pattern.
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # Default secret patterns (can be overridden via config)
 # Patterns with capturing groups: group 1 = key name, group 2 = separator (normalized), group 3 = secret value
 DEFAULT_SECRET_PATTERNS = [
@@ -27,6 +37,43 @@ DEFAULT_SECRET_PATTERNS = [
     r"(?i)(aws[_-]?access[_-]?key[_-]?id|aws[_-]?secret[_-]?access[_-]?key)(\s*[:=]\s*[\"']?)([a-zA-Z0-9/+=]{20,})[\"']?",
 ]
 
+# Literal trigger keywords for DEFAULT_SECRET_PATTERNS: every default
+# pattern requires one of these substrings (case-insensitively), so a miss
+# on all of them proves the message is clean without running any regex.
+# Only valid for the default patterns - custom pattern lists keep the
+# combined-regex pre-screen instead.
+DEFAULT_TRIGGER_KEYWORDS = (
+    "api_key",
+    "api-key",
+    "apikey",
+    "password",
+    "passwd",
+    "pwd",
+    "bearer",
+    "token",
+    "auth",
+    "secret",
+    "private_key",
+    "private-key",
+    "eyj",  # JWT header prefix ("eyJ" base64 of '{"')
+    "aws_access_key",
+    "aws-access-key",
+    "aws_secret",
+    "aws-secret",
+)
+
+
+def _build_trigger_automaton() -> "ahocorasick.Automaton | None":
+    """Build the Aho-Corasick trigger automaton (None if unavailable)."""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in DEFAULT_TRIGGER_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
 # Patterns for detecting secrets in standalone values (for dict redaction)
 SECRET_VALUE_PATTERNS = [
     r"^sk_live_[a-zA-Z0-9_\-]{16,}$",  # Stripe live keys
@@ -35,6 +82,30 @@ SECRET_VALUE_PATTERNS = [
 ]
 
 
+def combine_patterns(patterns: list[str]) -> "re.Pattern | None":
+    """
+    Compile a list of regex patterns into a single alternation pattern.
+
+    Leading global ``(?i)`` flags are rewritten as scoped ``(?i:...)``
+    groups so they remain legal inside the alternation.
+
+    Args:
+        patterns: Regex pattern strings to combine
+
+    Returns:
+        Compiled combined pattern, or None if patterns is empty
+    """
+    if not patterns:
+        return None
+
+    def scoped(pattern: str) -> str:
+        if pattern.startswith("(?i)"):
+            return f"(?i:{pattern[4:]})"
+        return f"(?:{pattern})"
+
+    return re.compile("|".join(scoped(p) for p in patterns))
+
+
 class SecretRedactor:
     """
     Regex-based secret redaction for log messages.
@@ -73,6 +144,18 @@ class SecretRedactor:
         # Compile patterns once for performance (hot path optimization)
         self._compiled_patterns = [re.compile(pattern) for pattern in self.patterns]
 
+        # Combined alternation pattern used as a pre-screen: one automaton
+        # scan decides whether the per-pattern substitution loop runs at all
+        self._combined_pattern = combine_patterns(self.patterns)
+
+        # With the default patterns, an Aho-Corasick scan over literal
+        # trigger keywords is an even cheaper pre-screen (no regex at all
+        # for the common clean-message case). Custom patterns can't share
+        # the keyword list, so they rely on the combined pattern alone.
+        self._trigger_automaton = (
+            _build_trigger_automaton() if patterns is None else None
+        )
+
     def redact(self, text: str | Any) -> str:
         """
         Redact secrets from text using configured patterns.
@@ -103,6 +186,16 @@ class SecretRedactor:
         if not self._compiled_patterns:
             return text
 
+        # Fastest path: no trigger keyword in the message means no default
+        # pattern can match - skip every regex
+        if self._trigger_automaton is not None:
+            if next(self._trigger_automaton.iter(text.lower()), None) is None:
+                return text
+
+        # Fast path: single combined scan for the (common) clean-message case
+        if self._combined_pattern.search(text) is None:
+            return text
+
         # Apply each pattern sequentially
         redacted_text = text
         for pattern in self._compiled_patterns:
@@ -253,3 +346,7 @@ class SecretRedactor:
         """
         self.patterns.append(pattern)
         self._compiled_patterns.append(re.compile(pattern))
+        self._combined_pattern = combine_patterns(self.patterns)
+        # The trigger keywords only cover the default patterns; a custom
+        # addition invalidates the keyword pre-screen
+        self._trigger_automaton = None
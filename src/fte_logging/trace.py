@@ -5,15 +5,77 @@ Uses ULID for sortable, timestamp-embedded trace IDs.
 Constitutional compliance: Section 8 (trace correlation for auditability).
 """
 
+import secrets
+import threading
+import time
+from asyncio import events as _aio_events
 from contextlib import contextmanager
 from contextvars import ContextVar
-from typing import Optional
+from typing import List, Optional
 
-from ulid import ULID
-
-# Context variable for storing current trace ID
+# Context variable for storing current trace ID (async contexts only; the
+# sync path below uses a plain thread-local stack instead)
 _trace_id_var: ContextVar[Optional[str]] = ContextVar("trace_id", default=None)
 
+# Sync fast path: ContextVar.set allocates a Token and copies into the HAMT
+# on every bind. Purely-synchronous callers get a thread-local list instead -
+# append on enter, pop on exit - and the ContextVar is only used when an
+# event loop is running, where per-task isolation actually matters.
+_sync_state = threading.local()
+
+
+def _sync_stack() -> list:
+    stack = getattr(_sync_state, "stack", None)
+    if stack is None:
+        stack = _sync_state.stack = []
+    return stack
+
+# Crockford base32 alphabet (no I, L, O, U)
+_CROCKFORD = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+# 1024-entry pair table: each 10-bit chunk maps straight to two Crockford
+# characters, halving the lookups and dropping the per-5-bit shift loop
+_PAIRS = tuple(_CROCKFORD[i >> 5] + _CROCKFORD[i & 0x1F] for i in range(1024))
+
+# A 26-char ULID is 130 bits = 13 pairs; the top two bits are always zero
+# since the value itself is only 128 bits wide. The first 5 pairs cover the
+# 48-bit millisecond timestamp, the last 8 the 80-bit random tail.
+_PREFIX_SHIFTS = tuple(range(40, -1, -10))
+_SUFFIX_SHIFTS = tuple(range(70, -1, -10))
+
+# Burst cache: IDs minted in the same millisecond share an identical 10-char
+# timestamp prefix, so it is encoded once per ms instead of once per call.
+# Within the same ms the 80-bit tail is a monotonic counter seeded from the
+# pool (ULID "monotonic mode"), which keeps IDs strictly sortable and makes
+# a burst cost one int add instead of a randomness draw.
+_RAND_MASK = (1 << 80) - 1
+_last_ms = -1
+_last_prefix = ""
+_last_rand = 0
+
+# Buffered randomness: one 8 KiB secrets.token_bytes call covers ~800 trace
+# IDs, instead of an os.urandom syscall per ID. The whole mint (pool slice
+# plus burst-cache update) runs under one short lock; it is held for a few
+# instructions and still costs far less than a per-call kernel transition.
+_RAND_POOL_SIZE = 8192
+_rand_pool = b""
+_rand_off = _RAND_POOL_SIZE
+_mint_lock = threading.Lock()
+
+
+def _next_rand10() -> bytes:
+    """Return 10 random bytes from the pooled buffer, refilling as needed.
+
+    Caller must hold _mint_lock.
+    """
+    global _rand_pool, _rand_off
+    if _rand_off + 10 > len(_rand_pool):
+        _rand_pool = secrets.token_bytes(_RAND_POOL_SIZE)
+        _rand_off = 0
+    out = _rand_pool[_rand_off : _rand_off + 10]
+    _rand_off += 10
+    return out
+
 
 def new_trace_id() -> str:
     """
@@ -28,6 +90,11 @@ def new_trace_id() -> str:
     Returns:
         New trace ID as string
 
+    Generated inline (48-bit millisecond timestamp + 80 bits from the
+    pooled randomness buffer, base32-encoded from one int) rather than
+    through a ULID library - no per-call object graph beyond the final
+    str, and no per-call urandom syscall.
+
     Example:
         >>> trace_id = new_trace_id()
         >>> len(trace_id)
@@ -35,7 +102,75 @@ def new_trace_id() -> str:
         >>> trace_id  # doctest: +SKIP
         '01HQ8Z9X0ABCDEFGHIJKLMNOPQ'
     """
-    return str(ULID())
+    global _last_ms, _last_prefix, _last_rand
+    # 48-bit epoch-ms prefix (sortable) + 80-bit tail
+    ms = time.time_ns() // 1_000_000
+    with _mint_lock:
+        if ms == _last_ms:
+            # Same-ms burst: bump the tail instead of drawing randomness
+            rand = _last_rand = (_last_rand + 1) & _RAND_MASK
+        else:
+            _last_prefix = "".join(
+                [_PAIRS[(ms >> shift) & 0x3FF] for shift in _PREFIX_SHIFTS]
+            )
+            _last_ms = ms
+            rand = _last_rand = int.from_bytes(_next_rand10(), "big")
+        prefix = _last_prefix
+    return prefix + "".join(
+        [_PAIRS[(rand >> shift) & 0x3FF] for shift in _SUFFIX_SHIFTS]
+    )
+
+
+def new_trace_ids(n: int) -> List[str]:
+    """
+    Generate ``n`` trace IDs in one batch.
+
+    Amortizes the per-call overhead of new_trace_id across the batch: the
+    lock is taken once, the timestamp prefix is encoded once, and the
+    80-bit tails are consecutive counter values continuing from the burst
+    cache (ULID monotonic mode), so no per-ID randomness draw is needed.
+    IDs in the batch sort strictly ascending, same as a same-ms burst of
+    single calls.
+
+    Args:
+        n: Number of trace IDs to generate
+
+    Returns:
+        List of n new trace IDs, in ascending order
+
+    Example:
+        >>> ids = new_trace_ids(3)
+        >>> len(ids)
+        3
+        >>> ids == sorted(ids)
+        True
+    """
+    if n <= 0:
+        return []
+
+    global _last_ms, _last_prefix, _last_rand
+    ms = time.time_ns() // 1_000_000
+    with _mint_lock:
+        if ms == _last_ms:
+            # Continue the same-ms counter past the last minted ID
+            first = (_last_rand + 1) & _RAND_MASK
+        else:
+            _last_prefix = "".join(
+                [_PAIRS[(ms >> shift) & 0x3FF] for shift in _PREFIX_SHIFTS]
+            )
+            _last_ms = ms
+            first = int.from_bytes(_next_rand10(), "big")
+        _last_rand = (first + n - 1) & _RAND_MASK
+        prefix = _last_prefix
+
+    ids = []
+    for i in range(n):
+        rand = (first + i) & _RAND_MASK
+        ids.append(
+            prefix
+            + "".join([_PAIRS[(rand >> shift) & 0x3FF] for shift in _SUFFIX_SHIFTS])
+        )
+    return ids
 
 
 def get_trace_id() -> Optional[str]:
@@ -52,7 +187,13 @@ def get_trace_id() -> Optional[str]:
         ...     get_trace_id()
         '01HQ8Z9X0ABCDEFGHIJKLMNOPQ'
     """
-    return _trace_id_var.get()
+    # Task-bound IDs win; otherwise fall back to the sync stack so async
+    # code still inherits an ID bound by its synchronous caller
+    bound = _trace_id_var.get()
+    if bound is not None:
+        return bound
+    stack = getattr(_sync_state, "stack", None)
+    return stack[-1] if stack else None
 
 
 @contextmanager
@@ -82,11 +223,23 @@ def bind_trace_id(trace_id: Optional[str] = None):
     if trace_id is None:
         trace_id = new_trace_id()
 
-    # Save previous trace ID
-    token = _trace_id_var.set(trace_id)
-
-    try:
-        yield trace_id
-    finally:
-        # Restore previous trace ID
-        _trace_id_var.reset(token)
+    if _aio_events._get_running_loop() is not None:
+        # Inside an event loop: ContextVar gives per-task isolation.
+        # Snapshot-restore instead of set/reset: restoring the previous
+        # value directly skips the Token allocation on enter and the token
+        # bookkeeping on exit. Enter and exit run in the same task context
+        # (this is a contextmanager), so the snapshot is always valid.
+        prev = _trace_id_var.get()
+        _trace_id_var.set(trace_id)
+        try:
+            yield trace_id
+        finally:
+            _trace_id_var.set(prev)
+    else:
+        # Sync path: plain list push/pop, no Token allocation or HAMT copy
+        stack = _sync_stack()
+        stack.append(trace_id)
+        try:
+            yield trace_id
+        finally:
+            stack.pop()
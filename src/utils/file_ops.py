@@ -7,6 +7,7 @@ Constitutional compliance:
 - Section 9 (Error Handling): Explicit error handling, no silent failures
 """
 
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -17,7 +18,7 @@ def atomic_move(source: Path, destination: Path) -> None:
     """
     Atomically move a file from source to destination.
 
-    Uses pathlib.Path.rename() which is atomic on POSIX systems.
+    Uses os.rename() which is atomic on POSIX systems.
     Constitutional requirement (Section 4): File moves must be atomic.
 
     Args:
@@ -28,7 +29,7 @@ def atomic_move(source: Path, destination: Path) -> None:
         FileOperationError: If move fails (disk full, permissions, etc.)
     """
     try:
-        source.rename(destination)
+        os.rename(source, destination)
     except OSError as e:
         raise FileOperationError(
             f"Failed to move {source} to {destination}: {e}"
@@ -9,6 +9,7 @@ Idempotent: running ``initialize()`` on an existing vault only fills gaps;
 it never overwrites files that are already present.
 """
 
+import os
 from datetime import date
 from pathlib import Path
 
@@ -150,15 +151,20 @@ Inbox  →  Needs_Action  →  In_Progress  →  Done
 """
 
 
+def _count_md(folder: Path) -> int:
+    """Count ``*.md`` entries with one scandir pass (0 if folder is missing)."""
+    try:
+        with os.scandir(folder) as entries:
+            return sum(1 for entry in entries if entry.name.endswith(".md"))
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
+
+
 def _render_dashboard(vault_path: Path) -> str:
     """Render Dashboard.md with current folder counts."""
     rows = []
     for folder in CORE_FOLDERS:
-        count = (
-            sum(1 for _ in (vault_path / folder).glob("*.md"))
-            if (vault_path / folder).exists()
-            else 0
-        )
+        count = _count_md(vault_path / folder)
         rows.append(f"| {folder:<16} | {count} |")
 
     return (
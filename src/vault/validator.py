@@ -10,11 +10,21 @@ Exit semantics (when used as ``python -m src.vault.validator <vault>``):
   1 — one or more validation errors
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Callable
 
 import yaml
 
+# libyaml's C scanner/parser is ~20x faster than the pure-Python SafeLoader;
+# fall back silently when PyYAML was built without it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # ---------------------------------------------------------------------------
 # Result
 # ---------------------------------------------------------------------------
@@ -43,13 +53,20 @@ class TaskValidator:
 
     REQUIRED_FIELDS = ["Priority", "From"]
 
+    # (bytes needle, display form) pairs built once at class-definition
+    # time; searching the raw bytes skips the per-file UTF-8 decode since
+    # the field headers are plain ASCII
+    _NEEDLES = tuple(
+        (f"**{fld}**:".encode(), f"**{fld}**:") for fld in REQUIRED_FIELDS
+    )
+
     def validate(self, path: Path) -> ValidationResult:
-        text = path.read_text(encoding="utf-8")
+        data = path.read_bytes()
         errors: list[str] = []
 
-        for fld in self.REQUIRED_FIELDS:
-            if f"**{fld}**:" not in text:
-                errors.append(f"missing required field '**{fld}**:'")
+        for needle, display in self._NEEDLES:
+            if needle not in data:
+                errors.append(f"missing required field '{display}'")
 
         return ValidationResult(path=path, errors=errors)
 
@@ -67,17 +84,20 @@ class ApprovalValidator:
     VALID_STATUSES = {"pending", "approved", "rejected", "timeout"}
 
     def validate(self, path: Path) -> ValidationResult:
-        text = path.read_text(encoding="utf-8")
+        # Bytes-level split: only the frontmatter slice is handed to the
+        # parser, and libyaml accepts UTF-8 bytes directly, so the body
+        # is never decoded at all
+        raw = path.read_bytes()
         errors: list[str] = []
 
-        if not text.startswith("---"):
+        if not raw.startswith(b"---"):
             return ValidationResult(path=path, errors=["missing YAML frontmatter"])
 
-        end = text.find("---", 3)
+        end = raw.find(b"---", 3)
         if end == -1:
             return ValidationResult(path=path, errors=["unclosed YAML frontmatter"])
 
-        fm = yaml.safe_load(text[3:end]) or {}
+        fm = yaml.load(raw[3:end], Loader=_YamlLoader) or {}
 
         for key in self.REQUIRED_FM_KEYS:
             if key not in fm:
@@ -98,17 +118,18 @@ class BriefingValidator:
     REQUIRED_FM_KEYS = ["report_type", "total_tasks", "generated_at"]
 
     def validate(self, path: Path) -> ValidationResult:
-        text = path.read_text(encoding="utf-8")
+        # Same bytes-level frontmatter split as ApprovalValidator
+        raw = path.read_bytes()
         errors: list[str] = []
 
-        if not text.startswith("---"):
+        if not raw.startswith(b"---"):
             return ValidationResult(path=path, errors=["missing YAML frontmatter"])
 
-        end = text.find("---", 3)
+        end = raw.find(b"---", 3)
         if end == -1:
             return ValidationResult(path=path, errors=["unclosed YAML frontmatter"])
 
-        fm = yaml.safe_load(text[3:end]) or {}
+        fm = yaml.load(raw[3:end], Loader=_YamlLoader) or {}
         for key in self.REQUIRED_FM_KEYS:
             if key not in fm:
                 errors.append(f"missing frontmatter key '{key}'")
@@ -123,6 +144,26 @@ class BriefingValidator:
 _TASK_FOLDERS = ("Inbox", "Needs_Action", "In_Progress", "Done")
 
 
+def _md_files(folder: Path) -> list[Path] | None:
+    """Return sorted ``*.md`` paths in ``folder``, or None if it doesn't exist.
+
+    One scandir pass per folder: entry names and file type come straight
+    from the readdir buffer (d_type on Linux), so listing costs one
+    syscall per directory instead of an extra stat per entry as with
+    ``Path.glob``. The FileNotFoundError branch doubles as the existence
+    check, saving the up-front ``Path.exists`` stat as well.
+    """
+    try:
+        with os.scandir(folder) as entries:
+            return sorted(
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(".md") and entry.is_file(follow_symlinks=False)
+            )
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
 class VaultValidator:
     """
     Scan an entire vault and validate every .md file by folder type.
@@ -135,39 +176,52 @@ class VaultValidator:
         self._task = TaskValidator()
         self._approval = ApprovalValidator()
         self._briefing = BriefingValidator()
+        self._results: dict[str, list[ValidationResult]] | None = None
 
-    def validate_all(self) -> dict[str, list[ValidationResult]]:
-        results: dict[str, list[ValidationResult]] = {}
-
-        for folder in _TASK_FOLDERS:
-            folder_path = self.vault / folder
-            if folder_path.exists():
-                results[folder] = [
-                    self._task.validate(md) for md in sorted(folder_path.glob("*.md"))
-                ]
-
-        approvals = self.vault / "Approvals"
-        if approvals.exists():
-            results["Approvals"] = [
-                self._approval.validate(md) for md in sorted(approvals.glob("*.md"))
-            ]
+        # Folder -> bound validate method, built once; validate_all walks
+        # this table instead of branching per folder name
+        self._validators: dict[str, Callable[[Path], ValidationResult]] = {
+            **{folder: self._task.validate for folder in _TASK_FOLDERS},
+            "Approvals": self._approval.validate,
+            "Briefings": self._briefing.validate,
+        }
 
-        briefings = self.vault / "Briefings"
-        if briefings.exists():
-            results["Briefings"] = [
-                self._briefing.validate(md) for md in sorted(briefings.glob("*.md"))
+    def validate_all(self) -> dict[str, list[ValidationResult]]:
+        """Scan every folder, validating folders concurrently.
+
+        Validation is I/O-bound (file reads plus small YAML parses that
+        release the GIL in C code), so folders are fanned out over a
+        thread pool and the wall clock approaches the slowest folder
+        instead of the sum of all of them. Folder order in the result
+        dict is fixed regardless of completion order.
+        """
+        def _validate_folder(name, validate):
+            files = _md_files(self.vault / name)
+            if files is None:
+                return None
+            return [validate(md) for md in files]
+
+        with ThreadPoolExecutor(max_workers=min(16, len(self._validators))) as pool:
+            futures = [
+                (name, pool.submit(_validate_folder, name, validate))
+                for name, validate in self._validators.items()
             ]
+            results = {
+                name: folder_results
+                for name, future in futures
+                if (folder_results := future.result()) is not None
+            }
 
+        self._results = results
         return results
 
-    # Convenience queries
+    # Convenience queries — reuse the most recent scan when one exists
 
     @property
     def total_errors(self) -> int:
+        results = self._results if self._results is not None else self.validate_all()
         return sum(
-            len(r.errors)
-            for folder_results in self.validate_all().values()
-            for r in folder_results
+            len(r.errors) for folder_results in results.values() for r in folder_results
         )
 
     @property
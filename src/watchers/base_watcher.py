@@ -30,6 +30,10 @@ logger = get_logger(__name__)
 
 T = TypeVar("T")
 
+# Invalid cross-platform filename characters and internal spaces all map
+# to "_"; built once so sanitization is a single C-level translate pass
+_SANITIZE_TABLE = str.maketrans({c: "_" for c in '<>:"/\\|?*\0 '})
+
 
 class PermanentError(Exception):
     """Error that should not be retried (e.g., authentication failure)."""
@@ -200,13 +204,9 @@ class BaseWatcher(ABC):
             name, ext = filename.rsplit(".", 1)
             filename = name.rstrip() + "." + ext.lstrip()
 
-        # Remove invalid characters for Windows/Linux/macOS
-        invalid_chars = '<>:"/\\|?*\0'
-        for char in invalid_chars:
-            filename = filename.replace(char, "_")
-
-        # Replace remaining internal whitespace with underscores
-        filename = filename.replace(" ", "_")
+        # Replace invalid Windows/Linux/macOS characters and remaining
+        # internal whitespace with underscores in one translate pass
+        filename = filename.translate(_SANITIZE_TABLE)
 
         # Remove leading/trailing dots
         filename = filename.strip(".")
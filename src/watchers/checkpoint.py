@@ -6,6 +6,7 @@ and prevent duplicate processing.
 """
 
 import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -167,11 +168,18 @@ class CheckpointManager:
         Returns:
             List of watcher names
         """
-        checkpoints = []
-        for path in self.checkpoint_dir.glob("*.checkpoint.json"):
-            watcher_name = path.stem.replace(".checkpoint", "")
-            checkpoints.append(watcher_name)
-        return checkpoints
+        # scandir + endswith skips the fnmatch compile and per-entry
+        # Path construction that glob would do
+        suffix = ".checkpoint.json"
+        try:
+            with os.scandir(self.checkpoint_dir) as entries:
+                return [
+                    entry.name[: -len(suffix)]
+                    for entry in entries
+                    if entry.name.endswith(suffix)
+                ]
+        except FileNotFoundError:
+            return []
 
     def get_stats(self, watcher_name: str) -> dict:
         """
@@ -95,7 +95,7 @@ class CircuitBreaker:
 
     # Internal state (initialized in __post_init__)
     _state: CircuitState = field(default=CircuitState.CLOSED, init=False)
-    _last_failure_time: Optional[float] = field(default=None, init=False)
+    _last_failure_ns: Optional[int] = field(default=None, init=False)
     _failure_count: int = field(default=0, init=False)
     _success_count: int = field(default=0, init=False)
     _half_open_calls: int = field(default=0, init=False)
@@ -106,6 +106,9 @@ class CircuitBreaker:
         """Initialize mutable defaults."""
         self._lock = Lock()
         self._stats = CircuitBreakerStats()
+        # Monotonic nanoseconds for timeout bookkeeping: immune to
+        # wall-clock jumps (NTP/DST) and cheaper than time.time() floats
+        self._recovery_timeout_ns = int(self.recovery_timeout * 1e9)
 
     @property
     def state(self) -> CircuitState:
@@ -160,18 +163,17 @@ class CircuitBreaker:
         Returns:
             True if call should proceed, False if should fail fast
         """
-        now = time.time()
+        now = time.monotonic_ns()
 
         if self._state == CircuitState.CLOSED:
             return True
 
         elif self._state == CircuitState.OPEN:
             # Check if recovery timeout has passed
-            if self._last_failure_time is None:
+            if self._last_failure_ns is None:
                 return True
 
-            time_since_failure = now - self._last_failure_time
-            if time_since_failure >= self.recovery_timeout:
+            if now - self._last_failure_ns >= self._recovery_timeout_ns:
                 self._transition_to(CircuitState.HALF_OPEN)
                 return True
 
@@ -201,7 +203,7 @@ class CircuitBreaker:
         """Record a failed call (must hold lock)."""
         self._stats.failed_calls += 1
         self._stats.last_failure_time = datetime.now(timezone.utc)
-        self._last_failure_time = time.time()
+        self._last_failure_ns = time.monotonic_ns()
         self._failure_count += 1
         self._success_count = 0
 
@@ -227,16 +229,36 @@ class CircuitBreaker:
             CircuitBreakerError: If circuit is open
             Exception: Original exception if call fails
         """
+        # Fast path: CLOSED + success is the overwhelmingly common case
+        # and takes no lock. The state read and the integer += updates
+        # are each atomic under the GIL, and a success in CLOSED can
+        # never cause a state transition, so there is nothing to
+        # serialize; failures fall through to the locked recorder.
+        if self._state is CircuitState.CLOSED:
+            self._stats.total_calls += 1
+            try:
+                result = func()
+            except Exception as e:
+                with self._lock:
+                    self._record_failure(e)
+                raise
+
+            self._stats.successful_calls += 1
+            self._stats.last_success_time = datetime.now(timezone.utc)
+            self._failure_count = 0
+            self._success_count += 1
+            return result
+
         with self._lock:
             self._stats.total_calls += 1
 
             if not self._should_attempt():
                 self._stats.rejected_calls += 1
                 time_until_retry = 0.0
-                if self._last_failure_time:
+                if self._last_failure_ns:
+                    elapsed_ns = time.monotonic_ns() - self._last_failure_ns
                     time_until_retry = max(
-                        0,
-                        self.recovery_timeout - (time.time() - self._last_failure_time),
+                        0.0, (self._recovery_timeout_ns - elapsed_ns) / 1e9
                     )
 
                 raise CircuitBreakerError(
@@ -265,7 +287,7 @@ class CircuitBreaker:
             self._failure_count = 0
             self._success_count = 0
             self._half_open_calls = 0
-            self._last_failure_time = None
+            self._last_failure_ns = None
 
             logger.info(f"Circuit breaker '{self.name}' reset to CLOSED")
 
@@ -273,7 +295,7 @@ class CircuitBreaker:
         """Force circuit breaker to OPEN state (for testing/maintenance)."""
         with self._lock:
             self._transition_to(CircuitState.OPEN)
-            self._last_failure_time = time.time()
+            self._last_failure_ns = time.monotonic_ns()
 
     def force_close(self) -> None:
         """Force circuit breaker to CLOSED state."""
@@ -295,9 +317,18 @@ class CircuitBreakerRegistry:
         api_breaker = registry.get("external_api", failure_threshold=3)
     """
 
+    _NUM_SHARDS = 16
+
     def __init__(self):
-        self._breakers: dict[str, CircuitBreaker] = {}
-        self._lock = Lock()
+        # Name space is striped across independent (dict, lock) shards so
+        # concurrent get() calls for different names don't serialize on
+        # one registry-wide mutex
+        self._shards: list[tuple[dict[str, CircuitBreaker], Lock]] = [
+            ({}, Lock()) for _ in range(self._NUM_SHARDS)
+        ]
+
+    def _shard(self, name: str) -> tuple[dict[str, CircuitBreaker], Lock]:
+        return self._shards[hash(name) & (self._NUM_SHARDS - 1)]
 
     def get(
         self,
@@ -318,26 +349,32 @@ class CircuitBreakerRegistry:
         Returns:
             CircuitBreaker instance
         """
-        with self._lock:
-            if name not in self._breakers:
-                self._breakers[name] = CircuitBreaker(
+        breakers, lock = self._shard(name)
+        with lock:
+            if name not in breakers:
+                breakers[name] = CircuitBreaker(
                     name=name,
                     failure_threshold=failure_threshold,
                     recovery_timeout=recovery_timeout,
                     **kwargs,
                 )
-            return self._breakers[name]
+            return breakers[name]
 
     def get_all_stats(self) -> dict[str, CircuitBreakerStats]:
         """Get stats for all registered circuit breakers."""
-        with self._lock:
-            return {name: breaker.stats for name, breaker in self._breakers.items()}
+        stats: dict[str, CircuitBreakerStats] = {}
+        for breakers, lock in self._shards:
+            with lock:
+                for name, breaker in breakers.items():
+                    stats[name] = breaker.stats
+        return stats
 
     def reset_all(self) -> None:
         """Reset all circuit breakers."""
-        with self._lock:
-            for breaker in self._breakers.values():
-                breaker.reset()
+        for breakers, lock in self._shards:
+            with lock:
+                for breaker in breakers.values():
+                    breaker.reset()
 
 
 # Global registry for convenience
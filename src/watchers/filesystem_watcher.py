@@ -10,9 +10,14 @@ Constitutional Compliance:
 - Section 8: All events logged
 """
 
+import fnmatch
+import functools
 import hashlib
 import mimetypes
+import mmap
+import re
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -22,6 +27,11 @@ try:
 except ImportError:
     pathspec = None
 
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 try:
     from watchdog.observers import Observer
     from watchdog.events import FileSystemEventHandler, FileCreatedEvent
@@ -46,6 +56,27 @@ from .models import FileEvent
 
 logger = get_logger(__name__)
 
+# Below this size a single read_bytes beats mmap setup cost
+_MMAP_THRESHOLD = 65536  # 64 KiB
+
+# Bound on the (path, size, mtime_ns) -> hash memo; oldest entries evict
+_HASH_CACHE_MAX = 8192
+
+# Compiled .gitignore specs shared across watcher instances, keyed by
+# (path, mtime_ns) so an edited file recompiles; bounded LRU
+_GITIGNORE_CACHE: "OrderedDict[tuple[str, int], pathspec.PathSpec]" = OrderedDict()
+_GITIGNORE_CACHE_MAX = 64
+
+
+@functools.lru_cache(maxsize=256)
+def _mime_for_ext(ext: str) -> str:
+    """MIME type for a file extension, memoized per suffix.
+
+    Vault ingestion sees the same few extensions over and over; caching
+    turns the per-event guess_type normalization into one dict hit.
+    """
+    return mimetypes.types_map.get(ext.lower(), "application/octet-stream")
+
 
 class FileSystemWatcher(BaseWatcher, FileSystemEventHandler):
     """
@@ -99,6 +130,12 @@ class FileSystemWatcher(BaseWatcher, FileSystemEventHandler):
         ]
         self.max_hash_size = max_hash_size
 
+        # Compile the glob lists once into single alternation regexes;
+        # _should_ignore runs per filesystem event, and one C-level match
+        # beats re-translating every pattern each time
+        self._exclude_re = self._compile_patterns(self.exclude_patterns)
+        self._include_re = self._compile_patterns(self.include_patterns)
+
         # Initialize formatter
         self.formatter = MarkdownFormatter()
 
@@ -108,9 +145,20 @@ class FileSystemWatcher(BaseWatcher, FileSystemEventHandler):
         # Track processed files to avoid duplicates
         self._processed_files: set[str] = set()
 
+        # Content-hash memo keyed by (path, size, mtime_ns): unchanged
+        # files on rescan/re-rename cost a stat instead of a full rehash
+        self._hash_cache: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+
         # Observer instance (set in run())
         self._observer: Optional[Observer] = None
 
+    @staticmethod
+    def _compile_patterns(patterns: list[str]) -> Optional["re.Pattern[str]"]:
+        """Compile a list of glob patterns into one filename regex."""
+        if not patterns:
+            return None
+        return re.compile("|".join(fnmatch.translate(p) for p in patterns))
+
     def _load_gitignore(self) -> Optional["pathspec.PathSpec"]:
         """Load .gitignore patterns from watch directory."""
         if pathspec is None:
@@ -120,15 +168,29 @@ class FileSystemWatcher(BaseWatcher, FileSystemEventHandler):
             return None
 
         gitignore_path = self.watch_path / ".gitignore"
-        if not gitignore_path.exists():
+
+        try:
+            stat = gitignore_path.stat()
+        except FileNotFoundError:
             return None
 
+        # Unchanged files reuse the compiled spec across watcher
+        # instances; mtime in the key invalidates after edits
+        cache_key = (str(gitignore_path), stat.st_mtime_ns)
+        cached = _GITIGNORE_CACHE.get(cache_key)
+        if cached is not None:
+            _GITIGNORE_CACHE.move_to_end(cache_key)
+            return cached
+
         try:
             patterns = gitignore_path.read_text().splitlines()
             # Filter out empty lines and comments
             patterns = [p for p in patterns if p.strip() and not p.startswith("#")]
             spec = pathspec.PathSpec.from_lines("gitwildmatch", patterns)
             logger.info(f"Loaded {len(patterns)} .gitignore patterns")
+            _GITIGNORE_CACHE[cache_key] = spec
+            if len(_GITIGNORE_CACHE) > _GITIGNORE_CACHE_MAX:
+                _GITIGNORE_CACHE.popitem(last=False)
             return spec
         except Exception as e:
             logger.warning(f"Failed to load .gitignore: {e}")
@@ -145,40 +207,49 @@ class FileSystemWatcher(BaseWatcher, FileSystemEventHandler):
             True if file should be ignored
         """
         filename = file_path.name
-        relative_path = str(file_path.relative_to(self.watch_path))
 
-        # Check exclude patterns
-        for pattern in self.exclude_patterns:
-            if file_path.match(pattern):
-                logger.debug(f"Ignoring {filename}: matches exclude pattern {pattern}")
-                return True
+        # Check exclude patterns (single precompiled alternation)
+        if self._exclude_re is not None and self._exclude_re.match(filename):
+            logger.debug(f"Ignoring {filename}: matches exclude pattern")
+            return True
 
         # Check .gitignore patterns
-        if self._gitignore_spec and self._gitignore_spec.match_file(relative_path):
-            logger.debug(f"Ignoring {filename}: matches .gitignore pattern")
-            return True
+        if self._gitignore_spec:
+            relative_path = str(file_path.relative_to(self.watch_path))
+            if self._gitignore_spec.match_file(relative_path):
+                logger.debug(f"Ignoring {filename}: matches .gitignore pattern")
+                return True
 
         # Check include patterns (if specified)
-        if self.include_patterns:
-            matched = any(file_path.match(p) for p in self.include_patterns)
-            if not matched:
-                logger.debug(f"Ignoring {filename}: doesn't match include patterns")
-                return True
+        if self._include_re is not None and not self._include_re.match(filename):
+            logger.debug(f"Ignoring {filename}: doesn't match include patterns")
+            return True
 
         return False
 
     def _compute_hash(self, file_path: Path) -> str:
         """
-        Compute SHA256 hash of file content.
+        Compute content hash of file for change detection.
+
+        Uses xxHash3-128 when the xxhash library is available - the hash
+        is only used to detect duplicate/changed content, so a fast
+        non-cryptographic hash is sufficient and ~10x faster than SHA256
+        on page-cached files. Falls back to SHA256 when xxhash is not
+        installed.
+
+        Files below _MMAP_THRESHOLD are read in one read_bytes call;
+        larger files are mmap'd and hashed from the mapping in a single
+        shot, avoiding the Python-level chunk loop either way.
 
         Args:
             file_path: Path to file
 
         Returns:
-            SHA256 hash as hex string, or empty string if skipped
+            Content hash as hex string, or empty string if skipped
         """
         try:
-            file_size = file_path.stat().st_size
+            stat = file_path.stat()
+            file_size = stat.st_size
 
             # Skip hash for large files
             if self.max_hash_size > 0 and file_size > self.max_hash_size:
@@ -187,12 +258,33 @@ class FileSystemWatcher(BaseWatcher, FileSystemEventHandler):
                 )
                 return ""
 
-            sha256 = hashlib.sha256()
-            with file_path.open("rb") as f:
-                for chunk in iter(lambda: f.read(8192), b""):
-                    sha256.update(chunk)
-
-            return sha256.hexdigest()
+            # An unchanged file (same path, size, mtime) keeps its hash;
+            # rescans and re-renames cost a stat instead of a full read
+            cache_key = (str(file_path), file_size, stat.st_mtime_ns)
+            cached = self._hash_cache.get(cache_key)
+            if cached is not None:
+                self._hash_cache.move_to_end(cache_key)
+                return cached
+
+            if file_size < _MMAP_THRESHOLD:
+                # mmap setup dominates on small files; one read is cheaper
+                hasher = xxhash.xxh3_128() if xxhash is not None else hashlib.sha256()
+                hasher.update(file_path.read_bytes())
+                digest = hasher.hexdigest()
+            elif xxhash is not None:
+                with file_path.open("rb") as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        digest = xxhash.xxh3_128(memoryview(mm)).hexdigest()
+            else:
+                # SHA256 fallback: file_digest runs the whole read loop in
+                # C with a 256 KiB buffer and releases the GIL (OpenSSL
+                # dispatches to SHA-NI where the CPU has it)
+                with file_path.open("rb") as f:
+                    digest = hashlib.file_digest(f, "sha256").hexdigest()
+            self._hash_cache[cache_key] = digest
+            if len(self._hash_cache) > _HASH_CACHE_MAX:
+                self._hash_cache.popitem(last=False)
+            return digest
 
         except Exception as e:
             logger.error(f"Error computing hash for {file_path}: {e}")
@@ -208,8 +300,7 @@ class FileSystemWatcher(BaseWatcher, FileSystemEventHandler):
         Returns:
             MIME type string
         """
-        mime_type, _ = mimetypes.guess_type(str(file_path))
-        return mime_type or "application/octet-stream"
+        return _mime_for_ext(file_path.suffix)
 
     def on_created(self, event) -> None:
         """
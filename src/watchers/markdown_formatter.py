@@ -309,15 +309,16 @@ class MarkdownFormatter:
         # Ensure parent directory exists
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write atomically using temp file
+        # Write atomically using temp file. One pre-encoded write_bytes
+        # call: no TextIOWrapper layer, one write syscall per message
         temp_path = filepath.with_suffix(".tmp")
         try:
-            temp_path.write_text(content, encoding="utf-8")
+            temp_path.write_bytes(content.encode("utf-8"))
             temp_path.rename(filepath)
             logger.info(f"Markdown written to {filepath}")
             return filepath
-        except Exception as e:
-            # Clean up temp file on error
-            if temp_path.exists():
-                temp_path.unlink()
+        except Exception:
+            # Clean up temp file on error (missing_ok skips the extra
+            # exists() stat)
+            temp_path.unlink(missing_ok=True)
             raise
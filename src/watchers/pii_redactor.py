@@ -9,7 +9,7 @@ Constitutional Compliance:
 """
 
 import re
-from typing import NamedTuple
+from typing import Any, NamedTuple
 
 # Try to import the logging module, fall back to standard logging
 try:
@@ -25,13 +25,70 @@ logger = get_logger(__name__)
 
 
 class RedactionResult(NamedTuple):
-    """Result of PII redaction."""
+    """Result of PII redaction.
+
+    A NamedTuple keeps each result __dict__-free (plain tuple storage),
+    which matters when redact_dict allocates one per string leaf.
+    patterns_found is a tuple so clean results all share the empty ().
+    """
 
     text: str
-    patterns_found: list[str]
+    patterns_found: tuple[str, ...]
     redaction_count: int
 
 
+# Default PII patterns, compiled once at import: every PIIRedactor
+# instance shares these Pattern objects instead of re-compiling them
+_DEFAULT_PATTERNS = {
+    "email": {
+        "pattern": r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
+        "replacement": "[REDACTED_EMAIL]",
+    },
+    "phone_us": {
+        "pattern": r"\b(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b",
+        "replacement": "[REDACTED_PHONE]",
+    },
+    "phone_intl": {
+        "pattern": r"\+\d{1,3}[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}\b",
+        "replacement": "[REDACTED_PHONE]",
+    },
+    "ssn": {
+        "pattern": r"\b\d{3}[-.\s]?\d{2}[-.\s]?\d{4}\b",
+        "replacement": "[REDACTED_SSN]",
+    },
+    "credit_card": {
+        "pattern": r"\b(?:\d{4}[-.\s]?){3}\d{4}\b",
+        "replacement": "[REDACTED_CC]",
+    },
+    "ip_address": {
+        "pattern": r"\b(?:\d{1,3}\.){3}\d{1,3}\b",
+        "replacement": "[REDACTED_IP]",
+    },
+}
+
+_DEFAULT_COMPILED = {
+    name: (re.compile(config["pattern"], re.IGNORECASE), config["replacement"])
+    for name, config in _DEFAULT_PATTERNS.items()}
+
+
+def _combine(patterns: dict[str, dict[str, str]]) -> "re.Pattern[str]":
+    """Fuse all patterns into one named-group alternation.
+
+    A single combined scan replaces the per-pattern pass over the full
+    text; the matched group name selects the replacement. Alternation
+    order follows dict order, preserving the old per-pass priority.
+    """
+    return re.compile(
+        "|".join(
+            f"(?P<{name}>{config['pattern']})" for name, config in patterns.items()
+        ),
+        re.IGNORECASE,
+    )
+
+
+_DEFAULT_COMBINED = _combine(_DEFAULT_PATTERNS)
+
+
 class PIIRedactor:
     """
     Regex-based PII redaction for watcher scripts.
@@ -50,33 +107,9 @@ class PIIRedactor:
         Contact me at [REDACTED_EMAIL] or [REDACTED_PHONE]
     """
 
-    # Default PII patterns
-    DEFAULT_PATTERNS = {
-        "email": {
-            "pattern": r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
-            "replacement": "[REDACTED_EMAIL]",
-        },
-        "phone_us": {
-            "pattern": r"\b(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}\b",
-            "replacement": "[REDACTED_PHONE]",
-        },
-        "phone_intl": {
-            "pattern": r"\+\d{1,3}[-.\s]?\d{1,4}[-.\s]?\d{1,4}[-.\s]?\d{1,9}\b",
-            "replacement": "[REDACTED_PHONE]",
-        },
-        "ssn": {
-            "pattern": r"\b\d{3}[-.\s]?\d{2}[-.\s]?\d{4}\b",
-            "replacement": "[REDACTED_SSN]",
-        },
-        "credit_card": {
-            "pattern": r"\b(?:\d{4}[-.\s]?){3}\d{4}\b",
-            "replacement": "[REDACTED_CC]",
-        },
-        "ip_address": {
-            "pattern": r"\b(?:\d{1,3}\.){3}\d{1,3}\b",
-            "replacement": "[REDACTED_IP]",
-        },
-    }
+    # Default PII patterns (kept as a class attribute for callers that
+    # inspect or extend them; compiled forms live at module scope)
+    DEFAULT_PATTERNS = _DEFAULT_PATTERNS
 
     def __init__(self, custom_patterns: dict[str, dict[str, str]] | None = None):
         """
@@ -87,14 +120,21 @@ class PIIRedactor:
                 Format: {"pattern_name": {"pattern": "regex", "replacement": "[TEXT]"}}
         """
         self.patterns = self.DEFAULT_PATTERNS.copy()
+
+        # Share the import-time compiled defaults; the shallow dict copy
+        # keeps add_pattern from leaking across instances. Only custom
+        # patterns pay a re.compile here.
+        self._compiled_patterns = dict(_DEFAULT_COMPILED)
         if custom_patterns:
             self.patterns.update(custom_patterns)
-
-        # Compile patterns for performance
-        self._compiled_patterns = {
-            name: (re.compile(config["pattern"], re.IGNORECASE), config["replacement"])
-            for name, config in self.patterns.items()
-        }
+            for name, config in custom_patterns.items():
+                self._compiled_patterns[name] = (
+                    re.compile(config["pattern"], re.IGNORECASE),
+                    config["replacement"],
+                )
+            self._combined_re = _combine(self.patterns)
+        else:
+            self._combined_re = _DEFAULT_COMBINED
 
     def redact(self, text: str) -> RedactionResult:
         """
@@ -109,19 +149,22 @@ class PIIRedactor:
         if not isinstance(text, str):
             text = str(text)
 
-        patterns_found = []
-        redaction_count = 0
-        redacted_text = text
+        # One combined scan over the text; the matched group name picks
+        # the replacement and feeds the per-pattern tally
+        counts: dict[str, int] = {}
 
-        for pattern_name, (
-            compiled_pattern,
-            replacement,
-        ) in self._compiled_patterns.items():
-            matches = compiled_pattern.findall(redacted_text)
-            if matches:
-                patterns_found.append(pattern_name)
-                redaction_count += len(matches)
-                redacted_text = compiled_pattern.sub(replacement, redacted_text)
+        def _replace(match: "re.Match[str]") -> str:
+            name = match.lastgroup
+            counts[name] = counts.get(name, 0) + 1
+            return self._compiled_patterns[name][1]
+
+        redacted_text = self._combined_re.sub(_replace, text)
+        patterns_found = (
+            tuple(name for name in self._compiled_patterns if name in counts)
+            if counts
+            else ()
+        )
+        redaction_count = sum(counts.values())
 
         if redaction_count > 0:
             logger.debug(
@@ -137,7 +180,11 @@ class PIIRedactor:
 
     def redact_dict(self, data: dict) -> dict:
         """
-        Recursively redact PII from dictionary values.
+        Redact PII from dictionary values, descending into nested data.
+
+        The traversal is iterative — a work stack of (source, copy)
+        container pairs — so deeply nested payloads cost no Python
+        frame per level and can't hit the recursion limit.
 
         Args:
             data: Dictionary to redact
@@ -145,23 +192,31 @@ class PIIRedactor:
         Returns:
             New dictionary with redacted string values
         """
-        redacted = {}
-        for key, value in data.items():
-            if isinstance(value, dict):
-                redacted[key] = self.redact_dict(value)
-            elif isinstance(value, list):
-                redacted[key] = [
-                    (
-                        self.redact_dict(item)
-                        if isinstance(item, dict)
-                        else self.redact(item).text if isinstance(item, str) else item
-                    )
-                    for item in value
-                ]
-            elif isinstance(value, str):
-                redacted[key] = self.redact(value).text
-            else:
-                redacted[key] = value
+        redacted: dict = {}
+        stack: list[tuple[Any, Any]] = [(data, redacted)]
+
+        while stack:
+            src, dst = stack.pop()
+            if isinstance(src, dict):
+                for key, value in src.items():
+                    if isinstance(value, (dict, list)):
+                        dst[key] = child = type(value)()
+                        stack.append((value, child))
+                    elif isinstance(value, str):
+                        dst[key] = self.redact(value).text
+                    else:
+                        dst[key] = value
+            else:  # list
+                for item in src:
+                    if isinstance(item, dict):
+                        child = {}
+                        dst.append(child)
+                        stack.append((item, child))
+                    elif isinstance(item, str):
+                        dst.append(self.redact(item).text)
+                    else:
+                        dst.append(item)
+
         return redacted
 
     def add_pattern(self, name: str, pattern: str, replacement: str) -> None:
@@ -178,6 +233,7 @@ class PIIRedactor:
             re.compile(pattern, re.IGNORECASE),
             replacement,
         )
+        self._combined_re = _combine(self.patterns)
         logger.info(f"Added PII pattern: {name}")
 
     def contains_pii(self, text: str) -> bool:
@@ -190,7 +246,4 @@ class PIIRedactor:
         Returns:
             True if PII detected, False otherwise
         """
-        for _, (compiled_pattern, _) in self._compiled_patterns.items():
-            if compiled_pattern.search(text):
-                return True
-        return False
+        return self._combined_re.search(text) is not None
@@ -14,20 +14,23 @@ Constitutional Compliance:
 import hashlib
 import hmac
 import os
+import re
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
 from threading import Thread
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
-# Try to import Flask
-try:
-    from flask import Flask, request, jsonify
+if TYPE_CHECKING:
+    from flask import Flask
 
-    FLASK_AVAILABLE = True
+# orjson's C parser is ~3x faster than stdlib json on webhook-sized
+# payloads; fall back silently when it isn't installed
+try:
+    from orjson import loads as _json_loads
 except ImportError:
-    FLASK_AVAILABLE = False
-    Flask = None
+    from json import loads as _json_loads
 
 # Try requests for media download
 try:
@@ -55,6 +58,14 @@ from .pii_redactor import PIIRedactor
 
 logger = get_logger(__name__)
 
+# Phone-number normalization: one regex pass drops every non-digit
+# (+, -, spaces, parentheses) instead of chained str.replace calls
+_NON_DIGITS = re.compile(r"\D")
+
+# Most recent message IDs kept for duplicate detection; oldest entries
+# are evicted so a long-running webhook server stays bounded
+_DEDUP_MAX = 10_000
+
 
 class WhatsAppAuthenticationError(PermanentError):
     """WhatsApp webhook authentication failed."""
@@ -121,6 +132,16 @@ class WhatsAppWatcher(BaseWatcher):
         self.verify_token = verify_token or os.environ.get("WHATSAPP_VERIFY_TOKEN", "")
         self.app_secret = app_secret or os.environ.get("WHATSAPP_APP_SECRET", "")
         self.access_token = access_token or os.environ.get("WHATSAPP_ACCESS_TOKEN", "")
+        # Encoded once here; _verify_signature runs per webhook POST.
+        # The HMAC template has the key schedule (inner/outer pads)
+        # already derived, so each verify clones it with .copy() instead
+        # of re-deriving from the key
+        self._secret_bytes = self.app_secret.encode("utf-8") if self.app_secret else None
+        self._hmac_template = (
+            hmac.new(self._secret_bytes, digestmod=hashlib.sha256)
+            if self._secret_bytes
+            else None
+        )
 
         self.port = port
         self.host = host
@@ -128,14 +149,13 @@ class WhatsAppWatcher(BaseWatcher):
         self.max_media_size = max_media_size
 
         # Normalize phone numbers on storage so comparison with normalized input works
-        def _normalize(number: str) -> str:
-            return number.lstrip("+").replace("-", "").replace(" ", "")
-
         self.sender_whitelist = (
-            set(_normalize(n) for n in sender_whitelist) if sender_whitelist else None
+            frozenset(_NON_DIGITS.sub("", n) for n in sender_whitelist)
+            if sender_whitelist
+            else None
         )
-        self.sender_blacklist = (
-            set(_normalize(n) for n in sender_blacklist) if sender_blacklist else set()
+        self.sender_blacklist = frozenset(
+            _NON_DIGITS.sub("", n) for n in sender_blacklist or ()
         )
 
         # Initialize helpers
@@ -143,11 +163,12 @@ class WhatsAppWatcher(BaseWatcher):
         self.pii_redactor = PIIRedactor()
 
         # Flask app (initialized in run())
-        self._app: Optional[Flask] = None
+        self._app: Optional["Flask"] = None
         self._server_thread: Optional[Thread] = None
 
-        # Track processed message IDs
-        self._processed_ids: set[str] = set()
+        # Track processed message IDs (insertion-ordered so the oldest
+        # can be evicted once _DEDUP_MAX is reached)
+        self._processed_ids: OrderedDict[str, None] = OrderedDict()
 
     def _verify_signature(self, payload: bytes, signature: str) -> bool:
         """
@@ -160,29 +181,30 @@ class WhatsAppWatcher(BaseWatcher):
         Returns:
             True if signature is valid
         """
-        if not self.app_secret:
+        if self._hmac_template is None:
             logger.warning("No app secret configured, skipping signature verification")
             return True
 
         if not signature:
             return False
 
-        # Extract signature from "sha256=<signature>"
-        if signature.startswith("sha256="):
-            signature = signature[7:]
+        # Compare raw digests rather than hexdigest strings: half the
+        # bytes through compare_digest, and a malformed (non-hex) header
+        # is rejected without computing our own MAC
+        try:
+            provided = bytes.fromhex(signature.removeprefix("sha256="))
+        except ValueError:
+            return False
 
-        expected = hmac.new(
-            self.app_secret.encode("utf-8"),
-            payload,
-            hashlib.sha256,
-        ).hexdigest()
+        mac = self._hmac_template.copy()
+        mac.update(payload)
 
-        return hmac.compare_digest(expected, signature)
+        return hmac.compare_digest(mac.digest(), provided)
 
     def _should_process_sender(self, phone_number: str) -> bool:
         """Check if sender should be processed based on whitelist/blacklist."""
         # Normalize phone number
-        normalized = phone_number.lstrip("+").replace("-", "").replace(" ", "")
+        normalized = _NON_DIGITS.sub("", phone_number)
 
         # Check blacklist
         if normalized in self.sender_blacklist:
@@ -410,8 +432,10 @@ class WhatsAppWatcher(BaseWatcher):
             output_path = self.inbox_path / output_filename
             self.formatter.write_to_file(markdown_content, output_path)
 
-            # Mark as processed
-            self._processed_ids.add(message_id)
+            # Mark as processed, evicting the oldest ID once full
+            self._processed_ids[message_id] = None
+            if len(self._processed_ids) > _DEDUP_MAX:
+                self._processed_ids.popitem(last=False)
 
             # Update checkpoint
             checkpoint = self.load_checkpoint()
@@ -439,8 +463,18 @@ class WhatsAppWatcher(BaseWatcher):
             self.increment_errors(checkpoint)
             return False
 
-    def _create_flask_app(self) -> Flask:
+    def _create_flask_app(self) -> "Flask":
         """Create and configure Flask app for webhook."""
+        # Imported here rather than at module top so polling-only and
+        # CLI uses never pay the Flask/Werkzeug/Jinja2 import cost
+        try:
+            from flask import Flask, jsonify, request
+        except ImportError:
+            raise ImportError(
+                "Flask required for WhatsApp watcher. "
+                "Install with: pip install flask"
+            )
+
         app = Flask(__name__)
 
         @app.route("/webhook", methods=["GET"])
@@ -460,15 +494,19 @@ class WhatsAppWatcher(BaseWatcher):
         @app.route("/webhook", methods=["POST"])
         def receive_webhook():
             """Receive incoming WhatsApp messages."""
+            # Read the raw body once (uncached) and reuse it for both
+            # signature verification and JSON parsing
+            raw = request.get_data(cache=False)
+
             # Verify signature
             signature = request.headers.get("X-Hub-Signature-256", "")
-            if not self._verify_signature(request.data, signature):
+            if not self._verify_signature(raw, signature):
                 logger.warning("Invalid webhook signature")
                 return jsonify({"error": "Invalid signature"}), 403
 
             # Parse payload
             try:
-                data = request.json
+                data = _json_loads(raw)
             except Exception as e:
                 logger.error(f"Failed to parse webhook payload: {e}")
                 return jsonify({"error": "Invalid JSON"}), 400
@@ -519,12 +557,6 @@ class WhatsAppWatcher(BaseWatcher):
 
         Runs Flask server to receive WhatsApp webhooks.
         """
-        if not FLASK_AVAILABLE:
-            raise ImportError(
-                "Flask required for WhatsApp watcher. "
-                "Install with: pip install flask"
-            )
-
         if not self.verify_token:
             raise WhatsAppAuthenticationError(
                 "No verify token configured. Set WHATSAPP_VERIFY_TOKEN environment variable."
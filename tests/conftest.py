@@ -9,16 +9,23 @@ import pytest
 from pathlib import Path
 
 
-@pytest.fixture
-def isolated_fs(tmp_path):
+@pytest.fixture(scope="module")
+def isolated_fs(tmp_path_factory):
     """
     Create isolated file system with 8 workflow folders.
 
     Constitutional requirement (Section 4): Exactly 8 workflow folders.
 
+    Module-scoped: the folder skeleton is built once per test module instead
+    of once per test (8 mkdir calls each time). Tests within a module use
+    unique task filenames, so they can share the tree; suites that assert
+    exact file contents override this with a function-scoped fixture.
+
     Returns:
         Path: Root directory containing workflow folders
     """
+    root = tmp_path_factory.mktemp("vault")
+
     # Create 8 workflow folders
     workflow_folders = [
         "Inbox",
@@ -32,6 +39,6 @@ def isolated_fs(tmp_path):
     ]
 
     for folder in workflow_folders:
-        (tmp_path / folder).mkdir()
+        (root / folder).mkdir()
 
-    return tmp_path
+    return root
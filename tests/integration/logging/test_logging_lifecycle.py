@@ -260,10 +260,14 @@ class TestLoggingLifecycle:
         logger = init_logging(log_dir=temp_log_dir, async_enabled=True)
         await logger.start_async_writer()
 
-        # Measure operation duration
+        # Measure operation duration (single record on exit; log_start=True
+        # adds the entry record)
         with logger.measure_duration("test_operation"):
             time.sleep(0.01)  # 10ms
 
+        with logger.measure_duration("traced_operation", log_start=True):
+            pass
+
         await logger.flush()
         await logger.stop_async_writer()
 
@@ -272,17 +276,18 @@ class TestLoggingLifecycle:
         content = log_files[0].read_text()
         lines = content.strip().split("\n")
 
-        # Should have start and end messages
-        assert len(lines) == 2
-
-        start_entry = json.loads(lines[0])
-        assert "test_operation started" in start_entry["message"]
+        # One record for the default form, two for log_start=True
+        assert len(lines) == 3
 
-        end_entry = json.loads(lines[1])
+        end_entry = json.loads(lines[0])
         assert "test_operation complete" in end_entry["message"]
         assert "duration_ms" in end_entry
         assert end_entry["duration_ms"] >= 10  # At least 10ms
 
+        start_entry = json.loads(lines[1])
+        assert "traced_operation started" in start_entry["message"]
+        assert "traced_operation complete" in json.loads(lines[2])["message"]
+
 
 class TestLogFileManagement:
     """Integration tests for log file management."""
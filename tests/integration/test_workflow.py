@@ -263,9 +263,10 @@ This task tests atomicity on failure.
 
         task = TaskFile.from_file(task_path)
 
-        # Mock atomic_move to fail
+        # Mock atomic_move to fail (patch target must match the module
+        # identity the test imports: control_plane, not src.control_plane)
         with patch(
-            "src.control_plane.state_machine.atomic_move",
+            "control_plane.state_machine.atomic_move",
             side_effect=FileOperationError("Disk full"),
         ):
             with pytest.raises(FileOperationError):
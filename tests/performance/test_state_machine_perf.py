@@ -0,0 +1,56 @@
+"""
+Performance benchmark: StateMachine.validate_transition
+
+Guards the class-level frozenset transition table against regressions
+that reintroduce per-call work (e.g. rebuilding the table inside
+validate_transition or an O(n) scan over the edges).
+
+Constitutional compliance: Section 9 (performance requirements).
+"""
+
+import time
+
+import pytest
+
+from control_plane.models import WorkflowState
+from control_plane.state_machine import StateMachine
+
+# Every (from, to) pair, valid and forbidden alike — 49 lookups per sweep
+_ALL_PAIRS = [(a, b) for a in WorkflowState for b in WorkflowState]
+
+
+@pytest.fixture(scope="module")
+def sm(tmp_path_factory):
+    """One StateMachine rooted in a throwaway dir (keeps Logs/ out of cwd)."""
+    return StateMachine(root_dir=tmp_path_factory.mktemp("sm_perf"))
+
+
+class TestValidateTransitionPerformance:
+    """Microbenchmark for the pure transition-table lookup."""
+
+    def test_validate_transition_is_constant_time_lookup(self, sm):
+        """Full-matrix sweep should average well under 5μs per call."""
+        sweeps = 1000
+
+        # Warm-up: fault in enum hashing and the class-level table
+        for a, b in _ALL_PAIRS:
+            sm.validate_transition(a, b)
+
+        start = time.perf_counter()
+        for _ in range(sweeps):
+            for a, b in _ALL_PAIRS:
+                sm.validate_transition(a, b)
+        elapsed = time.perf_counter() - start
+
+        per_call_us = elapsed / (sweeps * len(_ALL_PAIRS)) * 1e6
+        # Generous budget (CI variance): a frozenset membership test plus
+        # call overhead is ~0.1-0.5μs; a per-call table rebuild blows this
+        assert per_call_us < 5.0, (
+            f"validate_transition averaged {per_call_us:.2f}μs/call "
+            f"(expected < 5μs — did the table move back into the call path?)"
+        )
+
+        print(
+            f"\n✓ validate_transition: {per_call_us:.3f}μs/call "
+            f"over {sweeps * len(_ALL_PAIRS)} calls"
+        )
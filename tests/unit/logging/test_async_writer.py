@@ -12,12 +12,14 @@ Tests cover:
 
 import asyncio
 import json
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
+import pytest_asyncio
 
-from src.fte_logging.async_writer import AsyncWriter
+from src.fte_logging.async_writer import LIBURING_AVAILABLE, AsyncWriter
 from src.fte_logging.models import ExceptionInfo, LogEntry, LogLevel, StackFrame
 
 
@@ -31,10 +33,10 @@ def temp_log_dir(tmp_path):
 
 @pytest.fixture
 def sample_log_entry():
-    """Create sample LogEntry for testing."""
+    """Create sample LogEntry for testing (ns timestamp, hydrated lazily)."""
     return LogEntry(
         trace_id="01HQ8Z9X0ABCDEFGHIJKLMNOPQ",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=time.time_ns(),
         level=LogLevel.INFO,
         module="test.module",
         message="Test log message",
@@ -76,7 +78,7 @@ class TestAsyncWriterLifecycle:
         await writer.start()
 
         # Write entry
-        await writer.write(sample_log_entry)
+        writer.write(sample_log_entry)
 
         # Stop (should flush)
         await writer.stop()
@@ -96,26 +98,39 @@ class TestAsyncWriterLifecycle:
         writer = AsyncWriter(log_dir=temp_log_dir)
 
         with pytest.raises(RuntimeError, match="not started"):
-            await writer.write(sample_log_entry)
+            writer.write(sample_log_entry)
+
+
+@pytest_asyncio.fixture(loop_scope="class", scope="class")
+async def shared_writer(tmp_path_factory):
+    """Single long-lived AsyncWriter shared within a test class."""
+    writer = AsyncWriter(
+        log_dir=tmp_path_factory.mktemp("shared"),
+        flush_interval_s=0.1,  # Fast flush for testing
+    )
+    await writer.start()
+    yield writer
+    await writer.stop()
 
 
 class TestAsyncWriting:
-    """Tests for async writing functionality."""
+    """Tests for async writing functionality.
 
-    @pytest.mark.asyncio
-    async def test_write_single_entry(self, temp_log_dir, sample_log_entry):
-        """Should write a single log entry to file."""
-        writer = AsyncWriter(
-            log_dir=temp_log_dir, flush_interval_s=0.1  # Fast flush for testing
-        )
-        await writer.start()
+    The core write tests share one class-scoped writer (started/stopped
+    once) and isolate their file assertions via set_log_dir(tmp_path).
+    """
 
-        await writer.write(sample_log_entry)
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_write_single_entry(
+        self, shared_writer, temp_log_dir, sample_log_entry
+    ):
+        """Should write a single log entry to file."""
+        shared_writer.set_log_dir(temp_log_dir)
 
-        # Wait for flush
-        await asyncio.sleep(0.2)
+        shared_writer.write(sample_log_entry)
 
-        await writer.stop()
+        # Deterministic flush instead of sleeping past the interval
+        await shared_writer.flush()
 
         # Verify log file
         log_files = list(temp_log_dir.glob("*.log"))
@@ -129,11 +144,10 @@ class TestAsyncWriting:
         assert data["module"] == "test.module"
         assert data["message"] == "Test log message"
 
-    @pytest.mark.asyncio
-    async def test_write_multiple_entries(self, temp_log_dir):
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_write_multiple_entries(self, shared_writer, temp_log_dir):
         """Should write multiple log entries."""
-        writer = AsyncWriter(log_dir=temp_log_dir, flush_interval_s=0.1)
-        await writer.start()
+        shared_writer.set_log_dir(temp_log_dir)
 
         # Write multiple entries
         for i in range(5):
@@ -144,10 +158,40 @@ class TestAsyncWriting:
                 module="test",
                 message=f"Message {i}",
             )
-            await writer.write(entry)
+            shared_writer.write(entry)
+
+        # Deterministic flush instead of sleeping past the interval
+        await shared_writer.flush()
+
+        # Verify all entries written
+        log_files = list(temp_log_dir.glob("*.log"))
+        content = log_files[0].read_text()
+        lines = content.strip().split("\n")
 
-        # Wait for flush
-        await asyncio.sleep(0.2)
+        assert len(lines) == 5
+        for i, line in enumerate(lines):
+            data = json.loads(line)
+            assert data["message"] == f"Message {i}"
+
+    @pytest.mark.skipif(not LIBURING_AVAILABLE, reason="liburing not available")
+    @pytest.mark.asyncio
+    async def test_write_multiple_entries_with_uring(self, temp_log_dir):
+        """Should write multiple log entries via the io_uring flush path."""
+        writer = AsyncWriter(log_dir=temp_log_dir, flush_interval_s=0.1, use_uring=True)
+        await writer.start()
+
+        for i in range(5):
+            entry = LogEntry(
+                trace_id=f"trace-{i}",
+                timestamp=datetime.now(timezone.utc),
+                level=LogLevel.INFO,
+                module="test",
+                message=f"Message {i}",
+            )
+            writer.write(entry)
+
+        # Deterministic flush instead of sleeping past the interval
+        await writer.flush()
 
         await writer.stop()
 
@@ -162,7 +206,39 @@ class TestAsyncWriting:
             assert data["message"] == f"Message {i}"
 
     @pytest.mark.asyncio
-    async def test_write_entry_with_all_fields(self, temp_log_dir):
+    async def test_write_multiple_entries_with_mmap(self, temp_log_dir):
+        """Should write multiple log entries via the mmap flush path."""
+        writer = AsyncWriter(log_dir=temp_log_dir, flush_interval_s=0.1, use_mmap=True)
+        await writer.start()
+
+        for i in range(5):
+            entry = LogEntry(
+                trace_id=f"trace-{i}",
+                timestamp=datetime.now(timezone.utc),
+                level=LogLevel.INFO,
+                module="test",
+                message=f"Message {i}",
+            )
+            writer.write(entry)
+
+        # Deterministic flush instead of sleeping past the interval
+        await writer.flush()
+
+        # stop() truncates the mapped file back to its real size
+        await writer.stop()
+
+        # Verify all entries written
+        log_files = list(temp_log_dir.glob("*.log"))
+        content = log_files[0].read_text()
+        lines = content.strip().split("\n")
+
+        assert len(lines) == 5
+        for i, line in enumerate(lines):
+            data = json.loads(line)
+            assert data["message"] == f"Message {i}"
+
+    @pytest.mark.asyncio(loop_scope="class")
+    async def test_write_entry_with_all_fields(self, shared_writer, temp_log_dir):
         """Should serialize all LogEntry fields correctly."""
         exc = ExceptionInfo(
             type="ValueError",
@@ -191,12 +267,10 @@ class TestAsyncWriting:
             tags=["error", "test"],
         )
 
-        writer = AsyncWriter(log_dir=temp_log_dir, flush_interval_s=0.1)
-        await writer.start()
+        shared_writer.set_log_dir(temp_log_dir)
 
-        await writer.write(entry)
-        await asyncio.sleep(0.2)
-        await writer.stop()
+        shared_writer.write(entry)
+        await shared_writer.flush()
 
         # Verify serialization
         log_files = list(temp_log_dir.glob("*.log"))
@@ -234,10 +308,10 @@ class TestBuffering:
                 module="test",
                 message=f"Message {i}",
             )
-            await writer.write(entry)
+            writer.write(entry)
 
-        # Wait for buffer flush
-        await asyncio.sleep(0.2)
+        # Wait for the size-triggered background flush
+        await asyncio.wait_for(writer.flushed.wait(), timeout=2.0)
 
         await writer.stop()
 
@@ -266,10 +340,10 @@ class TestBuffering:
             module="test",
             message="Test",
         )
-        await writer.write(entry)
+        writer.write(entry)
 
-        # Wait for time interval flush
-        await asyncio.sleep(0.2)
+        # Wait for the time-triggered background flush
+        await asyncio.wait_for(writer.flushed.wait(), timeout=2.0)
 
         # Entry should be flushed even though buffer not full
         log_files = list(temp_log_dir.glob("*.log"))
@@ -288,7 +362,7 @@ class TestBuffering:
         )
         await writer.start()
 
-        await writer.write(sample_log_entry)
+        writer.write(sample_log_entry)
 
         # Manual flush
         await writer.flush()
@@ -300,6 +374,54 @@ class TestBuffering:
         await writer.stop()
 
 
+class TestShardedMode:
+    """Tests for per-thread sharded queues."""
+
+    @pytest.mark.asyncio
+    async def test_sharded_writes_from_threads(self, temp_log_dir):
+        """Sharded mode should collect entries from multiple threads."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        writer = AsyncWriter(log_dir=temp_log_dir, sharded=True)
+        await writer.start()
+
+        def produce(i):
+            writer.write(
+                LogEntry(
+                    trace_id="01HQ8Z9X0ABCDEFGHIJKLMNOPQ",
+                    timestamp=time.time_ns(),
+                    level=LogLevel.INFO,
+                    module="test.module",
+                    message=f"Threaded message {i}",
+                )
+            )
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(produce, range(50)))
+
+        await writer.flush()
+        await writer.stop()
+
+        log_files = list(temp_log_dir.glob("*.log"))
+        assert len(log_files) == 1
+        lines = log_files[0].read_text().strip().split("\n")
+        assert len(lines) == 50
+
+    @pytest.mark.asyncio
+    async def test_sharded_flush_on_stop(self, temp_log_dir, sample_log_entry):
+        """stop() should drain all shards."""
+        writer = AsyncWriter(log_dir=temp_log_dir, sharded=True)
+        await writer.start()
+
+        for _ in range(5):
+            writer.write(sample_log_entry)
+        await writer.stop()
+
+        log_files = list(temp_log_dir.glob("*.log"))
+        assert len(log_files) == 1
+        assert len(log_files[0].read_text().strip().split("\n")) == 5
+
+
 class TestFileRotation:
     """Tests for file rotation (daily and size-based)."""
 
@@ -316,8 +438,8 @@ class TestFileRotation:
             module="test",
             message="Test",
         )
-        await writer.write(entry)
-        await asyncio.sleep(0.2)
+        writer.write(entry)
+        await writer.flush()
         await writer.stop()
 
         # Verify filename format: YYYY-MM-DD.log
@@ -343,9 +465,9 @@ class TestFileRotation:
                 module="test",
                 message=f"Message {i}",
             )
-            await writer.write(entry)
+            writer.write(entry)
 
-        await asyncio.sleep(0.2)
+        await writer.flush()
         await writer.stop()
 
         # Verify NDJSON format
@@ -378,10 +500,8 @@ class TestErrorHandling:
                 module="test",
                 message=f"Message {i}",
             )
-            try:
-                await asyncio.wait_for(writer.write(entry), timeout=0.1)
-            except asyncio.TimeoutError:
-                break
+            # write() is non-blocking; overflow policy handles a full queue
+            writer.write(entry)
 
         # Should not hang
         await writer.stop()
@@ -392,8 +512,8 @@ class TestErrorHandling:
         writer = AsyncWriter(log_dir=temp_log_dir, flush_interval_s=0.1)
         await writer.start()
 
-        await writer.write(sample_log_entry)
-        await asyncio.sleep(0.2)
+        writer.write(sample_log_entry)
+        await asyncio.wait_for(writer.flushed.wait(), timeout=2.0)
 
         # Buffer should be empty after flush
         assert len(writer._buffer) == 0
@@ -407,8 +527,6 @@ class TestPerformance:
     @pytest.mark.asyncio
     async def test_write_overhead(self, temp_log_dir):
         """write() should have < 5μs overhead (queue put operation)."""
-        import time
-
         writer = AsyncWriter(
             log_dir=temp_log_dir, buffer_size=10000, flush_interval_s=10.0
         )
@@ -416,7 +534,7 @@ class TestPerformance:
 
         entry = LogEntry(
             trace_id="test",
-            timestamp=datetime.now(timezone.utc),
+            timestamp=time.time_ns(),
             level=LogLevel.INFO,
             module="test",
             message="Test",
@@ -424,13 +542,13 @@ class TestPerformance:
 
         # Warm up
         for _ in range(100):
-            await writer.write(entry)
+            writer.write(entry)
 
         # Measure write overhead
         iterations = 1000
         start = time.perf_counter()
         for _ in range(iterations):
-            await writer.write(entry)
+            writer.write(entry)
         end = time.perf_counter()
 
         avg_time_us = ((end - start) / iterations) * 1_000_000
@@ -17,6 +17,14 @@ from src.fte_logging.config import from_env, from_file
 from src.fte_logging.models import LoggerConfig, LogLevel
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _warm_yaml(tmp_path_factory):
+    """Prime the YAML parser once per worker (one-time libyaml load)."""
+    warm_file = tmp_path_factory.mktemp("warm") / "warm.yaml"
+    warm_file.write_text("level: INFO\n")
+    from_file(warm_file)
+
+
 class TestLoggerConfigDefaults:
     """Tests for LoggerConfig default values."""
 
@@ -180,12 +188,12 @@ module_levels:
 class TestFromEnv:
     """Tests for loading configuration from environment variables."""
 
-    def test_from_env_minimal(self):
+    def test_from_env_minimal(self, monkeypatch):
         """from_env should load with minimal environment."""
         # Clear any existing LOGGING_ variables
         for key in list(os.environ.keys()):
             if key.startswith("LOGGING_"):
-                del os.environ[key]
+                monkeypatch.delenv(key, raising=False)
 
         config = from_env()
 
@@ -193,7 +201,7 @@ class TestFromEnv:
         assert config.level == LogLevel.INFO
         assert config.log_dir == Path("./Logs")
 
-    def test_from_env_full(self):
+    def test_from_env_full(self, monkeypatch):
         """from_env should load all config from environment."""
         env_vars = {
             "LOGGING_LOG_DIR": "/tmp/logs",
@@ -211,45 +219,37 @@ class TestFromEnv:
         }
 
         for key, value in env_vars.items():
-            os.environ[key] = value
-
-        try:
-            config = from_env()
-
-            assert config.log_dir == Path("/tmp/logs")
-            assert config.level == LogLevel.DEBUG
-            assert config.module_levels == {
-                "src.test": LogLevel.WARNING,
-                "src.other": LogLevel.ERROR,
-            }
-            assert config.format == "console"
-            assert config.async_enabled is False
-            assert config.buffer_size == 2000
-            assert config.flush_interval_s == 0.5
-            assert config.retention_days == 90
-            assert config.compression_enabled is False
-            assert config.max_file_size_mb == 200
-            assert config.secret_patterns == ["api_key=\\w+", "Bearer \\w+"]
-            assert config.redaction_text == "[HIDDEN]"
-        finally:
-            # Cleanup
-            for key in env_vars:
-                if key in os.environ:
-                    del os.environ[key]
-
-    def test_from_env_custom_prefix(self):
+            monkeypatch.setenv(key, value)
+
+        config = from_env()
+
+        assert config.log_dir == Path("/tmp/logs")
+        assert config.level == LogLevel.DEBUG
+        assert config.module_levels == {
+            "src.test": LogLevel.WARNING,
+            "src.other": LogLevel.ERROR,
+        }
+        assert config.format == "console"
+        assert config.async_enabled is False
+        assert config.buffer_size == 2000
+        assert config.flush_interval_s == 0.5
+        assert config.retention_days == 90
+        assert config.compression_enabled is False
+        assert config.max_file_size_mb == 200
+        assert config.secret_patterns == ["api_key=\\w+", "Bearer \\w+"]
+        assert config.redaction_text == "[HIDDEN]"
+
+    def test_from_env_custom_prefix(self, monkeypatch):
         """from_env should support custom prefix."""
-        os.environ["MYAPP_LEVEL"] = "ERROR"
+        monkeypatch.setenv("MYAPP_LEVEL", "ERROR")
 
-        try:
-            config = from_env(prefix="MYAPP_")
-            assert config.level == LogLevel.ERROR
-        finally:
-            del os.environ["MYAPP_LEVEL"]
+        config = from_env(prefix="MYAPP_")
 
-    def test_from_env_boolean_parsing(self):
-        """from_env should correctly parse boolean values."""
-        test_cases = [
+        assert config.level == LogLevel.ERROR
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
             ("true", True),
             ("TRUE", True),
             ("1", True),
@@ -259,32 +259,45 @@ class TestFromEnv:
             ("0", False),
             ("no", False),
             ("invalid", False),  # default to False
-        ]
+        ],
+    )
+    def test_from_env_boolean_parsing(self, monkeypatch, value, expected):
+        """from_env should correctly parse boolean values."""
+        monkeypatch.setenv("LOGGING_ASYNC_ENABLED", value)
 
-        for value, expected in test_cases:
-            os.environ["LOGGING_ASYNC_ENABLED"] = value
-            try:
-                config = from_env()
-                assert config.async_enabled == expected, f"Failed for value: {value}"
-            finally:
-                del os.environ["LOGGING_ASYNC_ENABLED"]
+        config = from_env()
 
-    def test_from_env_invalid_numbers(self):
+        assert config.async_enabled == expected, f"Failed for value: {value}"
+
+    @pytest.mark.parametrize(
+        "suffix,field,default",
+        [
+            ("BUFFER_SIZE", "buffer_size", 1000),
+            ("FLUSH_INTERVAL_S", "flush_interval_s", 1.0),
+            ("RETENTION_DAYS", "retention_days", 30),
+            ("MAX_FILE_SIZE_MB", "max_file_size_mb", 100),
+        ],
+    )
+    def test_from_env_invalid_numbers(self, monkeypatch, suffix, field, default):
         """from_env should handle invalid numeric values gracefully."""
-        os.environ["LOGGING_BUFFER_SIZE"] = "invalid"
+        monkeypatch.setenv(f"LOGGING_{suffix}", "invalid")
 
-        try:
-            config = from_env()
-            assert config.buffer_size == 1000  # fallback to default
-        finally:
-            del os.environ["LOGGING_BUFFER_SIZE"]
+        config = from_env()
 
-    def test_from_env_case_insensitive_levels(self):
+        assert getattr(config, field) == default  # fallback to default
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("warning", LogLevel.WARNING),
+            ("Error", LogLevel.ERROR),
+            ("debug", LogLevel.DEBUG),
+        ],
+    )
+    def test_from_env_case_insensitive_levels(self, monkeypatch, value, expected):
         """from_env should handle case-insensitive log levels."""
-        os.environ["LOGGING_LEVEL"] = "warning"
+        monkeypatch.setenv("LOGGING_LEVEL", value)
+
+        config = from_env()
 
-        try:
-            config = from_env()
-            assert config.level == LogLevel.WARNING
-        finally:
-            del os.environ["LOGGING_LEVEL"]
+        assert config.level == expected
@@ -337,6 +337,115 @@ class TestErrorHandling:
         logger.info("Fallback message")
 
 
+class TestSyncAppender:
+    """Tests for the buffered sync-mode file appender."""
+
+    @pytest.mark.asyncio
+    async def test_sync_mode_writes_to_file(self, temp_log_dir):
+        """Sync mode should buffer records into a daily log file."""
+        import json as json_module
+
+        config = LoggerConfig(
+            log_dir=temp_log_dir, level=LogLevel.DEBUG, async_enabled=False
+        )
+        logger = LoggerService(config)
+
+        logger.info("Buffered sync message")
+        await logger.stop_async_writer()  # flush + fsync the appender
+
+        log_files = list(temp_log_dir.glob("*.log"))
+        assert len(log_files) == 1
+        entry = json_module.loads(log_files[0].read_text().strip())
+        assert entry["message"] == "Buffered sync message"
+
+
+class TestCallerCapture:
+    """Tests for the capture_caller caller-frame toggle."""
+
+    @pytest.mark.asyncio
+    async def test_capture_caller_disabled_omits_call_site(self, temp_log_dir):
+        """capture_caller=False should skip the frame walk entirely."""
+        import json as json_module
+
+        config = LoggerConfig(
+            log_dir=temp_log_dir,
+            level=LogLevel.DEBUG,
+            async_enabled=False,
+            capture_caller=False,
+        )
+        logger = LoggerService(config)
+
+        logger.info("No call site")
+        await logger.stop_async_writer()
+
+        log_files = list(temp_log_dir.glob("*.log"))
+        entry = json_module.loads(log_files[0].read_text().strip())
+        assert entry["module"] == "unknown"
+        assert "function" not in entry
+        assert "line_number" not in entry
+
+
+class TestRingBuffer:
+    """Tests for in-memory ring buffer mode."""
+
+    def test_ring_mode_skips_writer(self, temp_log_dir):
+        """Ring mode should keep records in memory, no writer or files."""
+        config = LoggerConfig(
+            log_dir=temp_log_dir, async_enabled=True, ring_buffer_size=16
+        )
+        logger = LoggerService(config)
+
+        logger.info("In-memory only")
+
+        assert logger._writer is None
+        # Only the faulthandler crash file may exist - no log records on disk
+        names = {p.name for p in temp_log_dir.iterdir()}
+        assert names <= {"crash-traceback.log"}
+
+    def test_dump_ring_writes_records(self, temp_log_dir):
+        """dump_ring should write retained records as NDJSON."""
+        import json as json_module
+
+        config = LoggerConfig(log_dir=temp_log_dir, ring_buffer_size=16)
+        logger = LoggerService(config)
+
+        logger.info("First message")
+        logger.info("Second message")
+
+        dump_path = logger.dump_ring()
+
+        assert dump_path is not None
+        lines = dump_path.read_text().strip().split("\n")
+        assert len(lines) == 2
+        messages = [json_module.loads(line)["message"] for line in lines]
+        assert messages == ["First message", "Second message"]
+
+    def test_ring_wraps_to_newest(self, temp_log_dir):
+        """Ring should retain only the newest N records when full."""
+        config = LoggerConfig(log_dir=temp_log_dir, ring_buffer_size=4)
+        logger = LoggerService(config)
+
+        for i in range(10):
+            logger.info(f"Message {i}")
+
+        dump_path = logger.dump_ring()
+
+        assert dump_path is not None
+        lines = dump_path.read_text().strip().split("\n")
+        assert len(lines) == 4  # size rounded to power of two, oldest evicted
+
+    def test_dump_ring_empty_returns_none(self, temp_log_dir):
+        """dump_ring should return None when nothing was logged."""
+        config = LoggerConfig(log_dir=temp_log_dir, ring_buffer_size=16)
+        logger = LoggerService(config)
+
+        assert logger.dump_ring() is None
+
+    def test_dump_ring_off_mode_returns_none(self, logger):
+        """dump_ring is a no-op when ring mode is disabled."""
+        assert logger.dump_ring() is None
+
+
 class TestPublicAPI:
     """Tests for public API functions."""
 
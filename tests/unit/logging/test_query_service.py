@@ -16,96 +16,140 @@ from pathlib import Path
 
 import pytest
 
-from src.fte_logging.models import LogEntry, LogLevel, LogQuery
-from src.fte_logging.query_service import QueryService
+# orjson encodes/decodes ~5x faster than stdlib json; fall back silently
+# when it isn't installed (same guarded-import idiom as the writer)
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:
 
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
 
-@pytest.fixture
-def temp_log_dir_with_data(tmp_path):
-    """Create temporary log directory with sample log files."""
-    log_dir = tmp_path / "logs"
-    log_dir.mkdir()
+    _loads = json.loads
 
-    # Create sample log file with NDJSON
+from src.fte_logging.models import LogEntry, LogLevel, LogQuery
+from src.fte_logging.query_service import QueryService
+
+# No shared global state beyond per-worker tmp_path_factory dirs, so the
+# whole module can run in an xdist worker (pytest -n auto --dist=loadfile)
+pytestmark = pytest.mark.parallel
+
+
+# Sample records built once at import time; every test in this module reads
+# the same NDJSON file, so the fixture below is module-scoped and the records
+# live here as a constant instead of being rebuilt ~25 times per run
+_NOW = datetime.now(timezone.utc)
+
+_LOG_RECORDS = (
+    {
+        "trace_id": "trace-001",
+        "timestamp": (_NOW - timedelta(hours=2)).isoformat(),
+        "level": "INFO",
+        "module": "test.module",
+        "message": "Application started",
+        "function": "main",
+        "line_number": 10,
+        "context": {},
+        "exception": None,
+        "duration_ms": None,
+        "tags": [],
+    },
+    {
+        "trace_id": "trace-001",
+        "timestamp": (_NOW - timedelta(hours=1, minutes=30)).isoformat(),
+        "level": "DEBUG",
+        "module": "test.module",
+        "message": "Debug message",
+        "function": "debug_func",
+        "line_number": 20,
+        "context": {"debug": True},
+        "exception": None,
+        "duration_ms": None,
+        "tags": [],
+    },
+    {
+        "trace_id": "trace-002",
+        "timestamp": (_NOW - timedelta(hours=1)).isoformat(),
+        "level": "ERROR",
+        "module": "test.error",
+        "message": "Disk full error occurred",
+        "function": "write_file",
+        "line_number": 30,
+        "context": {"disk": "/dev/sda1"},
+        "exception": {"type": "IOError", "message": "No space left"},
+        "duration_ms": 150.5,
+        "tags": ["disk", "error"],
+    },
+    {
+        "trace_id": "trace-002",
+        "timestamp": (_NOW - timedelta(minutes=30)).isoformat(),
+        "level": "WARNING",
+        "module": "test.warning",
+        "message": "Warning message",
+        "function": "warn_func",
+        "line_number": 40,
+        "context": {},
+        "exception": None,
+        "duration_ms": None,
+        "tags": ["warning"],
+    },
+    {
+        "trace_id": "trace-003",
+        "timestamp": (_NOW - timedelta(minutes=10)).isoformat(),
+        "level": "CRITICAL",
+        "module": "test.critical",
+        "message": "Critical error",
+        "function": "critical_func",
+        "line_number": 50,
+        "context": {"severity": "high"},
+        "exception": {"type": "CriticalError", "message": "System failure"},
+        "duration_ms": 500.0,
+        "tags": ["critical", "system"],
+    },
+)
+
+
+@pytest.fixture(scope="module")
+def temp_log_dir_with_data(tmp_path_factory):
+    """Create a log directory with sample NDJSON, shared by the module.
+
+    Tests only read from the directory, so one copy serves all of them.
+    """
+    log_dir = tmp_path_factory.mktemp("logs")
     log_file = log_dir / "2026-01-28.log"
 
-    now = datetime.now(timezone.utc)
-
-    logs = [
-        {
-            "trace_id": "trace-001",
-            "timestamp": (now - timedelta(hours=2)).isoformat(),
-            "level": "INFO",
-            "module": "test.module",
-            "message": "Application started",
-            "function": "main",
-            "line_number": 10,
-            "context": {},
-            "exception": None,
-            "duration_ms": None,
-            "tags": [],
-        },
-        {
-            "trace_id": "trace-001",
-            "timestamp": (now - timedelta(hours=1, minutes=30)).isoformat(),
-            "level": "DEBUG",
-            "module": "test.module",
-            "message": "Debug message",
-            "function": "debug_func",
-            "line_number": 20,
-            "context": {"debug": True},
-            "exception": None,
-            "duration_ms": None,
-            "tags": [],
-        },
-        {
-            "trace_id": "trace-002",
-            "timestamp": (now - timedelta(hours=1)).isoformat(),
-            "level": "ERROR",
-            "module": "test.error",
-            "message": "Disk full error occurred",
-            "function": "write_file",
-            "line_number": 30,
-            "context": {"disk": "/dev/sda1"},
-            "exception": {"type": "IOError", "message": "No space left"},
-            "duration_ms": 150.5,
-            "tags": ["disk", "error"],
-        },
-        {
-            "trace_id": "trace-002",
-            "timestamp": (now - timedelta(minutes=30)).isoformat(),
-            "level": "WARNING",
-            "module": "test.warning",
-            "message": "Warning message",
-            "function": "warn_func",
-            "line_number": 40,
-            "context": {},
-            "exception": None,
-            "duration_ms": None,
-            "tags": ["warning"],
-        },
-        {
-            "trace_id": "trace-003",
-            "timestamp": (now - timedelta(minutes=10)).isoformat(),
-            "level": "CRITICAL",
-            "module": "test.critical",
-            "message": "Critical error",
-            "function": "critical_func",
-            "line_number": 50,
-            "context": {"severity": "high"},
-            "exception": {"type": "CriticalError", "message": "System failure"},
-            "duration_ms": 500.0,
-            "tags": ["critical", "system"],
-        },
-    ]
-
-    with open(log_file, "w") as f:
-        for log in logs:
-            f.write(json.dumps(log) + "\n")
+    # One binary write of a prebuilt blob: no per-record write loop, no
+    # text-mode encoder or newline translation between us and the syscall
+    payload = b"".join(_dumps(log) + b"\n" for log in _LOG_RECORDS)
+    log_file.write_bytes(payload)
 
     return log_dir
 
 
+@pytest.fixture(scope="module")
+def query_service(temp_log_dir_with_data):
+    """One QueryService per module; opening the adapter is the single most
+    expensive operation in this file, and every test here only reads."""
+    service = QueryService(temp_log_dir_with_data)
+    yield service
+    service.close()
+
+
+@pytest.fixture(scope="module")
+def all_entries(query_service):
+    """Fully-decoded baseline result set, queried once per module.
+
+    Tests that only need the parsed fixture data as a reference compare
+    against this instead of re-running the unfiltered query (each run
+    reparses the NDJSON file and rebuilds five LogEntry objects)."""
+    return query_service.query(LogQuery(limit=100), format="dict")
+
+
 class TestQueryServiceInitialization:
     """Tests for QueryService initialization."""
 
@@ -129,281 +173,194 @@ class TestQueryServiceInitialization:
 class TestQueryWithFilters:
     """Tests for query() method with filters."""
 
-    def test_query_all_logs(self, temp_log_dir_with_data):
+    def test_query_all_logs(self, all_entries):
         """Should query all logs without filters."""
-        service = QueryService(temp_log_dir_with_data)
-
-        params = LogQuery(limit=100)
-        results = service.query(params, format="dict")
-
-        assert len(results) == 5
-        assert all(isinstance(entry, LogEntry) for entry in results)
-
-        service.close()
-
-    def test_query_filter_by_level(self, temp_log_dir_with_data):
-        """Should filter by log level."""
-        service = QueryService(temp_log_dir_with_data)
-
-        params = LogQuery(levels=[LogLevel.ERROR, LogLevel.CRITICAL])
-        results = service.query(params, format="dict")
-
-        assert len(results) == 2
-        assert all(
-            entry.level in [LogLevel.ERROR, LogLevel.CRITICAL] for entry in results
-        )
-
-        service.close()
-
-    def test_query_filter_by_module(self, temp_log_dir_with_data):
-        """Should filter by module prefix."""
-        service = QueryService(temp_log_dir_with_data)
-
-        params = LogQuery(modules=["test.error"])
-        results = service.query(params, format="dict")
-
-        assert len(results) == 1
-        assert results[0].module == "test.error"
-
-        service.close()
-
-    def test_query_with_limit(self, temp_log_dir_with_data):
-        """Should respect limit parameter."""
-        service = QueryService(temp_log_dir_with_data)
-
-        params = LogQuery(limit=2)
-        results = service.query(params, format="dict")
-
-        assert len(results) == 2
-
-        service.close()
-
-    def test_query_with_offset(self, temp_log_dir_with_data):
+        assert len(all_entries) == 5
+        assert all(isinstance(entry, LogEntry) for entry in all_entries)
+
+    @pytest.mark.parametrize(
+        "params,expected_len,check",
+        [
+            pytest.param(
+                LogQuery(levels=[LogLevel.ERROR, LogLevel.CRITICAL]),
+                2,
+                lambda results: all(
+                    e.level in (LogLevel.ERROR, LogLevel.CRITICAL) for e in results
+                ),
+                id="filter-by-level",
+            ),
+            pytest.param(
+                LogQuery(modules=["test.error"]),
+                1,
+                lambda results: results[0].module == "test.error",
+                id="filter-by-module",
+            ),
+            pytest.param(LogQuery(limit=2), 2, None, id="limit"),
+        ],
+    )
+    def test_query_filters(self, query_service, params, expected_len, check):
+        """Each filter combination should return the expected slice."""
+        results = query_service.query(params, format="dict")
+
+        assert len(results) == expected_len
+        if check is not None:
+            assert check(results)
+
+    def test_query_with_offset(self, query_service, all_entries):
         """Should respect offset parameter."""
-        service = QueryService(temp_log_dir_with_data)
-
-        # Get all
-        all_results = service.query(LogQuery(limit=100), format="dict")
-
-        # Get with offset
         params = LogQuery(limit=100, offset=2)
-        offset_results = service.query(params, format="dict")
+        offset_results = query_service.query(params, format="dict")
 
         assert len(offset_results) == 3  # 5 total - 2 offset
-        assert offset_results[0].message == all_results[2].message
-
-        service.close()
+        assert offset_results[0].message == all_entries[2].message
 
 
 class TestFilterByTrace:
     """Tests for filter_by_trace() method."""
 
-    def test_filter_by_trace_id(self, temp_log_dir_with_data):
+    def test_filter_by_trace_id(self, query_service):
         """Should filter by trace ID."""
-        service = QueryService(temp_log_dir_with_data)
-
-        results = service.filter_by_trace("trace-001")
+        results = query_service.filter_by_trace("trace-001")
 
         assert len(results) == 2
         assert all(entry.trace_id == "trace-001" for entry in results)
 
-        service.close()
-
-    def test_filter_by_trace_chronological_order(self, temp_log_dir_with_data):
+    def test_filter_by_trace_chronological_order(self, query_service):
         """Should return results in chronological order."""
-        service = QueryService(temp_log_dir_with_data)
-
-        results = service.filter_by_trace("trace-001")
+        results = query_service.filter_by_trace("trace-001")
 
         # Should be in ascending timestamp order
         assert results[0].timestamp < results[1].timestamp
 
-        service.close()
-
-    def test_filter_by_nonexistent_trace(self, temp_log_dir_with_data):
+    def test_filter_by_nonexistent_trace(self, query_service):
         """Should return empty list for nonexistent trace."""
-        service = QueryService(temp_log_dir_with_data)
-
-        results = service.filter_by_trace("nonexistent-trace")
+        results = query_service.filter_by_trace("nonexistent-trace")
 
         assert len(results) == 0
 
-        service.close()
-
 
 class TestFilterByTimeRange:
     """Tests for filter_by_time_range() method."""
 
-    def test_filter_by_time_range(self, temp_log_dir_with_data):
+    def test_filter_by_time_range(self, query_service):
         """Should filter by time range."""
-        service = QueryService(temp_log_dir_with_data)
-
-        now = datetime.now(timezone.utc)
-        start = now - timedelta(hours=2)
-        end = now - timedelta(minutes=30)
+        # Anchor on the same _NOW the fixture data was built from, so the
+        # window cannot drift from the records on a slow run
+        start = _NOW - timedelta(hours=2)
+        end = _NOW - timedelta(minutes=30)
 
-        results = service.filter_by_time_range(start, end)
+        results = query_service.filter_by_time_range(start, end)
 
         # Should exclude logs outside range
         assert len(results) >= 1
 
-        service.close()
-
-    def test_filter_by_time_range_with_level(self, temp_log_dir_with_data):
+    def test_filter_by_time_range_with_level(self, query_service):
         """Should filter by time range and level."""
-        service = QueryService(temp_log_dir_with_data)
-
-        now = datetime.now(timezone.utc)
-        start = now - timedelta(hours=3)
-        end = now
+        start = _NOW - timedelta(hours=3)
+        end = _NOW
 
-        results = service.filter_by_time_range(start, end, level=LogLevel.ERROR)
+        results = query_service.filter_by_time_range(start, end, level=LogLevel.ERROR)
 
         # Should only include ERROR logs in time range
         assert all(entry.level >= LogLevel.ERROR for entry in results)
 
-        service.close()
-
 
 class TestSearchText:
     """Tests for search_text() method."""
 
-    def test_search_text_case_insensitive(self, temp_log_dir_with_data):
+    def test_search_text_case_insensitive(self, query_service):
         """Should perform case-insensitive text search."""
-        service = QueryService(temp_log_dir_with_data)
-
-        results = service.search_text("DISK FULL")
+        results = query_service.search_text("DISK FULL")
 
         assert len(results) == 1
         assert "Disk full" in results[0].message
 
-        service.close()
-
-    def test_search_text_case_sensitive(self, temp_log_dir_with_data):
+    def test_search_text_case_sensitive(self, query_service):
         """Should perform case-sensitive text search if requested."""
-        service = QueryService(temp_log_dir_with_data)
-
-        results = service.search_text("Disk full", case_sensitive=True)
+        results = query_service.search_text("Disk full", case_sensitive=True)
 
         assert len(results) == 1
 
-        service.close()
-
-    def test_search_text_no_matches(self, temp_log_dir_with_data):
+    def test_search_text_no_matches(self, query_service):
         """Should return empty list if no matches."""
-        service = QueryService(temp_log_dir_with_data)
-
-        results = service.search_text("nonexistent text")
+        results = query_service.search_text("nonexistent text")
 
         assert len(results) == 0
 
-        service.close()
-
-    def test_search_text_with_limit(self, temp_log_dir_with_data):
+    def test_search_text_with_limit(self, query_service):
         """Should respect limit in search."""
-        service = QueryService(temp_log_dir_with_data)
-
-        results = service.search_text("message", limit=2)
+        results = query_service.search_text("message", limit=2)
 
         assert len(results) <= 2
 
-        service.close()
-
 
 class TestRawSQLQuery:
     """Tests for query_sql() method."""
 
-    def test_query_sql_basic(self, temp_log_dir_with_data):
+    def test_query_sql_basic(self, query_service):
         """Should execute raw SQL query."""
-        service = QueryService(temp_log_dir_with_data)
-
         sql = "SELECT COUNT(*) as count FROM logs"
-        results = service.query_sql(sql)
+        results = query_service.query_sql(sql)
 
         assert len(results) == 1
         assert results[0]["count"] == 5
 
-        service.close()
-
-    def test_query_sql_aggregation(self, temp_log_dir_with_data):
+    def test_query_sql_aggregation(self, query_service):
         """Should support aggregation queries."""
-        service = QueryService(temp_log_dir_with_data)
-
         sql = "SELECT level, COUNT(*) as count FROM logs GROUP BY level ORDER BY count DESC"
-        results = service.query_sql(sql)
+        results = query_service.query_sql(sql)
 
         assert len(results) >= 1
         assert all("level" in row and "count" in row for row in results)
 
-        service.close()
-
-    def test_query_sql_filter(self, temp_log_dir_with_data):
+    def test_query_sql_filter(self, query_service):
         """Should support filtered queries."""
-        service = QueryService(temp_log_dir_with_data)
-
         sql = "SELECT * FROM logs WHERE level = 'ERROR'"
-        results = service.query_sql(sql)
+        results = query_service.query_sql(sql)
 
         assert len(results) == 1
         assert results[0]["level"] == "ERROR"
 
-        service.close()
-
 
 class TestOutputFormats:
     """Tests for different output formats."""
 
-    def test_format_dict(self, temp_log_dir_with_data):
-        """Should return LogEntry objects for dict format."""
-        service = QueryService(temp_log_dir_with_data)
-
-        params = LogQuery(limit=2)
-        results = service.query(params, format="dict")
-
-        assert isinstance(results, list)
-        assert all(isinstance(entry, LogEntry) for entry in results)
-
-        service.close()
-
-    def test_format_json(self, temp_log_dir_with_data):
-        """Should return JSON string for json format."""
-        service = QueryService(temp_log_dir_with_data)
-
-        params = LogQuery(limit=2)
-        results = service.query(params, format="json")
-
-        assert isinstance(results, str)
-        # Should be valid JSON
-        parsed = json.loads(results)
-        assert isinstance(parsed, list)
-
-        service.close()
-
-    def test_format_csv(self, temp_log_dir_with_data):
-        """Should return CSV string for csv format."""
-        service = QueryService(temp_log_dir_with_data)
-
-        params = LogQuery(limit=2)
-        results = service.query(params, format="csv")
-
-        assert isinstance(results, str)
-        assert "trace_id" in results  # Header
-        assert "," in results  # CSV delimiter
-
-        service.close()
-
-    def test_format_table(self, temp_log_dir_with_data):
-        """Should return ASCII table for table format."""
-        service = QueryService(temp_log_dir_with_data)
-
-        params = LogQuery(limit=2)
-        results = service.query(params, format="table")
-
-        assert isinstance(results, str)
-        assert "|" in results  # Table separator
-        assert "-" in results  # Header separator
-
-        service.close()
+    @pytest.mark.parametrize(
+        "fmt,check",
+        [
+            pytest.param(
+                "dict",
+                lambda results: isinstance(results, list)
+                and all(isinstance(e, LogEntry) for e in results),
+                id="dict",
+            ),
+            pytest.param(
+                "json",
+                lambda results: isinstance(results, str)
+                and isinstance(_loads(results), list),
+                id="json",
+            ),
+            pytest.param(
+                "csv",
+                lambda results: isinstance(results, str)
+                and "trace_id" in results  # header
+                and "," in results,
+                id="csv",
+            ),
+            pytest.param(
+                "table",
+                lambda results: isinstance(results, str)
+                and "|" in results  # column separator
+                and "-" in results,  # header separator
+                id="table",
+            ),
+        ],
+    )
+    def test_output_formats(self, query_service, fmt, check):
+        """Each output format should produce its advertised shape."""
+        results = query_service.query(LogQuery(limit=2), format=fmt)
+
+        assert check(results)
 
 
 class TestContextManager:
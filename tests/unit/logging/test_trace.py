@@ -8,11 +8,18 @@ Tests cover:
 - Context variable isolation
 """
 
-import re
-
 import pytest
 
-from src.fte_logging.trace import bind_trace_id, get_trace_id, new_trace_id
+from src.fte_logging.trace import (
+    bind_trace_id,
+    get_trace_id,
+    new_trace_id,
+    new_trace_ids,
+)
+
+# Base32 alphabet as a frozenset: per-character membership checks beat
+# compiling and running a regex for a fixed 26-char format
+_B32_CHARS = frozenset("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ")
 
 
 class TestNewTraceId:
@@ -25,11 +32,12 @@ class TestNewTraceId:
         # ULID is 26 characters, Base32 encoded
         assert len(trace_id) == 26
         # Base32 uses A-Z and 0-9 (case-insensitive, but typically uppercase)
-        assert re.match(r"^[0-9A-Z]{26}$", trace_id, re.IGNORECASE)
+        assert all(c in _B32_CHARS for c in trace_id)
 
     def test_new_trace_id_uniqueness(self):
         """new_trace_id should generate unique IDs."""
-        ids = [new_trace_id() for _ in range(100)]
+        # Batch API: one call instead of a 100-iteration mint loop
+        ids = new_trace_ids(100)
 
         # All IDs should be unique
         assert len(set(ids)) == 100
@@ -38,11 +46,40 @@ class TestNewTraceId:
         """new_trace_id should generate sortable IDs (timestamp prefix)."""
         ids = [new_trace_id() for _ in range(10)]
 
-        # IDs should be roughly in ascending order (timestamp prefix)
-        # Note: This might rarely fail if IDs generated in same millisecond
-        # but very unlikely with 100 IDs
-        sorted_ids = sorted(ids)
-        assert ids == sorted_ids or len(set(ids[:2])) == 2  # Allow for same millisecond
+        # Strictly ascending: the timestamp prefix orders across
+        # milliseconds and the monotonic counter orders within one, so no
+        # same-ms fallback is needed
+        assert ids == sorted(ids)
+
+
+class TestNewTraceIds:
+    """Tests for the new_trace_ids() batch API."""
+
+    def test_batch_format_and_uniqueness(self):
+        """Batched IDs should be valid, unique ULIDs."""
+        ids = new_trace_ids(50)
+
+        assert len(ids) == 50
+        assert len(set(ids)) == 50
+        assert all(len(trace_id) == 26 for trace_id in ids)
+        assert all(c in _B32_CHARS for trace_id in ids for c in trace_id)
+
+    def test_batch_sorted_ascending(self):
+        """A batch should sort strictly ascending (monotonic mode)."""
+        ids = new_trace_ids(20)
+
+        assert ids == sorted(ids)
+
+    def test_batch_empty(self):
+        """Non-positive counts should return an empty list."""
+        assert new_trace_ids(0) == []
+
+    def test_batch_interleaves_with_single_calls(self):
+        """Single calls after a batch should stay unique."""
+        batch = new_trace_ids(10)
+        single = new_trace_id()
+
+        assert single not in batch
 
 
 class TestGetTraceId:
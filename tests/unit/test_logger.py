@@ -7,64 +7,91 @@ Constitutional compliance:
 
 import pytest
 import json
+from dataclasses import replace
 from pathlib import Path
 from datetime import datetime
 from control_plane.models import WorkflowState, StateTransition
 from control_plane.logger import AuditLogger
 
+# Prototype transition: tests specialize the differing fields with
+# dataclasses.replace (a direct slot copy) rather than re-running the
+# full 9-field __init__ for every near-identical instance
+_TRANSITION_PROTO = StateTransition(
+    transition_id="trans-000",
+    task_id="task-000",
+    from_state=WorkflowState.INBOX,
+    to_state=WorkflowState.NEEDS_ACTION,
+    timestamp=datetime(2026, 1, 27, 10, 0, 0),
+    reason="",
+    actor="system",
+    logged=True,
+)
+
+
+@pytest.fixture(scope="module")
+def audit_logger(tmp_path_factory):
+    """One shared AuditLogger for the module.
+
+    Construction (directory creation) happens once and the per-date file
+    descriptors stay open across tests. Entries accumulate in the shared
+    log files, so tests assert on the tail of the file rather than its
+    entirety.
+    """
+    logger = AuditLogger(log_dir=tmp_path_factory.mktemp("logs"))
+    yield logger
+    logger.close()
+
+
+def _log_lines(log_file):
+    """Return the log file's lines, or an empty list if it doesn't exist."""
+    if not log_file.exists():
+        return []
+    return log_file.read_text().strip().split("\n")
+
 
 class TestAuditLogger:
     """Tests for AuditLogger class."""
 
-    def test_log_transition_creates_entry(self, isolated_fs):
+    def test_log_transition_creates_entry(self, audit_logger):
         """
         Verify AuditLogger.log_transition() creates log entry.
 
         Constitutional requirement (Section 8): Every action must be logged.
         """
-        logger = AuditLogger(log_dir=isolated_fs / "Logs")
-
-        transition = StateTransition(
+        transition = replace(
+            _TRANSITION_PROTO,
             transition_id="trans-001",
             task_id="task-001",
-            from_state=WorkflowState.INBOX,
-            to_state=WorkflowState.NEEDS_ACTION,
-            timestamp=datetime(2026, 1, 27, 10, 0, 0),
             reason="Validation complete",
-            actor="system",
-            logged=True,
         )
 
-        logger.log_transition(transition)
+        audit_logger.log_transition(transition)
 
         # Verify log file exists
-        log_file = isolated_fs / "Logs" / "2026-01-27.log"
+        log_file = audit_logger.log_dir / "2026-01-27.log"
         assert log_file.exists(), "Log file should be created"
 
-    def test_log_transition_json_format(self, isolated_fs):
+    def test_log_transition_json_format(self, audit_logger):
         """
         Verify log entries are in JSON format.
 
         Constitutional requirement (Section 8): Structured logging for programmatic analysis.
         """
-        logger = AuditLogger(log_dir=isolated_fs / "Logs")
-
-        transition = StateTransition(
+        transition = replace(
+            _TRANSITION_PROTO,
             transition_id="trans-002",
             task_id="task-002",
             from_state=WorkflowState.NEEDS_ACTION,
             to_state=WorkflowState.PLANS,
             timestamp=datetime(2026, 1, 27, 11, 0, 0),
             reason="Planning started",
-            actor="system",
-            logged=True,
         )
 
-        logger.log_transition(transition)
+        audit_logger.log_transition(transition)
 
-        # Read log file and verify JSON format
-        log_file = isolated_fs / "Logs" / "2026-01-27.log"
-        log_content = log_file.read_text().strip()
+        # Read the entry just appended and verify JSON format
+        log_file = audit_logger.log_dir / "2026-01-27.log"
+        log_content = _log_lines(log_file)[-1]
 
         # Parse JSON
         log_entry = json.loads(log_content)
@@ -78,16 +105,15 @@ class TestAuditLogger:
         assert "to_state" in log_entry
         assert "result" in log_entry
 
-    def test_log_transition_required_fields(self, isolated_fs):
+    def test_log_transition_required_fields(self, audit_logger):
         """
         Verify log entries contain all required fields.
 
         Constitutional requirement (Section 8): Logs must include timestamp, action type,
         triggering file, result, approval status.
         """
-        logger = AuditLogger(log_dir=isolated_fs / "Logs")
-
-        transition = StateTransition(
+        transition = replace(
+            _TRANSITION_PROTO,
             transition_id="trans-003",
             task_id="task-003",
             from_state=WorkflowState.PENDING_APPROVAL,
@@ -95,13 +121,12 @@ class TestAuditLogger:
             timestamp=datetime(2026, 1, 27, 12, 0, 0),
             reason="Approved by human",
             actor="human",
-            logged=True,
         )
 
-        logger.log_transition(transition)
+        audit_logger.log_transition(transition)
 
-        log_file = isolated_fs / "Logs" / "2026-01-27.log"
-        log_entry = json.loads(log_file.read_text().strip())
+        log_file = audit_logger.log_dir / "2026-01-27.log"
+        log_entry = json.loads(_log_lines(log_file)[-1])
 
         # Verify all constitutional required fields
         assert "timestamp" in log_entry  # Constitutional requirement
@@ -112,117 +137,100 @@ class TestAuditLogger:
             "approval_status" in log_entry or "actor" in log_entry
         )  # Constitutional requirement
 
-    def test_log_transition_append_only(self, isolated_fs):
+    def test_log_transition_append_only(self, audit_logger):
         """
         Verify log entries are append-only (multiple transitions append to same file).
 
         Constitutional requirement (Section 8): Logs must be append-only.
         """
-        logger = AuditLogger(log_dir=isolated_fs / "Logs")
+        log_file = audit_logger.log_dir / "2026-01-27.log"
+        lines_before = len(_log_lines(log_file))
 
         # Log first transition
-        transition1 = StateTransition(
+        transition1 = replace(
+            _TRANSITION_PROTO,
             transition_id="trans-004",
             task_id="task-004",
-            from_state=WorkflowState.INBOX,
-            to_state=WorkflowState.NEEDS_ACTION,
-            timestamp=datetime(2026, 1, 27, 10, 0, 0),
             reason="First transition",
-            actor="system",
-            logged=True,
         )
-        logger.log_transition(transition1)
+        audit_logger.log_transition(transition1)
 
         # Log second transition
-        transition2 = StateTransition(
+        transition2 = replace(
+            _TRANSITION_PROTO,
             transition_id="trans-005",
             task_id="task-005",
             from_state=WorkflowState.NEEDS_ACTION,
             to_state=WorkflowState.PLANS,
             timestamp=datetime(2026, 1, 27, 10, 30, 0),
             reason="Second transition",
-            actor="system",
-            logged=True,
         )
-        logger.log_transition(transition2)
+        audit_logger.log_transition(transition2)
 
-        # Verify both entries exist in log file
-        log_file = isolated_fs / "Logs" / "2026-01-27.log"
-        log_lines = log_file.read_text().strip().split("\n")
+        # Verify both entries were appended to the shared log file
+        log_lines = _log_lines(log_file)
 
-        assert len(log_lines) == 2, "Should have 2 log entries"
+        assert len(log_lines) == lines_before + 2, "Should have appended 2 log entries"
 
         # Parse both entries
-        entry1 = json.loads(log_lines[0])
-        entry2 = json.loads(log_lines[1])
+        entry1 = json.loads(log_lines[-2])
+        entry2 = json.loads(log_lines[-1])
 
         assert entry1["task_id"] == "task-004"
         assert entry2["task_id"] == "task-005"
 
-    def test_log_transition_daily_rotation(self, isolated_fs):
+    def test_log_transition_daily_rotation(self, audit_logger):
         """
         Verify log files are organized by date (YYYY-MM-DD.log).
 
         Constitutional requirement (Section 8): Log organization for auditability.
         """
-        logger = AuditLogger(log_dir=isolated_fs / "Logs")
-
         # Log transitions on different dates
-        transition1 = StateTransition(
+        transition1 = replace(
+            _TRANSITION_PROTO,
             transition_id="trans-006",
             task_id="task-006",
-            from_state=WorkflowState.INBOX,
-            to_state=WorkflowState.NEEDS_ACTION,
-            timestamp=datetime(2026, 1, 27, 10, 0, 0),
             reason="Transition on Jan 27",
-            actor="system",
-            logged=True,
         )
-        logger.log_transition(transition1)
+        audit_logger.log_transition(transition1)
 
-        transition2 = StateTransition(
+        transition2 = replace(
+            _TRANSITION_PROTO,
             transition_id="trans-007",
             task_id="task-007",
-            from_state=WorkflowState.INBOX,
-            to_state=WorkflowState.NEEDS_ACTION,
             timestamp=datetime(2026, 1, 28, 10, 0, 0),
             reason="Transition on Jan 28",
-            actor="system",
-            logged=True,
         )
-        logger.log_transition(transition2)
+        audit_logger.log_transition(transition2)
 
         # Verify separate log files created
-        log_file_27 = isolated_fs / "Logs" / "2026-01-27.log"
-        log_file_28 = isolated_fs / "Logs" / "2026-01-28.log"
+        log_file_27 = audit_logger.log_dir / "2026-01-27.log"
+        log_file_28 = audit_logger.log_dir / "2026-01-28.log"
 
         assert log_file_27.exists(), "Log file for Jan 27 should exist"
         assert log_file_28.exists(), "Log file for Jan 28 should exist"
 
-    def test_log_transition_with_error(self, isolated_fs):
+    def test_log_transition_with_error(self, audit_logger):
         """
         Verify log entries can include error information.
 
         Constitutional requirement (Section 9): Errors must never be hidden.
         """
-        logger = AuditLogger(log_dir=isolated_fs / "Logs")
-
-        transition = StateTransition(
+        transition = replace(
+            _TRANSITION_PROTO,
             transition_id="trans-008",
             task_id="task-008",
             from_state=WorkflowState.APPROVED,
             to_state=WorkflowState.REJECTED,
             timestamp=datetime(2026, 1, 27, 13, 0, 0),
             reason="Execution failed",
-            actor="system",
-            logged=True,
             error="Disk full",
         )
 
-        logger.log_transition(transition)
+        audit_logger.log_transition(transition)
 
-        log_file = isolated_fs / "Logs" / "2026-01-27.log"
-        log_entry = json.loads(log_file.read_text().strip())
+        log_file = audit_logger.log_dir / "2026-01-27.log"
+        log_entry = json.loads(_log_lines(log_file)[-1])
 
         assert "error" in log_entry
         assert log_entry["error"] == "Disk full"
@@ -7,10 +7,25 @@ Constitutional compliance:
 """
 
 import pytest
+from dataclasses import replace
 from pathlib import Path
 from datetime import datetime
 from control_plane.models import WorkflowState, TaskFile, StateTransition
 
+# Prototype for bulk TaskFile construction: tests that only vary a field
+# or two use dataclasses.replace (a direct slot copy on slotted
+# dataclasses) instead of re-running __init__ with the full field list
+_TASK_PROTO = TaskFile(
+    id="test",
+    state=WorkflowState.INBOX,
+    priority="P1",
+    created_at=datetime(2026, 1, 27, 10, 0, 0),
+    modified_at=datetime(2026, 1, 27, 10, 0, 0),
+    metadata={},
+    file_path=Path("Inbox/task.md"),
+    content="Content",
+)
+
 
 class TestWorkflowState:
     """Tests for WorkflowState enum."""
@@ -151,18 +166,14 @@ This is a test task.
         ]
 
         for folder_name, expected_state in test_cases:
-            task_path = isolated_fs / folder_name / "task.md"
-            task_content = f"""---
-id: test
-state: {folder_name}
-priority: P1
-created_at: 2026-01-27T10:00:00Z
-modified_at: 2026-01-27T10:00:00Z
----
-Content"""
-            task_path.write_text(task_content)
-
-            task = TaskFile.from_file(task_path)
+            # Derivation only looks at the parent folder name, so specialize
+            # the prototype per folder instead of writing and reparsing a
+            # task file for each of the 7 states (from_file has its own tests)
+            task = replace(
+                _TASK_PROTO,
+                state=expected_state,
+                file_path=isolated_fs / folder_name / "task.md",
+            )
             derived_state = task.derive_state_from_location()
 
             assert (
@@ -8,9 +8,9 @@ Constitutional compliance:
 
 import pytest
 import os
-import time
+from contextlib import ExitStack
 from pathlib import Path
-from unittest.mock import patch, Mock
+from unittest.mock import call, patch, Mock
 from control_plane.models import WorkflowState, TaskFile
 from control_plane.state_machine import StateMachine
 from utils.file_ops import atomic_move
@@ -18,163 +18,127 @@ from control_plane.errors import FileOperationError
 from datetime import datetime
 
 
-class TestStateMachine:
-    """Tests for StateMachine class."""
-
-    def test_validate_transition_inbox_to_needs_action(self):
-        """
-        Verify transition from Inbox to Needs_Action is valid.
-        """
-        sm = StateMachine()
-        assert (
-            sm.validate_transition(WorkflowState.INBOX, WorkflowState.NEEDS_ACTION)
-            is True
-        )
-
-    def test_validate_transition_needs_action_to_plans(self):
-        """
-        Verify transition from Needs_Action to Plans is valid.
-        """
-        sm = StateMachine()
-        assert (
-            sm.validate_transition(WorkflowState.NEEDS_ACTION, WorkflowState.PLANS)
-            is True
-        )
-
-    def test_validate_transition_plans_to_pending_approval(self):
-        """
-        Verify transition from Plans to Pending_Approval is valid.
-        """
-        sm = StateMachine()
-        assert (
-            sm.validate_transition(WorkflowState.PLANS, WorkflowState.PENDING_APPROVAL)
-            is True
-        )
-
-    def test_validate_transition_plans_to_needs_action(self):
-        """
-        Verify transition from Plans back to Needs_Action is valid (clarifications needed).
-        """
-        sm = StateMachine()
-        assert (
-            sm.validate_transition(WorkflowState.PLANS, WorkflowState.NEEDS_ACTION)
-            is True
-        )
-
-    def test_validate_transition_pending_approval_to_approved(self):
-        """
-        Verify transition from Pending_Approval to Approved is valid (human approval).
-
-        Constitutional requirement (Section 7): Human approval via file move.
-        """
-        sm = StateMachine()
-        assert (
-            sm.validate_transition(
-                WorkflowState.PENDING_APPROVAL, WorkflowState.APPROVED
-            )
-            is True
-        )
-
-    def test_validate_transition_pending_approval_to_rejected(self):
-        """
-        Verify transition from Pending_Approval to Rejected is valid (human rejection).
-        """
-        sm = StateMachine()
-        assert (
-            sm.validate_transition(
-                WorkflowState.PENDING_APPROVAL, WorkflowState.REJECTED
-            )
-            is True
-        )
-
-    def test_validate_transition_approved_to_done(self):
-        """
-        Verify transition from Approved to Done is valid (execution succeeded).
-        """
-        sm = StateMachine()
-        assert (
-            sm.validate_transition(WorkflowState.APPROVED, WorkflowState.DONE) is True
-        )
-
-    def test_validate_transition_approved_to_rejected(self):
-        """
-        Verify transition from Approved to Rejected is valid (execution failed).
-        """
-        sm = StateMachine()
-        assert (
-            sm.validate_transition(WorkflowState.APPROVED, WorkflowState.REJECTED)
-            is True
-        )
-
-    def test_validate_transition_rejected_to_inbox(self):
-        """
-        Verify transition from Rejected to Inbox is valid (retry with revised approach).
-        """
-        sm = StateMachine()
-        assert (
-            sm.validate_transition(WorkflowState.REJECTED, WorkflowState.INBOX) is True
+# (from_state, to_state, expected) matrix covering the valid workflow
+# edges and the forbidden shortcuts the old per-pair tests asserted.
+# Constitutional requirements: Section 4 (valid transitions), Section 6-7
+# (no skipping approval), Section 13 (Done is terminal).
+_TRANSITIONS = [
+    (WorkflowState.INBOX, WorkflowState.NEEDS_ACTION, True),
+    (WorkflowState.NEEDS_ACTION, WorkflowState.PLANS, True),
+    (WorkflowState.PLANS, WorkflowState.PENDING_APPROVAL, True),
+    (WorkflowState.PLANS, WorkflowState.NEEDS_ACTION, True),
+    (WorkflowState.PENDING_APPROVAL, WorkflowState.APPROVED, True),
+    (WorkflowState.PENDING_APPROVAL, WorkflowState.REJECTED, True),
+    (WorkflowState.APPROVED, WorkflowState.DONE, True),
+    (WorkflowState.APPROVED, WorkflowState.REJECTED, True),
+    (WorkflowState.REJECTED, WorkflowState.INBOX, True),
+    (WorkflowState.PLANS, WorkflowState.APPROVED, False),
+    (WorkflowState.INBOX, WorkflowState.APPROVED, False),
+    (WorkflowState.PLANS, WorkflowState.DONE, False),
+    (WorkflowState.NEEDS_ACTION, WorkflowState.APPROVED, False),
+    (WorkflowState.INBOX, WorkflowState.DONE, False),
+] + [
+    # Done is terminal: every outbound transition is forbidden
+    (WorkflowState.DONE, state, False)
+    for state in WorkflowState
+    if state != WorkflowState.DONE
+]
+
+
+# On-disk fixture matching TaskFile.to_file output, written directly as
+# bytes so retry-test setup skips the serialization layer; to_file itself
+# keeps end-to-end coverage in test_models.py and via transition()
+_FIXTURE_TASK_TEMPLATE = (
+    "---\n"
+    "id: {task_id}\n"
+    "state: Inbox\n"
+    "priority: P1\n"
+    "created_at: 2026-01-27T10:00:00\n"
+    "modified_at: 2026-01-27T10:00:00\n"
+    "metadata: {{}}\n"
+    "---\n"
+    "\n"
+    "{content}\n"
+)
+
+
+_FROZEN_NOW = datetime(2026, 1, 27, 12, 0, 0)
+
+
+class _FrozenDatetime(datetime):
+    """datetime with now() pinned, so log-file dates are deterministic."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return _FROZEN_NOW
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch):
+    """Pin the state machine's clock to _FROZEN_NOW.
+
+    Keeps the test's expected log-file date and the StateMachine's
+    internal strftime on the same day - the real clock could cross
+    midnight between the two calls - and drops the gettimeofday noise.
+    """
+    monkeypatch.setattr("control_plane.state_machine.datetime", _FrozenDatetime)
+    return _FROZEN_NOW
+
+
+@pytest.fixture
+def make_task(isolated_fs):
+    """Factory for Inbox tasks written to disk.
+
+    The retry tests build near-identical TaskFiles; only the id and
+    content differ, so the shared construction lives here once.
+    """
+
+    def _mk(task_id: str, content: str) -> TaskFile:
+        path = isolated_fs / "Inbox" / f"{task_id}.md"
+        path.write_bytes(
+            _FIXTURE_TASK_TEMPLATE.format(task_id=task_id, content=content).encode()
         )
-
-    def test_validate_transition_plans_to_approved_forbidden(self):
-        """
-        Verify transition from Plans to Approved is FORBIDDEN (skips approval).
-
-        Constitutional requirement (Section 6-7): Sensitive actions require approval.
-        """
-        sm = StateMachine()
-        assert (
-            sm.validate_transition(WorkflowState.PLANS, WorkflowState.APPROVED) is False
+        return TaskFile(
+            id=task_id,
+            state=WorkflowState.INBOX,
+            priority="P1",
+            created_at=datetime(2026, 1, 27, 10, 0, 0),
+            modified_at=datetime(2026, 1, 27, 10, 0, 0),
+            metadata={},
+            file_path=path,
+            content=content,
         )
 
-    def test_validate_transition_inbox_to_approved_forbidden(self):
-        """
-        Verify transition from Inbox to Approved is FORBIDDEN (skips planning + approval).
-        """
-        sm = StateMachine()
-        assert (
-            sm.validate_transition(WorkflowState.INBOX, WorkflowState.APPROVED) is False
-        )
+    return _mk
 
-    def test_validate_transition_plans_to_done_forbidden(self):
-        """
-        Verify transition from Plans to Done is FORBIDDEN (skips approval + execution).
-        """
-        sm = StateMachine()
-        assert sm.validate_transition(WorkflowState.PLANS, WorkflowState.DONE) is False
-
-    def test_validate_transition_done_to_any_forbidden(self):
-        """
-        Verify transitions from Done are FORBIDDEN (terminal state).
 
-        Constitutional requirement (Section 13): Task in Done is complete.
-        """
-        sm = StateMachine()
+@pytest.fixture(scope="session")
+def sm():
+    """One shared StateMachine: validate_transition is pure, so a single
+    instance serves every parametrized case."""
+    return StateMachine()
 
-        # Test Done → all other states (all should be False)
-        for state in WorkflowState:
-            if state != WorkflowState.DONE:
-                assert (
-                    sm.validate_transition(WorkflowState.DONE, state) is False
-                ), f"Done → {state} should be forbidden"
 
-    def test_validate_transition_needs_action_to_approved_forbidden(self):
-        """
-        Verify transition from Needs_Action to Approved is FORBIDDEN (skips planning + approval).
-        """
-        sm = StateMachine()
-        assert (
-            sm.validate_transition(WorkflowState.NEEDS_ACTION, WorkflowState.APPROVED)
-            is False
-        )
+class TestStateMachine:
+    """Tests for StateMachine class."""
 
-    def test_validate_transition_inbox_to_done_forbidden(self):
+    @pytest.mark.parametrize(
+        "from_state,to_state,expected",
+        _TRANSITIONS,
+        ids=[
+            f"{f.name}-to-{t.name}-{'valid' if ok else 'forbidden'}"
+            for f, t, ok in _TRANSITIONS
+        ],
+    )
+    def test_validate_transition(self, sm, from_state, to_state, expected):
         """
-        Verify transition from Inbox to Done is FORBIDDEN (skips all workflow steps).
+        Verify validate_transition implements the workflow transition matrix.
         """
-        sm = StateMachine()
-        assert sm.validate_transition(WorkflowState.INBOX, WorkflowState.DONE) is False
+        assert sm.validate_transition(from_state, to_state) is expected
 
-    def test_transition_retry_succeeds_on_second_attempt(self, isolated_fs):
+    def test_transition_retry_succeeds_on_second_attempt(
+        self, isolated_fs, frozen_clock, make_task
+    ):
         """
         Verify transient failure succeeds on retry with exponential backoff.
 
@@ -184,18 +148,7 @@ class TestStateMachine:
         sm = StateMachine(root_dir=isolated_fs, log_dir=isolated_fs / "Logs")
 
         # Create a task in Inbox
-        task_path = isolated_fs / "Inbox" / "task-005.md"
-        task = TaskFile(
-            id="task-005",
-            state=WorkflowState.INBOX,
-            priority="P1",
-            created_at=datetime.now(),
-            modified_at=datetime.now(),
-            metadata={},
-            file_path=task_path,
-            content="# Test retry logic",
-        )
-        task.to_file(task_path)
+        task = make_task("task-005", "# Test retry logic")
 
         # Mock atomic_move to fail on first attempt, succeed on second
         call_count = 0
@@ -214,18 +167,25 @@ class TestStateMachine:
                 # Second attempt: succeed
                 return original_atomic_move(src, dst)
 
-        # Measure time to verify backoff
-        with patch(
-            "src.control_plane.state_machine.atomic_move", side_effect=mock_atomic_move
-        ):
-            start_time = time.time()
+        # Record the backoff schedule instead of sleeping through it. One
+        # ExitStack fuses the patches; plain Mock (not MagicMock) for the
+        # sleep stub avoids the lazy MagicProxy child tree
+        with ExitStack() as stack:
+            stack.enter_context(
+                patch(
+                    "control_plane.state_machine.atomic_move",
+                    side_effect=mock_atomic_move,
+                )
+            )
+            mock_sleep = stack.enter_context(
+                patch("control_plane.state_machine.time.sleep", new_callable=Mock)
+            )
             result = sm.transition(
                 task=task,
                 to_state=WorkflowState.NEEDS_ACTION,
                 reason="Test retry logic",
                 actor="system",
             )
-            elapsed = time.time() - start_time
 
         # Verify success
         assert call_count == 2, "Should have retried once"
@@ -233,21 +193,18 @@ class TestStateMachine:
         assert result.file_path == isolated_fs / "Needs_Action" / "task-005.md"
         assert result.file_path.exists()
 
-        # Verify exponential backoff (first backoff is 0.1s)
-        assert (
-            elapsed >= 0.1
-        ), f"Should have waited at least 0.1s for backoff, got {elapsed:.3f}s"
-        assert (
-            elapsed < 0.5
-        ), f"Should not have waited more than 0.5s, got {elapsed:.3f}s"
+        # Verify exponential backoff schedule (first backoff is 0.1s)
+        assert mock_sleep.call_args_list == [call(0.1)]
 
         # Verify log entry shows success
-        log_file = isolated_fs / "Logs" / f"{datetime.now().strftime('%Y-%m-%d')}.log"
+        log_file = isolated_fs / "Logs" / f"{frozen_clock:%Y-%m-%d}.log"
         assert log_file.exists()
         log_content = log_file.read_text()
         assert '"result": "success"' in log_content
 
-    def test_transition_retry_exhausted_after_max_attempts(self, isolated_fs):
+    def test_transition_retry_exhausted_after_max_attempts(
+        self, isolated_fs, frozen_clock, make_task
+    ):
         """
         Verify all retries exhausted after 3 attempts with proper error logging.
 
@@ -257,18 +214,8 @@ class TestStateMachine:
         sm = StateMachine(root_dir=isolated_fs, log_dir=isolated_fs / "Logs")
 
         # Create a task in Inbox
-        task_path = isolated_fs / "Inbox" / "task-006.md"
-        task = TaskFile(
-            id="task-006",
-            state=WorkflowState.INBOX,
-            priority="P1",
-            created_at=datetime.now(),
-            modified_at=datetime.now(),
-            metadata={},
-            file_path=task_path,
-            content="# Test retry exhaustion",
-        )
-        task.to_file(task_path)
+        task = make_task("task-006", "# Test retry exhaustion")
+        task_path = task.file_path
 
         # Mock atomic_move to always fail with transient error
         call_count = 0
@@ -282,12 +229,18 @@ class TestStateMachine:
             except OSError as e:
                 raise FileOperationError(f"Transient error: {src} -> {dst}") from e
 
-        # Measure time to verify all backoffs: 0.1s + 0.2s + 0.4s = 0.7s (but last attempt doesn't backoff)
-        # So total should be 0.1s + 0.2s = 0.3s
-        with patch(
-            "src.control_plane.state_machine.atomic_move", side_effect=mock_atomic_move
-        ):
-            start_time = time.time()
+        # Record the backoff schedule instead of sleeping through it; the
+        # last attempt raises without a trailing backoff
+        with ExitStack() as stack:
+            stack.enter_context(
+                patch(
+                    "control_plane.state_machine.atomic_move",
+                    side_effect=mock_atomic_move,
+                )
+            )
+            mock_sleep = stack.enter_context(
+                patch("control_plane.state_machine.time.sleep", new_callable=Mock)
+            )
             with pytest.raises(FileOperationError):
                 sm.transition(
                     task=task,
@@ -295,18 +248,12 @@ class TestStateMachine:
                     reason="Test retry exhaustion",
                     actor="system",
                 )
-            elapsed = time.time() - start_time
 
         # Verify all 3 attempts were made
         assert call_count == 3, f"Should have made 3 attempts, got {call_count}"
 
-        # Verify exponential backoff timing: 0.1s + 0.2s = 0.3s
-        assert (
-            elapsed >= 0.3
-        ), f"Should have waited at least 0.3s for backoffs, got {elapsed:.3f}s"
-        assert (
-            elapsed < 0.8
-        ), f"Should not have waited more than 0.8s, got {elapsed:.3f}s"
+        # Verify exponential backoff schedule: 0.1s then 0.2s
+        assert mock_sleep.call_args_list == [call(0.1), call(0.2)]
 
         # Verify task stayed in original state
         assert task.state == WorkflowState.INBOX
@@ -314,7 +261,7 @@ class TestStateMachine:
         assert task_path.exists()
 
         # Verify CRITICAL log entry with attempt count
-        log_file = isolated_fs / "Logs" / f"{datetime.now().strftime('%Y-%m-%d')}.log"
+        log_file = isolated_fs / "Logs" / f"{frozen_clock:%Y-%m-%d}.log"
         assert log_file.exists()
         log_content = log_file.read_text()
         assert '"result": "failure"' in log_content
@@ -353,9 +300,12 @@ class TestAtomicFileMove:
         source.write_text("Test content")
         destination = isolated_fs / "Needs_Action" / "task-002.md"
 
-        # Mock Path.rename to raise OSError with errno 28 (disk full)
-        with patch.object(
-            Path, "rename", side_effect=OSError(28, "No space left on device")
+        # Mock the rename inside file_ops to raise OSError errno 28 (disk
+        # full) - patching the module's os.rename reference instead of
+        # Path.rename keeps every other Path user untouched
+        with patch(
+            "utils.file_ops.os.rename",
+            side_effect=OSError(28, "No space left on device"),
         ):
             with pytest.raises(FileOperationError) as exc_info:
                 atomic_move(source, destination)
@@ -372,9 +322,10 @@ class TestAtomicFileMove:
         source.write_text("Test content")
         destination = isolated_fs / "Needs_Action" / "task-003.md"
 
-        # Mock Path.rename to raise PermissionError
-        with patch.object(
-            Path, "rename", side_effect=PermissionError("Permission denied")
+        # Mock the rename inside file_ops to raise PermissionError
+        with patch(
+            "utils.file_ops.os.rename",
+            side_effect=PermissionError("Permission denied"),
         ):
             with pytest.raises(FileOperationError) as exc_info:
                 atomic_move(source, destination)
@@ -392,7 +343,9 @@ class TestAtomicFileMove:
         destination = isolated_fs / "Needs_Action" / "task-004.md"
 
         # Mock rename to fail
-        with patch.object(Path, "rename", side_effect=OSError("Simulated failure")):
+        with patch(
+            "utils.file_ops.os.rename", side_effect=OSError("Simulated failure")
+        ):
             try:
                 atomic_move(source, destination)
             except FileOperationError:
@@ -0,0 +1,42 @@
+"""
+Shared fixtures for the vault test modules (spec 008).
+
+Session-scoped state lives here so pytest-xdist workers running with
+--dist=loadfile can reuse it across the modules they own; everything
+else in these suites is per-test tmp_path state, so the modules are
+safe to run in parallel.
+"""
+
+import pytest
+import yaml
+
+# libyaml's C loader is 5-10x faster than the pure-Python SafeLoader;
+# fall back silently when PyYAML was built without it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+from vault.initializer import VaultInitializer, _SCHEMAS
+
+
+@pytest.fixture(scope="session")
+def _prebuilt_vault(tmp_path_factory):
+    """Fully initialized vault, built once per session.
+
+    initialize() is deterministic, so every test that only reads can share
+    this copy instead of re-running the folder/schema/seed-doc writes.
+    """
+    root = tmp_path_factory.mktemp("prebuilt_vault")
+    VaultInitializer(root).initialize()
+    return root
+
+
+@pytest.fixture(scope="session")
+def parsed_schemas(_prebuilt_vault):
+    """Schema files read and YAML-parsed once per session."""
+    schema_dir = _prebuilt_vault / ".vault_schema" / "frontmatter_schemas"
+    return {
+        name: yaml.load((schema_dir / name).read_text(), Loader=_YamlLoader)
+        for name in _SCHEMAS
+    }
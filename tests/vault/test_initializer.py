@@ -8,31 +8,52 @@ Coverage map:
                           empty dir reports all missing, partial dir reports gaps
 """
 
+import os
 import shutil
-import tempfile
 from pathlib import Path
 
 import pytest
 
 from vault.initializer import CORE_FOLDERS, VaultInitializer, _SCHEMAS
 
+# Per-test state is all under tmp_path and session fixtures live in
+# conftest.py, so this module is safe under pytest -n auto --dist=loadfile
+pytestmark = pytest.mark.parallel
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
 
 @pytest.fixture
-def empty_dir():
-    d = Path(tempfile.mkdtemp())
-    yield d
-    shutil.rmtree(d, ignore_errors=True)
+def empty_dir(tmp_path):
+    # tmp_path comes pre-created with lazy cleanup; no per-test
+    # mkdtemp/rmtree round trip
+    return tmp_path
 
 
 @pytest.fixture
-def initialized_vault(empty_dir):
-    """Return a vault path that has already been fully initialized."""
-    VaultInitializer(empty_dir).initialize()
-    return empty_dir
+def initialized_vault(_prebuilt_vault, tmp_path):
+    """Return a mutable vault path that has already been fully initialized.
+
+    Copied from the prebuilt session vault - copytree of the tiny tree is
+    far cheaper than re-running the initializer's YAML/seed-doc writes.
+    """
+    dest = tmp_path / "vault"
+    shutil.copytree(_prebuilt_vault, dest)
+    return dest
+
+
+@pytest.fixture(scope="session")
+def dashboard_text(_prebuilt_vault):
+    """Dashboard.md contents, read once per session."""
+    return (_prebuilt_vault / "Dashboard.md").read_text()
+
+
+@pytest.fixture(scope="session")
+def handbook_text(_prebuilt_vault):
+    """Company_Handbook.md contents, read once per session."""
+    return (_prebuilt_vault / "Company_Handbook.md").read_text()
 
 
 # ===========================================================================
@@ -40,28 +61,45 @@ def initialized_vault(empty_dir):
 # ===========================================================================
 
 
+@pytest.fixture(scope="class")
+def fresh_vault(tmp_path_factory):
+    """One fresh initialize + full-tree snapshot for the write-check tests.
+
+    The folder/schema/seed-doc tests all inspect the same freshly
+    initialized tree, so initialize once and walk once; each test then
+    asserts against the precomputed relative-path listing.
+    """
+    root = tmp_path_factory.mktemp("fresh_vault")
+    created = VaultInitializer(root).initialize()
+    listing = set()
+    for walk_root, dirs, files in os.walk(root):
+        for name in dirs + files:
+            listing.add(str(Path(walk_root, name).relative_to(root)))
+    return created, listing
+
+
 class TestInitialize:
-    def test_fresh_vault_creates_all_folders(self, empty_dir):
-        created = VaultInitializer(empty_dir).initialize()
+    def test_fresh_vault_creates_all_folders(self, fresh_vault):
+        created, listing = fresh_vault
         for folder in CORE_FOLDERS:
-            assert (empty_dir / folder).is_dir(), f"folder {folder} missing"
+            assert folder in listing, f"folder {folder} missing"
         # every folder should appear in created list
         folder_items = [c for c in created if c.startswith("folder:")]
         assert len(folder_items) == len(CORE_FOLDERS)
 
-    def test_fresh_vault_creates_schemas(self, empty_dir):
-        created = VaultInitializer(empty_dir).initialize()
-        schema_dir = empty_dir / ".vault_schema" / "frontmatter_schemas"
+    def test_fresh_vault_creates_schemas(self, fresh_vault):
+        created, listing = fresh_vault
+        schema_dir = Path(".vault_schema") / "frontmatter_schemas"
         for name in _SCHEMAS:
-            assert (schema_dir / name).is_file(), f"schema {name} missing"
+            assert str(schema_dir / name) in listing, f"schema {name} missing"
         schema_items = [c for c in created if c.startswith("schema:")]
         assert len(schema_items) == len(_SCHEMAS)
 
-    def test_fresh_vault_creates_seed_docs(self, empty_dir):
-        created = VaultInitializer(empty_dir).initialize()
-        assert (empty_dir / "Dashboard.md").is_file()
-        assert (empty_dir / "Company_Handbook.md").is_file()
-        assert (empty_dir / "Templates" / "task_template.md").is_file()
+    def test_fresh_vault_creates_seed_docs(self, fresh_vault):
+        created, listing = fresh_vault
+        assert "Dashboard.md" in listing
+        assert "Company_Handbook.md" in listing
+        assert str(Path("Templates") / "task_template.md") in listing
         file_items = [c for c in created if c.startswith("file:")]
         assert len(file_items) == 3  # Dashboard, Handbook, task_template
 
@@ -88,25 +126,28 @@ class TestInitialize:
         VaultInitializer(empty_dir).initialize()
         assert (empty_dir / "Dashboard.md").read_text() == sentinel
 
-    def test_dashboard_contains_folder_names(self, empty_dir):
-        VaultInitializer(empty_dir).initialize()
-        dash = (empty_dir / "Dashboard.md").read_text()
+    def test_dashboard_contains_folder_names(self, dashboard_text):
         for folder in CORE_FOLDERS:
-            assert folder in dash
-
-    def test_handbook_contains_core_principles(self, empty_dir):
-        VaultInitializer(empty_dir).initialize()
-        hb = (empty_dir / "Company_Handbook.md").read_text()
-        assert "File-Driven" in hb
-        assert "Human-in-the-Loop" in hb
-        assert "Fail-Safe" in hb
-
-    def test_schema_content_is_valid_yaml(self, initialized_vault):
-        import yaml
-
-        schema_dir = initialized_vault / ".vault_schema" / "frontmatter_schemas"
+            assert folder in dashboard_text
+
+    def test_handbook_contains_core_principles(self, handbook_text):
+        assert "File-Driven" in handbook_text
+        assert "Human-in-the-Loop" in handbook_text
+        assert "Fail-Safe" in handbook_text
+
+    def test_schema_files_contain_required_fields(self, _prebuilt_vault):
+        # Substring check only - the schema files and _SCHEMAS come from
+        # the same source, so no YAML parse is needed here; round-trip
+        # validity has its own targeted test below
+        schema_dir = _prebuilt_vault / ".vault_schema" / "frontmatter_schemas"
         for name in _SCHEMAS:
-            data = yaml.safe_load((schema_dir / name).read_text())
+            assert "required_fields" in (schema_dir / name).read_text()
+
+    def test_schema_yaml_roundtrip(self, parsed_schemas):
+        # One parse (session-cached) keeps regression coverage for the
+        # written YAML actually being loadable
+        assert len(parsed_schemas) == len(_SCHEMAS)
+        for data in parsed_schemas.values():
             assert "required_fields" in data
 
     def test_nonexistent_parent_is_created(self, empty_dir):
@@ -122,8 +163,8 @@ class TestInitialize:
 
 
 class TestCheckStructure:
-    def test_fully_initialized_reports_nothing_missing(self, initialized_vault):
-        missing = VaultInitializer(initialized_vault).check_structure()
+    def test_fully_initialized_reports_nothing_missing(self, _prebuilt_vault):
+        missing = VaultInitializer(_prebuilt_vault).check_structure()
         assert missing == {"folders": [], "schemas": [], "files": []}
 
     def test_empty_dir_reports_all_missing(self, empty_dir):
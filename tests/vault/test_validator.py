@@ -10,8 +10,7 @@ Coverage map:
                             total_errors count
 """
 
-import shutil
-import tempfile
+import os
 from pathlib import Path
 
 import pytest
@@ -23,25 +22,97 @@ from vault.validator import (
     VaultValidator,
 )
 
+# Per-test state is all under tmp_path, so this module is safe under
+# pytest -n auto --dist=loadfile
+pytestmark = pytest.mark.parallel
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
 
+# Fixture file contents are written with write_bytes from byte literals
+# prebuilt at import time, skipping the per-test UTF-8 encode inside
+# write_text
+_VALID_APPROVAL_FM = (
+    b"---\n"
+    b"approval_id: APR-test-202602\n"
+    b"nonce: abc-123-def\n"
+    b"approval_status: pending\n"
+    b"created_at: '2026-02-04T10:00:00+00:00'\n"
+    b"expires_at: '2026-02-04T22:00:00+00:00'\n"
+    b"---\n\n"
+    b"# Approval Request\n"
+)
+
+# Shared template for the per-status approval cases; formatted once per
+# parametrized node instead of rebuilt inside a loop body
+_APPROVAL_FM_TEMPLATE = (
+    "---\n"
+    "approval_id: APR-{status}\n"
+    "nonce: n\n"
+    "approval_status: {status}\n"
+    "created_at: '2026-01-01T00:00:00+00:00'\n"
+    "expires_at: '2026-01-02T00:00:00+00:00'\n"
+    "---\n\n# Body\n"
+)
+
+# Built once at import instead of as a literal inside the fixture body
+_VAULT_FOLDERS = (
+    "Inbox",
+    "Needs_Action",
+    "In_Progress",
+    "Done",
+    "Approvals",
+    "Briefings",
+)
+
+
+@pytest.fixture(scope="session")
+def validators():
+    """One instance of each per-type validator, shared across the module.
+
+    The validators are stateless, so re-instantiating them per assertion
+    only re-did the class setup; a single dict serves every test.
+    """
+    return {
+        "task": TaskValidator(),
+        "approval": ApprovalValidator(),
+        "briefing": BriefingValidator(),
+    }
+
+
+@pytest.fixture(scope="session")
+def task_blobs():
+    """Canonical file payloads for the full-vault tests, built once.
+
+    Bytes blobs written with write_bytes skip both the per-test string
+    construction and the UTF-8 encode inside write_text.
+    """
+    return {
+        "good": b"# good\n\n**Priority**: High\n**From**: x@y.com\n\n---\nBody\n",
+        "bad": b"# bad\n\nNo fields.\n",
+        "approval": _VALID_APPROVAL_FM,
+        "briefing": (
+            b"---\n"
+            b"report_type: executive_summary\n"
+            b"total_tasks: 1\n"
+            b"generated_at: '2026-02-01T00:00:00+00:00'\n"
+            b"---\n\n# Brief\n"
+        ),
+    }
+
+
 @pytest.fixture
-def vault_dir():
-    d = Path(tempfile.mkdtemp())
-    for folder in (
-        "Inbox",
-        "Needs_Action",
-        "In_Progress",
-        "Done",
-        "Approvals",
-        "Briefings",
-    ):
-        (d / folder).mkdir()
-    yield d
-    shutil.rmtree(d, ignore_errors=True)
+def vault_dir(tmp_path):
+    # tmp_path comes pre-created with lazy cleanup; no per-test
+    # mkdtemp/rmtree round trip. Raw os.mkdir on joined strings skips the
+    # Path.__truediv__/Path.mkdir layer for each of the 6 folders.
+    mkdir = os.mkdir
+    base = str(tmp_path)
+    for folder in _VAULT_FOLDERS:
+        mkdir(base + "/" + folder)
+    return tmp_path
 
 
 # ===========================================================================
@@ -50,40 +121,40 @@ def vault_dir():
 
 
 class TestTaskValidator:
-    def _file(self, vault: Path, name: str, content: str) -> Path:
+    def _file(self, vault: Path, name: str, content: bytes) -> Path:
         p = vault / "Done" / name
-        p.write_text(content)
+        p.write_bytes(content)
         return p
 
-    def test_valid_task(self, vault_dir):
+    def test_valid_task(self, vault_dir, validators):
         p = self._file(
             vault_dir,
             "good.md",
-            "# good.md\n\n**Priority**: High\n**From**: alice@x.com\n\n---\n\nDone.\n",
+            b"# good.md\n\n**Priority**: High\n**From**: alice@x.com\n\n---\n\nDone.\n",
         )
-        result = TaskValidator().validate(p)
+        result = validators["task"].validate(p)
         assert result.is_valid
         assert result.errors == []
 
-    def test_missing_priority(self, vault_dir):
+    def test_missing_priority(self, vault_dir, validators):
         p = self._file(
-            vault_dir, "no-pri.md", "# t\n\n**From**: a@b.com\n\n---\nBody\n"
+            vault_dir, "no-pri.md", b"# t\n\n**From**: a@b.com\n\n---\nBody\n"
         )
-        result = TaskValidator().validate(p)
+        result = validators["task"].validate(p)
         assert not result.is_valid
         assert any("Priority" in e for e in result.errors)
 
-    def test_missing_from(self, vault_dir):
+    def test_missing_from(self, vault_dir, validators):
         p = self._file(
-            vault_dir, "no-from.md", "# t\n\n**Priority**: Low\n\n---\nBody\n"
+            vault_dir, "no-from.md", b"# t\n\n**Priority**: Low\n\n---\nBody\n"
         )
-        result = TaskValidator().validate(p)
+        result = validators["task"].validate(p)
         assert not result.is_valid
         assert any("From" in e for e in result.errors)
 
-    def test_missing_both(self, vault_dir):
-        p = self._file(vault_dir, "bare.md", "# bare\n\nJust text.\n")
-        result = TaskValidator().validate(p)
+    def test_missing_both(self, vault_dir, validators):
+        p = self._file(vault_dir, "bare.md", b"# bare\n\nJust text.\n")
+        result = validators["task"].validate(p)
         assert len(result.errors) == 2
 
 
@@ -93,86 +164,66 @@ class TestTaskValidator:
 
 
 class TestApprovalValidator:
-    def _file(self, vault: Path, name: str, content: str) -> Path:
+    def _file(self, vault: Path, name: str, content: bytes) -> Path:
         p = vault / "Approvals" / name
-        p.write_text(content)
+        p.write_bytes(content)
         return p
 
-    def _valid_fm(self) -> str:
-        return (
-            "---\n"
-            "approval_id: APR-test-202602\n"
-            "nonce: abc-123-def\n"
-            "approval_status: pending\n"
-            "created_at: '2026-02-04T10:00:00+00:00'\n"
-            "expires_at: '2026-02-04T22:00:00+00:00'\n"
-            "---\n\n"
-            "# Approval Request\n"
-        )
-
-    def test_valid_approval(self, vault_dir):
-        p = self._file(vault_dir, "good-apr.md", self._valid_fm())
-        result = ApprovalValidator().validate(p)
+    def test_valid_approval(self, vault_dir, validators):
+        p = self._file(vault_dir, "good-apr.md", _VALID_APPROVAL_FM)
+        result = validators["approval"].validate(p)
         assert result.is_valid
 
-    def test_missing_frontmatter(self, vault_dir):
-        p = self._file(vault_dir, "no-fm.md", "# Plain markdown\n")
-        result = ApprovalValidator().validate(p)
+    def test_missing_frontmatter(self, vault_dir, validators):
+        p = self._file(vault_dir, "no-fm.md", b"# Plain markdown\n")
+        result = validators["approval"].validate(p)
         assert not result.is_valid
         assert "missing YAML frontmatter" in result.errors[0]
 
-    def test_unclosed_frontmatter(self, vault_dir):
+    def test_unclosed_frontmatter(self, vault_dir, validators):
         p = self._file(
-            vault_dir, "unclosed.md", "---\napproval_id: x\n# Oops no closing\n"
+            vault_dir, "unclosed.md", b"---\napproval_id: x\n# Oops no closing\n"
         )
-        result = ApprovalValidator().validate(p)
+        result = validators["approval"].validate(p)
         assert not result.is_valid
         assert "unclosed" in result.errors[0]
 
-    def test_missing_nonce(self, vault_dir):
+    def test_missing_nonce(self, vault_dir, validators):
         fm = (
-            "---\n"
-            "approval_id: APR-x\n"
-            "approval_status: pending\n"
-            "created_at: '2026-01-01T00:00:00+00:00'\n"
-            "expires_at: '2026-01-02T00:00:00+00:00'\n"
-            "---\n\n# Body\n"
+            b"---\n"
+            b"approval_id: APR-x\n"
+            b"approval_status: pending\n"
+            b"created_at: '2026-01-01T00:00:00+00:00'\n"
+            b"expires_at: '2026-01-02T00:00:00+00:00'\n"
+            b"---\n\n# Body\n"
         )
         p = self._file(vault_dir, "no-nonce.md", fm)
-        result = ApprovalValidator().validate(p)
+        result = validators["approval"].validate(p)
         assert not result.is_valid
         assert any("nonce" in e for e in result.errors)
 
-    def test_invalid_status_value(self, vault_dir):
+    def test_invalid_status_value(self, vault_dir, validators):
         fm = (
-            "---\n"
-            "approval_id: APR-y\n"
-            "nonce: n1\n"
-            "approval_status: maybe\n"
-            "created_at: '2026-01-01T00:00:00+00:00'\n"
-            "expires_at: '2026-01-02T00:00:00+00:00'\n"
-            "---\n\n# Body\n"
+            b"---\n"
+            b"approval_id: APR-y\n"
+            b"nonce: n1\n"
+            b"approval_status: maybe\n"
+            b"created_at: '2026-01-01T00:00:00+00:00'\n"
+            b"expires_at: '2026-01-02T00:00:00+00:00'\n"
+            b"---\n\n# Body\n"
         )
         p = self._file(vault_dir, "bad-status.md", fm)
-        result = ApprovalValidator().validate(p)
+        result = validators["approval"].validate(p)
         assert not result.is_valid
         assert any("invalid approval_status" in e for e in result.errors)
 
-    def test_all_valid_statuses_accepted(self, vault_dir):
-        for status in ("pending", "approved", "rejected", "timeout"):
-            fm = (
-                "---\n"
-                f"approval_id: APR-{status}\n"
-                "nonce: n\n"
-                f"approval_status: {status}\n"
-                "created_at: '2026-01-01T00:00:00+00:00'\n"
-                "expires_at: '2026-01-02T00:00:00+00:00'\n"
-                "---\n\n# Body\n"
-            )
-            p = self._file(vault_dir, f"status-{status}.md", fm)
-            assert (
-                ApprovalValidator().validate(p).is_valid
-            ), f"status={status} should be valid"
+    @pytest.mark.parametrize("status", ["pending", "approved", "rejected", "timeout"])
+    def test_all_valid_statuses_accepted(self, vault_dir, validators, status):
+        fm = _APPROVAL_FM_TEMPLATE.format(status=status).encode()
+        p = self._file(vault_dir, f"status-{status}.md", fm)
+        assert (
+            validators["approval"].validate(p).is_valid
+        ), f"status={status} should be valid"
 
 
 # ===========================================================================
@@ -181,49 +232,49 @@ class TestApprovalValidator:
 
 
 class TestBriefingValidator:
-    def _file(self, vault: Path, name: str, content: str) -> Path:
+    def _file(self, vault: Path, name: str, content: bytes) -> Path:
         p = vault / "Briefings" / name
-        p.write_text(content)
+        p.write_bytes(content)
         return p
 
-    def test_valid_briefing(self, vault_dir):
+    def test_valid_briefing(self, vault_dir, validators):
         content = (
-            "---\n"
-            "report_type: executive_summary\n"
-            "total_tasks: 5\n"
-            "generated_at: '2026-02-04T12:00:00+00:00'\n"
-            "---\n\n"
-            "# Briefing\n"
+            b"---\n"
+            b"report_type: executive_summary\n"
+            b"total_tasks: 5\n"
+            b"generated_at: '2026-02-04T12:00:00+00:00'\n"
+            b"---\n\n"
+            b"# Briefing\n"
         )
         p = self._file(vault_dir, "good-brief.md", content)
-        assert BriefingValidator().validate(p).is_valid
+        assert validators["briefing"].validate(p).is_valid
 
-    def test_missing_frontmatter(self, vault_dir):
-        p = self._file(vault_dir, "no-fm.md", "# Just a heading\n")
-        result = BriefingValidator().validate(p)
+    def test_missing_frontmatter(self, vault_dir, validators):
+        p = self._file(vault_dir, "no-fm.md", b"# Just a heading\n")
+        result = validators["briefing"].validate(p)
         assert not result.is_valid
 
-    def test_missing_generated_at(self, vault_dir):
+    def test_missing_generated_at(self, vault_dir, validators):
         content = (
-            "---\n"
-            "report_type: executive_summary\n"
-            "total_tasks: 3\n"
-            "---\n\n# Brief\n"
+            b"---\n"
+            b"report_type: executive_summary\n"
+            b"total_tasks: 3\n"
+            b"---\n\n# Brief\n"
         )
         p = self._file(vault_dir, "no-gen.md", content)
-        result = BriefingValidator().validate(p)
+        result = validators["briefing"].validate(p)
         assert not result.is_valid
         assert any("generated_at" in e for e in result.errors)
 
-    def test_missing_report_type(self, vault_dir):
+    def test_missing_report_type(self, vault_dir, validators):
         content = (
-            "---\n"
-            "total_tasks: 3\n"
-            "generated_at: '2026-02-04T00:00:00+00:00'\n"
-            "---\n\n# Brief\n"
+            b"---\n"
+            b"total_tasks: 3\n"
+            b"generated_at: '2026-02-04T00:00:00+00:00'\n"
+            b"---\n\n# Brief\n"
         )
         p = self._file(vault_dir, "no-type.md", content)
-        result = BriefingValidator().validate(p)
+        result = validators["briefing"].validate(p)
         assert not result.is_valid
         assert any("report_type" in e for e in result.errors)
 
@@ -239,33 +290,20 @@ class TestVaultValidator:
         assert v.is_valid
         assert v.total_errors == 0
 
-    def test_single_valid_task(self, vault_dir):
-        (vault_dir / "Done" / "task.md").write_text(
-            "# task.md\n\n**Priority**: High\n**From**: x@y.com\n\n---\nBody\n"
-        )
+    def test_single_valid_task(self, vault_dir, task_blobs):
+        (vault_dir / "Done" / "task.md").write_bytes(task_blobs["good"])
         assert VaultValidator(vault_dir).is_valid
 
-    def test_invalid_task_detected(self, vault_dir):
-        (vault_dir / "Needs_Action" / "bad.md").write_text("# bad\n\nNo fields.\n")
+    def test_invalid_task_detected(self, vault_dir, task_blobs):
+        (vault_dir / "Needs_Action" / "bad.md").write_bytes(task_blobs["bad"])
         v = VaultValidator(vault_dir)
         assert not v.is_valid
         assert v.total_errors == 2  # missing Priority + From
 
-    def test_mixed_good_and_bad_across_folders(self, vault_dir):
-        # Good task in Done
-        (vault_dir / "Done" / "good.md").write_text(
-            "# good\n\n**Priority**: Low\n**From**: a@b.com\n\n---\nDone\n"
-        )
-        # Bad task in Inbox
-        (vault_dir / "Inbox" / "bad.md").write_text("# bad\n\nNothing.\n")
-        # Valid approval
-        (vault_dir / "Approvals" / "apr.md").write_text(
-            "---\n"
-            "approval_id: APR-1\nnonce: n\napproval_status: pending\n"
-            "created_at: '2026-01-01T00:00:00+00:00'\n"
-            "expires_at: '2026-01-02T00:00:00+00:00'\n"
-            "---\n\n# Approval\n"
-        )
+    def test_mixed_good_and_bad_across_folders(self, vault_dir, task_blobs):
+        (vault_dir / "Done" / "good.md").write_bytes(task_blobs["good"])
+        (vault_dir / "Inbox" / "bad.md").write_bytes(task_blobs["bad"])
+        (vault_dir / "Approvals" / "apr.md").write_bytes(task_blobs["approval"])
         v = VaultValidator(vault_dir)
         results = v.validate_all()
 
@@ -274,14 +312,9 @@ class TestVaultValidator:
         assert results["Approvals"][0].is_valid
         assert v.total_errors == 2  # only the bad Inbox task
 
-    def test_validate_all_returns_per_folder(self, vault_dir):
-        (vault_dir / "In_Progress" / "wip.md").write_text(
-            "# wip\n\n**Priority**: Medium\n**From**: dev@co.com\n\n---\nWorking\n"
-        )
-        (vault_dir / "Briefings" / "brief.md").write_text(
-            "---\nreport_type: executive_summary\ntotal_tasks: 1\n"
-            "generated_at: '2026-02-01T00:00:00+00:00'\n---\n\n# Brief\n"
-        )
+    def test_validate_all_returns_per_folder(self, vault_dir, task_blobs):
+        (vault_dir / "In_Progress" / "wip.md").write_bytes(task_blobs["good"])
+        (vault_dir / "Briefings" / "brief.md").write_bytes(task_blobs["briefing"])
         results = VaultValidator(vault_dir).validate_all()
         assert "In_Progress" in results
         assert "Briefings" in results
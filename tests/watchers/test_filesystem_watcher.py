@@ -1,7 +1,5 @@
 """Tests for FileSystemWatcher."""
 
-import tempfile
-import time
 from pathlib import Path
 from unittest import mock
 
@@ -17,24 +15,29 @@ try:
 except ImportError:
     HAS_PATHSPEC = False
 
+try:
+    import xxhash  # noqa: F401
+
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
 
 class TestFileSystemWatcher:
     """Test suite for FileSystemWatcher."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.vault_path = Path(self.temp_dir) / "vault"
-        self.watch_path = Path(self.temp_dir) / "watch"
+    @pytest.fixture(autouse=True)
+    def _paths(self, tmp_path):
+        """Per-test vault/watch dirs under tmp_path.
+
+        tmp_path relies on pytest's lazy basetemp cleanup, so there is no
+        per-test mkdtemp/rmtree round trip.
+        """
+        self.vault_path = tmp_path / "vault"
+        self.watch_path = tmp_path / "watch"
         self.vault_path.mkdir()
         self.watch_path.mkdir()
 
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     def test_init(self):
         """Test watcher initialization."""
         watcher = FileSystemWatcher(
@@ -87,7 +90,7 @@ class TestFileSystemWatcher:
         assert watcher._should_ignore(txt_file) is True
 
     def test_compute_hash(self):
-        """Test SHA256 hash computation."""
+        """Test content hash computation."""
         watcher = FileSystemWatcher(
             vault_path=self.vault_path,
             watch_path=self.watch_path,
@@ -99,12 +102,40 @@ class TestFileSystemWatcher:
 
         file_hash = watcher._compute_hash(test_file)
 
-        # SHA256 of "Hello, World!" is known
-        expected_hash = (
-            "dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f"
-        )
+        if HAS_XXHASH:
+            # xxh3-128 of "Hello, World!" is known
+            expected_hash = "531df2844447dd5077db03842cd75395"
+        else:
+            # SHA256 fallback of "Hello, World!" is known
+            expected_hash = (
+                "dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f"
+            )
         assert file_hash == expected_hash
 
+    def test_compute_hash_cached_for_unchanged_file(self):
+        """Test unchanged files are not re-read on a second hash call."""
+        watcher = FileSystemWatcher(
+            vault_path=self.vault_path,
+            watch_path=self.watch_path,
+        )
+
+        test_file = self.watch_path / "test.txt"
+        test_file.write_text("Hello, World!")
+
+        first = watcher._compute_hash(test_file)
+
+        # Second call must be served from the (path, size, mtime) memo;
+        # any attempt to read the content again fails the call
+        with mock.patch.object(
+            Path, "read_bytes", side_effect=AssertionError("file was re-read")
+        ), mock.patch.object(
+            Path, "open", side_effect=AssertionError("file was re-read")
+        ):
+            second = watcher._compute_hash(test_file)
+
+        assert second == first
+        assert second != ""
+
     def test_compute_hash_large_file_skip(self):
         """Test hash computation is skipped for large files."""
         watcher = FileSystemWatcher(
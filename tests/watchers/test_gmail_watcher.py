@@ -1,7 +1,6 @@
 """Tests for GmailWatcher."""
 
 import base64
-import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest import mock
@@ -12,24 +11,27 @@ from watchers.gmail_watcher import GmailWatcher, GmailAuthenticationError
 from watchers.models import EmailMessage
 
 
-class TestGmailWatcher:
-    """Test suite for GmailWatcher."""
+@pytest.fixture(scope="session")
+def credentials_file(tmp_path_factory):
+    """Dummy OAuth credentials file, written once per session.
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.vault_path = Path(self.temp_dir) / "vault"
-        self.credentials_file = Path(self.temp_dir) / "credentials.json"
-        self.vault_path.mkdir()
+    The watcher only stores the path, so the read-only file can be
+    shared across every test instead of being re-written per test.
+    """
+    f = tmp_path_factory.mktemp("gmail-creds") / "credentials.json"
+    f.write_text('{"installed": {"client_id": "test"}}')
+    return f
 
-        # Create dummy credentials file
-        self.credentials_file.write_text('{"installed": {"client_id": "test"}}')
 
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
+class TestGmailWatcher:
+    """Test suite for GmailWatcher."""
 
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    @pytest.fixture(autouse=True)
+    def _paths(self, tmp_path, credentials_file):
+        """Per-test vault under tmp_path; no mkdtemp/rmtree round trip."""
+        self.vault_path = tmp_path / "vault"
+        self.vault_path.mkdir()
+        self.credentials_file = credentials_file
 
     def test_init(self):
         """Test watcher initialization."""
@@ -90,7 +90,7 @@ class TestPIIRedactor:
         result = self.redactor.redact(text)
 
         assert result.text == text
-        assert result.patterns_found == []
+        assert result.patterns_found == ()
         assert result.redaction_count == 0
 
     def test_redact_dict(self):
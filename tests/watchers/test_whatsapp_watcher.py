@@ -3,7 +3,6 @@
 import hashlib
 import hmac
 import json
-import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 from unittest import mock
@@ -24,18 +23,12 @@ except ImportError:
 class TestWhatsAppWatcher:
     """Test suite for WhatsAppWatcher."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.vault_path = Path(self.temp_dir) / "vault"
+    @pytest.fixture(autouse=True)
+    def _paths(self, tmp_path):
+        """Per-test vault under tmp_path; no mkdtemp/rmtree round trip."""
+        self.vault_path = tmp_path / "vault"
         self.vault_path.mkdir()
 
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-
     def test_init(self):
         """Test watcher initialization."""
         watcher = WhatsAppWatcher(